@@ -3,6 +3,8 @@
 Documentation: https://scryfall.com/docs/api/bulk-data
 """
 
+import contextlib
+from collections.abc import AsyncIterator, Mapping
 from typing import TYPE_CHECKING
 
 from aioscryfall.models.bulk_data import ScryBulkData
@@ -13,10 +15,14 @@ from . import responses
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from aiohttp import ClientSession
+    from aiohttp import ClientResponse, ClientSession
 
+    from .sessions import Session
 
-async def all_bulk_data(session: "ClientSession") -> ScryList[ScryBulkData]:
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+
+async def all_bulk_data(session: "Session") -> ScryList[ScryBulkData]:
     """Client implementation for the Scryfall API's /bulk-data endpoint.
 
     Documentation: https://scryfall.com/docs/api/bulk-data/all
@@ -26,7 +32,7 @@ async def all_bulk_data(session: "ClientSession") -> ScryList[ScryBulkData]:
         return await responses.read_response_payload(resp, ScryList[ScryBulkData])
 
 
-async def getby_id(session: "ClientSession", scryfall_id: "UUID") -> ScryBulkData:
+async def getby_id(session: "Session", scryfall_id: "UUID") -> ScryBulkData:
     """Client implementation for the Scryfall API's /bulk-data/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/bulk-data/id
@@ -36,7 +42,7 @@ async def getby_id(session: "ClientSession", scryfall_id: "UUID") -> ScryBulkDat
         return await responses.read_response_payload(resp, ScryBulkData)
 
 
-async def getby_type(session: "ClientSession", type_: str) -> ScryBulkData:
+async def getby_type(session: "Session", type_: str) -> ScryBulkData:
     """Client implementation for the Scryfall API's /bulk-data/:type endpoint.
 
     Documentation: https://scryfall.com/docs/api/bulk-data/type
@@ -44,3 +50,33 @@ async def getby_type(session: "ClientSession", type_: str) -> ScryBulkData:
     url = f"https://api.scryfall.com/bulk-data/{type_}"
     async with session.get(url) as resp:
         return await responses.read_response_payload(resp, ScryBulkData)
+
+
+@contextlib.asynccontextmanager
+async def open_download(
+    session: "ClientSession", download_uri: str, *, headers: Mapping[str, str] | None = None
+) -> AsyncIterator["ClientResponse"]:
+    """Open the response for a bulk data file, whose body can then be streamed.
+
+    Bulk data files are served from https://data.scryfall.io rather than the API, so
+    non-success responses are raised as aiohttp.ClientResponseError instead of APIError.
+    A 304 Not Modified response to a conditional request is returned as is.
+
+    Documentation: https://scryfall.com/docs/api/bulk-data
+    """
+    async with session.get(download_uri, headers=headers) as resp:
+        if resp.status != 304:  # noqa: PLR2004 - Not Modified
+            resp.raise_for_status()
+        yield resp
+
+
+async def download(
+    session: "ClientSession", download_uri: str, *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """Stream the contents of a bulk data file, chunk by chunk.
+
+    Documentation: https://scryfall.com/docs/api/bulk-data
+    """
+    async with open_download(session, download_uri) as resp:
+        async for chunk in resp.content.iter_chunked(chunk_size):
+            yield chunk
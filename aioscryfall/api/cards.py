@@ -4,11 +4,12 @@ Documentation: https://scryfall.com/docs/api/cards
 """
 
 from enum import Enum
-from typing import TYPE_CHECKING, TypeAlias, TypedDict, overload
+from typing import TYPE_CHECKING, Any, TypeAlias, TypedDict, TypeVar, overload
 from uuid import UUID
 
-import msgspec.json
+from msgspec import Struct
 
+from aioscryfall.models import serde
 from aioscryfall.models.cards import ScryCard
 from aioscryfall.models.catalogs import ScryCatalog
 from aioscryfall.models.lists import ScryList
@@ -16,7 +17,9 @@ from aioscryfall.models.lists import ScryList
 from . import responses
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
+    from .sessions import Session
+
+_S = TypeVar("_S", bound=Struct)
 
 
 class UniqueMode(Enum):
@@ -55,8 +58,9 @@ class SortDirection(Enum):
     DESC = "desc"
 
 
+@overload
 async def search(
-    session: "ClientSession",
+    session: "Session",
     query: str,
     *,
     unique: UniqueMode | None = None,
@@ -67,8 +71,43 @@ async def search(
     include_variations: bool | None = None,
     page: int | None = None,
 ) -> ScryList[ScryCard]:
+    ...
+
+
+@overload
+async def search(
+    session: "Session",
+    query: str,
+    *,
+    unique: UniqueMode | None = None,
+    order: SortOrdering | None = None,
+    direction: SortDirection | None = None,
+    include_extras: bool | None = None,
+    include_multilingual: bool | None = None,
+    include_variations: bool | None = None,
+    page: int | None = None,
+    item_type: type[_S],
+) -> ScryList[_S]:
+    ...
+
+
+async def search(  # noqa: PLR0913 - mirrors the /cards/search query parameters
+    session: "Session",
+    query: str,
+    *,
+    unique: UniqueMode | None = None,
+    order: SortOrdering | None = None,
+    direction: SortDirection | None = None,
+    include_extras: bool | None = None,
+    include_multilingual: bool | None = None,
+    include_variations: bool | None = None,
+    page: int | None = None,
+    item_type: type[Struct] = ScryCard,
+) -> ScryList[Any]:
     """Client implementation for the Scryfall API's /cards/search endpoint.
 
+    Cards are decoded as item_type, which may be a projection of ScryCard.
+
     Documentation: https://scryfall.com/docs/api/cards/search
     """
     url = "https://api.scryfall.com/cards/search"
@@ -89,12 +128,14 @@ async def search(
         params["page"] = str(page)
 
     async with session.get(url, params=params) as resp:
-        return await responses.read_response_payload(resp, ScryList[ScryCard])
+        return await responses.read_response_payload(
+            resp, ScryList[item_type]  # type: ignore[valid-type]
+        )
 
 
 @overload
 async def named(
-    session: "ClientSession",
+    session: "Session",
     *,
     exact: str,
     set_code: str | None = None,
@@ -104,7 +145,7 @@ async def named(
 
 @overload
 async def named(
-    session: "ClientSession",
+    session: "Session",
     *,
     fuzzy: str,
     set_code: str | None = None,
@@ -113,7 +154,7 @@ async def named(
 
 
 async def named(
-    session: "ClientSession",
+    session: "Session",
     *,
     exact: str | None = None,
     fuzzy: str | None = None,
@@ -141,7 +182,7 @@ async def named(
 
 
 async def autocomplete(
-    session: "ClientSession", query: str, *, include_extras: bool | None = None
+    session: "Session", query: str, *, include_extras: bool | None = None
 ) -> ScryCatalog:
     """Client implementation for the Scryfall API's /cards/autocomplete endpoint.
 
@@ -156,7 +197,7 @@ async def autocomplete(
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def random(session: "ClientSession", *, query: str | None = None) -> ScryCard:
+async def random(session: "Session", *, query: str | None = None) -> ScryCard:
     """Client implementation for the Scryfall API's /cards/random endpoint.
 
     Documentation: https://scryfall.com/docs/api/cards/random
@@ -231,24 +272,45 @@ CardIdentifier: TypeAlias = (
     | CollectorNumberSetCardIdentifier
 )
 
+# The /cards/collection endpoint accepts at most 75 identifiers per request
+MAX_COLLECTION_IDENTIFIERS = 75
 
+
+@overload
 async def collection(
-    session: "ClientSession", identifiers: list[CardIdentifier]
+    session: "Session", identifiers: list[CardIdentifier]
 ) -> ScryList[ScryCard]:
+    ...
+
+
+@overload
+async def collection(
+    session: "Session", identifiers: list[CardIdentifier], *, item_type: type[_S]
+) -> ScryList[_S]:
+    ...
+
+
+async def collection(
+    session: "Session", identifiers: list[CardIdentifier], *, item_type: type[Struct] = ScryCard
+) -> ScryList[Any]:
     """Client implementation for the Scryfall API's /cards/collection endpoint.
 
+    Cards are decoded as item_type, which may be a projection of ScryCard.
+
     Documentation: https://scryfall.com/docs/api/cards/collection
     """
     url = "https://api.scryfall.com/cards/collection"
     headers = {"Content-Type": "application/json"}
     body = {"identifiers": identifiers}
-    data = msgspec.json.encode(body)
+    data = serde.encode_json(body)
     async with session.post(url, headers=headers, data=data) as resp:
-        return await responses.read_response_payload(resp, ScryList[ScryCard])
+        return await responses.read_response_payload(
+            resp, ScryList[item_type]  # type: ignore[valid-type]
+        )
 
 
 async def getby_set_code_and_collector_number(
-    session: "ClientSession",
+    session: "Session",
     set_code: str,
     collector_number: str,
     *,
@@ -265,7 +327,7 @@ async def getby_set_code_and_collector_number(
         return await responses.read_response_payload(resp, ScryCard)
 
 
-async def getby_multiverse_id(session: "ClientSession", multiverse_id: int) -> ScryCard:
+async def getby_multiverse_id(session: "Session", multiverse_id: int) -> ScryCard:
     """Client implementation for the Scryfall API's /cards/multiverse/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/cards/multiverse
@@ -275,7 +337,7 @@ async def getby_multiverse_id(session: "ClientSession", multiverse_id: int) -> S
         return await responses.read_response_payload(resp, ScryCard)
 
 
-async def getby_mtgo_id(session: "ClientSession", mtgo_id: int) -> ScryCard:
+async def getby_mtgo_id(session: "Session", mtgo_id: int) -> ScryCard:
     """Client implementation for the Scryfall API's /cards/mtgo/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/cards/mtgo
@@ -285,7 +347,7 @@ async def getby_mtgo_id(session: "ClientSession", mtgo_id: int) -> ScryCard:
         return await responses.read_response_payload(resp, ScryCard)
 
 
-async def getby_arena_id(session: "ClientSession", arena_id: int) -> ScryCard:
+async def getby_arena_id(session: "Session", arena_id: int) -> ScryCard:
     """Client implementation for the Scryfall API's /cards/arena/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/cards/arena
@@ -295,7 +357,7 @@ async def getby_arena_id(session: "ClientSession", arena_id: int) -> ScryCard:
         return await responses.read_response_payload(resp, ScryCard)
 
 
-async def getby_tcgplayer_id(session: "ClientSession", tcgplayer_id: int) -> ScryCard:
+async def getby_tcgplayer_id(session: "Session", tcgplayer_id: int) -> ScryCard:
     """Client implementation for the Scryfall API's /cards/tcgplayer/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/cards/tcgplayer
@@ -305,7 +367,7 @@ async def getby_tcgplayer_id(session: "ClientSession", tcgplayer_id: int) -> Scr
         return await responses.read_response_payload(resp, ScryCard)
 
 
-async def getby_cardmarket_id(session: "ClientSession", cardmarket_id: int) -> ScryCard:
+async def getby_cardmarket_id(session: "Session", cardmarket_id: int) -> ScryCard:
     """Client implementation for the Scryfall API's /cards/cardmarket/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/cards/cardmarket
@@ -315,7 +377,7 @@ async def getby_cardmarket_id(session: "ClientSession", cardmarket_id: int) -> S
         return await responses.read_response_payload(resp, ScryCard)
 
 
-async def getby_id(session: "ClientSession", scryfall_id: UUID) -> ScryCard:
+async def getby_id(session: "Session", scryfall_id: UUID) -> ScryCard:
     """Client implementation for the Scryfall API's /cards/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/cards/get
@@ -10,10 +10,10 @@ from aioscryfall.models.catalogs import ScryCatalog
 from . import responses
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
+    from .sessions import Session
 
 
-async def card_names(session: "ClientSession") -> ScryCatalog:
+async def card_names(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/card-names endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/card-names
@@ -23,7 +23,7 @@ async def card_names(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def artist_names(session: "ClientSession") -> ScryCatalog:
+async def artist_names(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/artist-names endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/artist-names
@@ -33,7 +33,7 @@ async def artist_names(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def word_bank(session: "ClientSession") -> ScryCatalog:
+async def word_bank(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/word-bank endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/word-bank
@@ -43,7 +43,7 @@ async def word_bank(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def creature_types(session: "ClientSession") -> ScryCatalog:
+async def creature_types(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/creature-types endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/creature-types
@@ -53,7 +53,7 @@ async def creature_types(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def planeswalker_types(session: "ClientSession") -> ScryCatalog:
+async def planeswalker_types(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/planeswalker-types endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/planeswalker-types
@@ -63,7 +63,7 @@ async def planeswalker_types(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def land_types(session: "ClientSession") -> ScryCatalog:
+async def land_types(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/land-types endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/land-types
@@ -73,7 +73,7 @@ async def land_types(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def artifact_types(session: "ClientSession") -> ScryCatalog:
+async def artifact_types(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/artifact-types endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/artifact-types
@@ -83,7 +83,7 @@ async def artifact_types(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def enchantment_types(session: "ClientSession") -> ScryCatalog:
+async def enchantment_types(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/enchantment-types endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/enchantment-types
@@ -93,7 +93,7 @@ async def enchantment_types(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def spell_types(session: "ClientSession") -> ScryCatalog:
+async def spell_types(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/spell-types endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/spell-types
@@ -103,7 +103,7 @@ async def spell_types(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def powers(session: "ClientSession") -> ScryCatalog:
+async def powers(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/powers endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/powers
@@ -113,7 +113,7 @@ async def powers(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def toughnesses(session: "ClientSession") -> ScryCatalog:
+async def toughnesses(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/toughnesses endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/toughnesses
@@ -123,7 +123,7 @@ async def toughnesses(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def loyalties(session: "ClientSession") -> ScryCatalog:
+async def loyalties(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/loyalties endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/loyalties
@@ -133,7 +133,7 @@ async def loyalties(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def watermarks(session: "ClientSession") -> ScryCatalog:
+async def watermarks(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/watermarks endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/watermarks
@@ -143,7 +143,7 @@ async def watermarks(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def keyword_abilities(session: "ClientSession") -> ScryCatalog:
+async def keyword_abilities(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/keyword-abilities endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/keyword-abilities
@@ -153,7 +153,7 @@ async def keyword_abilities(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def keyword_actions(session: "ClientSession") -> ScryCatalog:
+async def keyword_actions(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/keyword-actions endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/keyword-actions
@@ -163,7 +163,7 @@ async def keyword_actions(session: "ClientSession") -> ScryCatalog:
         return await responses.read_response_payload(resp, ScryCatalog)
 
 
-async def ability_words(session: "ClientSession") -> ScryCatalog:
+async def ability_words(session: "Session") -> ScryCatalog:
     """Client implementation for the Scryfall API's /catalog/ability-words endpoint.
 
     Documentation: https://scryfall.com/docs/api/catalogs/ability-words
@@ -13,10 +13,10 @@ from . import responses
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from aiohttp import ClientSession
+    from .sessions import Session
 
 
-async def all_migrations(session: "ClientSession") -> ScryList[ScryMigration]:
+async def all_migrations(session: "Session") -> ScryList[ScryMigration]:
     """Client implementation for the Scryfall API's /migrations endpoint.
 
     Documentation: https://scryfall.com/docs/api/migrations/all
@@ -26,7 +26,7 @@ async def all_migrations(session: "ClientSession") -> ScryList[ScryMigration]:
         return await responses.read_response_payload(resp, ScryList[ScryMigration])
 
 
-async def getby_id(session: "ClientSession", scryfall_id: "UUID") -> ScryMigration:
+async def getby_id(session: "Session", scryfall_id: "UUID") -> ScryMigration:
     """Client implementation for the Scryfall API's /migrations/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/migrations/id
@@ -9,13 +9,13 @@ from aioscryfall.models import serde
 from aioscryfall.models.errors import ScryError
 
 if TYPE_CHECKING:
-    from aiohttp import ClientResponse
+    from .sessions import Response
 
 
 _T = TypeVar("_T")
 
 
-async def read_response_payload(response: "ClientResponse", type_: type[_T]) -> _T:
+async def read_response_payload(response: "Response", type_: type[_T]) -> _T:
     """Parse a successful response from the Scryfall API or raise an appropriate exceptoin."""
     data = await response.read()
     if response.status >= 400:  # noqa: PLR2004 - 400 is hardly a magic number
@@ -13,10 +13,10 @@ from . import responses
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from aiohttp import ClientSession
+    from .sessions import Session
 
 
-async def getby_card_id(session: "ClientSession", scryfall_id: "UUID") -> ScryList[ScryRuling]:
+async def getby_card_id(session: "Session", scryfall_id: "UUID") -> ScryList[ScryRuling]:
     """Client implementation for the Scryfall API's /cards/:id/rulings endpoint.
 
     Documentation: https://scryfall.com/docs/api/rulings/card
@@ -26,9 +26,7 @@ async def getby_card_id(session: "ClientSession", scryfall_id: "UUID") -> ScryLi
         return await responses.read_response_payload(resp, ScryList[ScryRuling])
 
 
-async def getby_multiverse_id(
-    session: "ClientSession", multiverse_id: int
-) -> ScryList[ScryRuling]:
+async def getby_multiverse_id(session: "Session", multiverse_id: int) -> ScryList[ScryRuling]:
     """Client implementation for the Scryfall API's /cards/multiverse/:id/rulings endpoint.
 
     Documentation: https://scryfall.com/docs/api/rulings/multiverse
@@ -38,7 +36,7 @@ async def getby_multiverse_id(
         return await responses.read_response_payload(resp, ScryList[ScryRuling])
 
 
-async def getby_mtgo_id(session: "ClientSession", mtgo_id: int) -> ScryList[ScryRuling]:
+async def getby_mtgo_id(session: "Session", mtgo_id: int) -> ScryList[ScryRuling]:
     """Client implementation for the Scryfall API's /cards/mtgo/:id/rulings endpoint.
 
     Documentation: https://scryfall.com/docs/api/rulings/mtgo
@@ -48,7 +46,7 @@ async def getby_mtgo_id(session: "ClientSession", mtgo_id: int) -> ScryList[Scry
         return await responses.read_response_payload(resp, ScryList[ScryRuling])
 
 
-async def getby_arena_id(session: "ClientSession", arena_id: int) -> ScryList[ScryRuling]:
+async def getby_arena_id(session: "Session", arena_id: int) -> ScryList[ScryRuling]:
     """Client implementation for the Scryfall API's /cards/arena/:id/rulings endpoint.
 
     Documentation: https://scryfall.com/docs/api/rulings/arena
@@ -59,7 +57,7 @@ async def getby_arena_id(session: "ClientSession", arena_id: int) -> ScryList[Sc
 
 
 async def getby_set_code_and_collector_number(
-    session: "ClientSession", set_code: str, collector_number: str
+    session: "Session", set_code: str, collector_number: str
 ) -> ScryList[ScryRuling]:
     """Client implementation for the Scryfall API's /cards/:set/:number/rulings endpoint.
 
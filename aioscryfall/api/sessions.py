@@ -0,0 +1,37 @@
+"""Protocols for the HTTP sessions used by the Scryfall API client implementations.
+
+An aiohttp ClientSession satisfies these protocols, as does aioscryfall.transport.Transport.
+"""
+
+from collections.abc import Mapping
+from contextlib import AbstractAsyncContextManager
+from typing import Protocol
+
+
+class Response(Protocol):
+    """The parts of an HTTP response used to read Scryfall API payloads."""
+
+    @property
+    def status(self) -> int:
+        """HTTP status code of the response."""
+        ...
+
+    async def read(self) -> bytes:
+        """Read the full response body."""
+        ...
+
+
+class Session(Protocol):
+    """The parts of an HTTP session used to make Scryfall API requests."""
+
+    def get(
+        self, url: str, *, params: Mapping[str, str] | None = ...
+    ) -> AbstractAsyncContextManager[Response]:
+        """Make a GET request."""
+        ...
+
+    def post(
+        self, url: str, *, headers: Mapping[str, str] | None = ..., data: bytes | None = ...
+    ) -> AbstractAsyncContextManager[Response]:
+        """Make a POST request."""
+        ...
@@ -13,10 +13,10 @@ from . import responses
 if TYPE_CHECKING:
     from uuid import UUID
 
-    from aiohttp import ClientSession
+    from .sessions import Session
 
 
-async def all_sets(session: "ClientSession") -> ScryList[ScrySet]:
+async def all_sets(session: "Session") -> ScryList[ScrySet]:
     """Client implementation for the Scryfall API's /sets endpoint.
 
     Documentation: https://scryfall.com/docs/api/sets/all
@@ -26,7 +26,7 @@ async def all_sets(session: "ClientSession") -> ScryList[ScrySet]:
         return await responses.read_response_payload(resp, ScryList[ScrySet])
 
 
-async def getby_code(session: "ClientSession", set_code: str) -> ScrySet:
+async def getby_code(session: "Session", set_code: str) -> ScrySet:
     """Client implementation for the Scryfall API's /sets/:code endpoint.
 
     Documentation: https://scryfall.com/docs/api/sets/code
@@ -36,7 +36,7 @@ async def getby_code(session: "ClientSession", set_code: str) -> ScrySet:
         return await responses.read_response_payload(resp, ScrySet)
 
 
-async def getby_tcgplayer_id(session: "ClientSession", tcgplayer_id: int) -> ScrySet:
+async def getby_tcgplayer_id(session: "Session", tcgplayer_id: int) -> ScrySet:
     """Client implementation for the Scryfall API's /sets/tcgplayer/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/sets/tcgplayer
@@ -46,7 +46,7 @@ async def getby_tcgplayer_id(session: "ClientSession", tcgplayer_id: int) -> Scr
         return await responses.read_response_payload(resp, ScrySet)
 
 
-async def getby_id(session: "ClientSession", scryfall_id: "UUID") -> ScrySet:
+async def getby_id(session: "Session", scryfall_id: "UUID") -> ScrySet:
     """Client implementation for the Scryfall API's /sets/:id endpoint.
 
     Documentation: https://scryfall.com/docs/api/sets/id
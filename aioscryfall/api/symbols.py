@@ -11,10 +11,10 @@ from aioscryfall.models.symbols import ScryCardSymbol, ScryManaCost
 from . import responses
 
 if TYPE_CHECKING:
-    from aiohttp import ClientSession
+    from .sessions import Session
 
 
-async def all_card_symbols(session: "ClientSession") -> ScryList[ScryCardSymbol]:
+async def all_card_symbols(session: "Session") -> ScryList[ScryCardSymbol]:
     """Client implementation for the Scryfall API's /symbology endpoint.
 
     Documentation: https://scryfall.com/docs/api/card-symbols/all
@@ -24,7 +24,7 @@ async def all_card_symbols(session: "ClientSession") -> ScryList[ScryCardSymbol]
         return await responses.read_response_payload(resp, ScryList[ScryCardSymbol])
 
 
-async def parse_mana(session: "ClientSession", mana_cost: str) -> ScryManaCost:
+async def parse_mana(session: "Session", mana_cost: str) -> ScryManaCost:
     """Client implementation for the Scryfall API's /symbology/parse-mana endpoint.
 
     Documentation: https://scryfall.com/docs/api/card-symbols/parse-mana
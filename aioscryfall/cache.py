@@ -0,0 +1,334 @@
+"""Caches of Scryfall API responses, in memory and persistent on disk."""
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, AsyncIterator, Mapping
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import appdirs
+import msgspec
+
+from aioscryfall.api import bulk_data
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse, ClientSession
+
+    from aioscryfall.transport import BufferedResponse
+
+# Endpoints whose responses differ on every request, so are not cached unless configured
+UNCACHED_TTLS: Mapping[str, float] = {"/cards/random": 0.0}
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)\"?", re.IGNORECASE)
+
+
+def request_key(url: str, params: Mapping[str, str] | None = None) -> str:
+    """Create the cache key for a GET request."""
+    query = "&".join(f"{name}={value}" for name, value in sorted((params or {}).items()))
+    return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+
+class CacheEntry(msgspec.Struct, kw_only=True):
+    """A cached response body along with the information needed to revalidate it."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    etag: str | None = None
+    expires_at: float = 0.0
+
+    def is_fresh(self) -> bool:
+        """Check whether the entry can be used without revalidating it."""
+        return time.time() < self.expires_at
+
+
+def _cache_directives(headers: Mapping[str, str]) -> set[str]:
+    """Get the names of the Cache-Control directives in a set of headers."""
+    cache_control = headers.get("cache-control", "")
+    return {
+        directive.split("=", 1)[0].strip().lower()
+        for directive in cache_control.split(",")
+        if directive.strip()
+    }
+
+
+def _expires_at(headers: Mapping[str, str], default_ttl: float) -> float:
+    """Calculate when a response expires, based on its Cache-Control header."""
+    if "no-cache" in _cache_directives(headers):
+        return 0.0
+    match = _MAX_AGE_RE.search(headers.get("cache-control", ""))
+    ttl = int(match.group(1)) if match else default_ttl
+    return time.time() + ttl
+
+
+class ResponseCache:
+    """ResponseCache stores successful GET responses on disk across process restarts.
+
+    Responses are served straight from the cache while fresh, per their Cache-Control
+    max-age (or default_ttl if they have none). Stale responses with an ETag are revalidated
+    with If-None-Match, so an unchanged resource costs a 304 instead of a full download.
+
+    Header names are expected to be lower case.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str] | None = None, *, default_ttl: float = 0.0
+    ) -> None:
+        if directory is None:
+            directory = os.path.join(appdirs.user_cache_dir("aioscryfall"), "responses")
+        self.directory = os.fspath(directory)
+        self.default_ttl = default_ttl
+        self._encoder = msgspec.msgpack.Encoder()
+        self._decoder = msgspec.msgpack.Decoder(CacheEntry)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _read(self, key: str) -> CacheEntry | None:
+        try:
+            with open(self._path(key), "rb") as file:
+                return self._decoder.decode(file.read())
+        except (OSError, msgspec.DecodeError):
+            return None
+
+    def _write(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file and rename it, so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._encoder.encode(entry))
+            os.replace(temp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get a cached entry, fresh or not, if there is one."""
+        return await asyncio.to_thread(self._read, key)
+
+    async def store(
+        self, key: str, status: int, headers: Mapping[str, str], body: bytes
+    ) -> CacheEntry | None:
+        """Cache a response, if its headers allow it and it can be reused or revalidated."""
+        if "no-store" in _cache_directives(headers):
+            return None
+        entry = CacheEntry(
+            status=status,
+            headers=dict(headers),
+            body=body,
+            etag=headers.get("etag"),
+            expires_at=_expires_at(headers, self.default_ttl),
+        )
+        if entry.etag is None and not entry.is_fresh():
+            return None
+        await asyncio.to_thread(self._write, key, entry)
+        return entry
+
+    async def refresh(self, key: str, entry: CacheEntry, headers: Mapping[str, str]) -> CacheEntry:
+        """Update the expiry of an entry after a 304 Not Modified revalidation response."""
+        entry = msgspec.structs.replace(
+            entry,
+            etag=headers.get("etag", entry.etag),
+            expires_at=_expires_at(headers, self.default_ttl),
+        )
+        await asyncio.to_thread(self._write, key, entry)
+        return entry
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class BulkDataFile(msgspec.Struct, kw_only=True):
+    """The information needed to revalidate a cached bulk data file."""
+
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class BulkDataCache:
+    """BulkDataCache stores downloaded bulk data files on disk across process restarts.
+
+    One file is kept per kind of bulk data (e.g. oracle-cards), replaced when a newer file is
+    downloaded. A cached file is revalidated with If-None-Match and If-Modified-Since before
+    it is reused, so an unchanged file costs a 304 instead of a full download. Downloads are
+    streamed into the cache as they are consumed, and only kept once complete.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        chunk_size: int = bulk_data.DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if directory is None:
+            directory = os.path.join(appdirs.user_cache_dir("aioscryfall"), "bulk_data")
+        self.directory = os.fspath(directory)
+        self.chunk_size = chunk_size
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder(BulkDataFile)
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        """Get the paths of the entry and data files for a bulk data file URL."""
+        # URLs of one kind of bulk data differ only in their file name, which is timestamped
+        key = request_key(url.rsplit("/", 1)[0])
+        return (
+            os.path.join(self.directory, f"{key}.json"),
+            os.path.join(self.directory, f"{key}.data"),
+        )
+
+    def _read_entry(self, url: str) -> BulkDataFile | None:
+        """Read the entry for a URL, if its file is cached."""
+        entry_path, data_path = self._paths(url)
+        try:
+            with open(entry_path, "rb") as file:
+                entry = self._decoder.decode(file.read())
+        except (OSError, msgspec.DecodeError):
+            return None
+        if entry.url != url or not os.path.exists(data_path):
+            return None
+        return entry
+
+    def _write_entry(self, entry: BulkDataFile) -> None:
+        entry_path, _ = self._paths(entry.url)
+        # Write to a temporary file and rename it, so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(self._encoder.encode(entry))
+            os.replace(temp_path, entry_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+
+    async def download(self, session: "ClientSession", download_uri: str) -> AsyncIterator[bytes]:
+        """Stream the contents of a bulk data file, from the cache if it is unchanged."""
+        entry = await asyncio.to_thread(self._read_entry, download_uri)
+        headers = {}
+        if entry is not None and entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+        async with bulk_data.open_download(session, download_uri, headers=headers) as resp:
+            if resp.status != 304:  # noqa: PLR2004 - Not Modified
+                async with contextlib.aclosing(self._store(download_uri, resp)) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+                return
+        _, data_path = self._paths(download_uri)
+        with open(data_path, "rb") as file:
+            while chunk := await asyncio.to_thread(file.read, self.chunk_size):
+                yield chunk
+
+    async def _store(self, url: str, response: "ClientResponse") -> AsyncGenerator[bytes, None]:
+        """Stream a response body, writing it to the cache."""
+        entry_path, data_path = self._paths(url)
+        await asyncio.to_thread(os.makedirs, self.directory, exist_ok=True)
+        # Write to a temporary file and rename it, so only complete files are cached
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    await asyncio.to_thread(file.write, chunk)
+                    yield chunk
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(entry_path)
+            os.replace(temp_path, data_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_path)
+            raise
+        entry = BulkDataFile(
+            url=url,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+        await asyncio.to_thread(self._write_entry, entry)
+
+    def clear(self) -> None:
+        """Remove all cached bulk data files."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class MemoryCache:
+    """MemoryCache holds recent successful GET responses in memory.
+
+    The cache holds at most maxsize responses, evicting the least recently used first.
+    Responses expire after a time to live chosen by the longest matching API path prefix in
+    ttls (e.g. "/sets" or "/cards/named"), falling back to default_ttl. A time to live of
+    zero disables caching for matching endpoints; /cards/random (see UNCACHED_TTLS) is not
+    cached unless ttls says otherwise.
+
+    A MemoryCache may be shared by clients running in different threads.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        default_ttl: float = 60.0,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.default_ttl = default_ttl
+        # Longest prefixes first, so the most specific match wins
+        ttls = {**UNCACHED_TTLS, **(ttls or {})}
+        self.ttls = dict(sorted(ttls.items(), key=lambda item: -len(item[0])))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, BufferedResponse]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of cached responses."""
+        return len(self._entries)
+
+    def ttl(self, url: str) -> float:
+        """Get the time to live for responses from a URL."""
+        path = urlsplit(url).path
+        for prefix, ttl in self.ttls.items():
+            if path.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: str) -> "BufferedResponse | None":
+        """Get a cached response, if there is an unexpired one."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or item[0] <= time.monotonic():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def put(self, key: str, url: str, response: "BufferedResponse") -> None:
+        """Cache a response from a URL."""
+        ttl = self.ttl(url)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses and reset the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
@@ -1,30 +1,86 @@
 """Asynchronous Scryfall client."""
 
 import asyncio
-from collections.abc import AsyncIterable
-from typing import TYPE_CHECKING, TypeVar
+from collections.abc import AsyncIterable, AsyncIterator
+from types import TracebackType
+from typing import TYPE_CHECKING, Literal, Self, TypeVar
 
-import aiolimiter
+from msgspec import Struct
 
 from aioscryfall.api import responses
-from aioscryfall.models.lists import ScryList, ScryListable
+from aioscryfall.cache import BulkDataCache
+from aioscryfall.limiter import AdaptiveLimiter
+from aioscryfall.models.lists import ScryList
+from aioscryfall.retry import RetryPolicy
+from aioscryfall.transport import Transport, create_session
 
 from .handlers import bulk_data, cards, catalogs, migrations, rulings, sets, symbols
 
 if TYPE_CHECKING:
     from aiohttp import ClientSession
 
+    from aioscryfall.cache import MemoryCache, ResponseCache
+    from aioscryfall.index import CardIndex
 
-_ListableT_co = TypeVar("_ListableT_co", bound=ScryListable, covariant=True)
 
+# Items of paged lists, which may also be projections of the listable types
+_ListableT = TypeVar("_ListableT", bound=Struct)
+_ListableT_co = TypeVar("_ListableT_co", bound=Struct, covariant=True)
 
-class ScryfallClient:
-    """ScryfallClient is an asynchronous client for the Scryfall API."""
 
-    def __init__(self, session: "ClientSession") -> None:
-        self.session = session
+class ScryfallClient:
+    """ScryfallClient is an asynchronous client for the Scryfall API.
+
+    If no session is given, the client creates one with transport.create_session when it is
+    first needed, and closes it in close() or on leaving the client's async context:
+
+        async with ScryfallClient() as client:
+            ...
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only client options
+        self,
+        session: "ClientSession | None" = None,
+        *,
+        card_index: "CardIndex | None" = None,
+        card_batch_window: float | None = None,
+        page_prefetch: int = 1,
+        response_cache: "ResponseCache | None" = None,
+        memory_cache: "MemoryCache | None" = None,
+        bulk_data_cache: BulkDataCache | Literal[False] | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> None:
+        if page_prefetch < 0:
+            msg = "page_prefetch must not be negative."
+            raise ValueError(msg)
+        self._session = session
+        self._owns_session = session is None
+        # Cards found in the local index are returned without making an API request
+        self.card_index = card_index
+        # If set, concurrent get_card calls made within this many seconds of each other are
+        # batched into a single /cards/collection request
+        self.card_batch_window = card_batch_window
+        # Number of pages depage_list fetches ahead of the page being consumed
+        self.page_prefetch = page_prefetch
         # We limit ourselves to 10 req/s per https://scryfall.com/docs/api#rate-limits-and-good-citizenship
-        self.limiter = aiolimiter.AsyncLimiter(10, 1)  # 10 requests per second
+        # and slow down further if the API throttles us anyway. Pass a FileLockLimiter to
+        # share the limit with other processes.
+        self.limiter = limiter or AdaptiveLimiter(10, 1)  # 10 requests per second
+        # Fresh cached responses are served without using the network or the rate limiter;
+        # memory_cache is checked first, then the on-disk response_cache
+        self.response_cache = response_cache
+        self.memory_cache = memory_cache
+        # Bulk data files are kept on disk and revalidated instead of downloaded again, in the
+        # user cache directory unless another cache is given; pass False to disable this
+        self.bulk_data_cache = (
+            None if bulk_data_cache is False else bulk_data_cache or BulkDataCache()
+        )
+        # Transient failures (connection errors, 5xx and 429 responses) are retried, including
+        # while fetching further pages of a list
+        self.retry_policy = retry_policy or RetryPolicy()
+        # API requests go through the transport, which applies the rate limit and cache
+        self.transport = Transport(self)
 
         # Mount handlers
         self.bulk_data = bulk_data.BulkDataHandler(self)
@@ -35,26 +91,107 @@ class ScryfallClient:
         self.sets = sets.SetsHandler(self)
         self.symbols = symbols.SymbolsHandler(self)
 
+    @property
+    def session(self) -> "ClientSession":
+        """The aiohttp session used to make requests."""
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = create_session()
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session, if the client created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:
+        """Enter a context that closes the client on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client on context exit."""
+        await self.close()
+
+    async def get_page(self, url: str, item_type: type[_ListableT]) -> ScryList[_ListableT]:
+        """Get a single page of a paged list by its URL."""
+        async with self.transport.get(url) as resp:
+            return await responses.read_response_payload(
+                resp, ScryList[item_type]  # type: ignore[valid-type]
+            )
+
     async def _get_next_page(
-        self, scry_list: ScryList[_ListableT_co]
+        self, scry_list: ScryList[_ListableT_co], item_type: type[_ListableT_co] | None = None
     ) -> ScryList[_ListableT_co] | None:
         """Get the next page for a ScryList."""
         if scry_list.next_page is None:
             return None
-
-        async with self.limiter:
-            async with self.session.get(scry_list.next_page) as resp:
-                return await responses.read_response_payload(resp, ScryList[_ListableT_co])
+        if item_type is None and scry_list.data:
+            # Lists are homogeneous, so the next page holds items of the same type
+            item_type = type(scry_list.data[0])
+        if item_type is not None:
+            return await self.get_page(scry_list.next_page, item_type)
+
+        async with self.transport.get(scry_list.next_page) as resp:
+            return await responses.read_response_payload(resp, ScryList[_ListableT_co])
+
+    async def _prefetch_pages(
+        self,
+        paged_list: ScryList[_ListableT_co],
+        pages: "asyncio.Queue[ScryList[_ListableT_co] | Exception | None]",
+        slots: asyncio.Semaphore,
+        item_type: type[_ListableT_co] | None,
+    ) -> None:
+        """Fetch the pages following a paged list into a queue, one page per free slot.
+
+        The queue is terminated with None at the end of the list, or with the exception
+        raised if a page could not be fetched.
+        """
+        current_page: ScryList[_ListableT_co] | None = paged_list
+        try:
+            while current_page is not None:
+                await slots.acquire()
+                current_page = await self._get_next_page(current_page, item_type)
+                pages.put_nowait(current_page)
+        except Exception as exc:  # noqa: BLE001 - re-raised by the consumer
+            pages.put_nowait(exc)
+
+    async def iter_pages(
+        self, paged_list: ScryList[_ListableT_co], item_type: type[_ListableT_co] | None = None
+    ) -> AsyncIterator[ScryList[_ListableT_co]]:
+        """Iterate over the pages of a paged list, starting with paged_list itself.
+
+        Up to page_prefetch pages are fetched ahead of the page being iterated over. Pages
+        still being fetched are cancelled if iteration stops early. Items of the following
+        pages are decoded as item_type, which must be given for lists of projections.
+        """
+        pages: asyncio.Queue[ScryList[_ListableT_co] | Exception | None] = asyncio.Queue()
+        slots = asyncio.Semaphore(self.page_prefetch)
+        prefetch_task = asyncio.create_task(
+            self._prefetch_pages(paged_list, pages, slots, item_type)
+        )
+        try:
+            current_page: ScryList[_ListableT_co] | Exception | None = paged_list
+            while current_page is not None:
+                if isinstance(current_page, Exception):
+                    raise current_page
+                yield current_page
+                slots.release()
+                current_page = await pages.get()
+        finally:
+            prefetch_task.cancel()
 
     async def depage_list(
         self, paged_list: ScryList[_ListableT_co]
     ) -> AsyncIterable[_ListableT_co]:
-        """Iterate over a paged list, retrieving the next page as needed."""
-        current_page: ScryList[_ListableT_co] | None = paged_list
-        while current_page is not None:
-            next_page_task = asyncio.create_task(self._get_next_page(current_page))
+        """Iterate over a paged list, retrieving the next page as needed.
 
-            for item in current_page.data:
+        Pages are prefetched as in iter_pages.
+        """
+        async for page in self.iter_pages(paged_list):
+            for item in page.data:
                 yield item
-
-            current_page = await next_page_task
@@ -1,49 +1,31 @@
 """Client handler for the Scryfall bulk data APIs."""
 
 import gc
-import gzip
-import os
-from collections.abc import AsyncIterable, Awaitable
-from contextvars import ContextVar
-from typing import overload
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Iterable
+from typing import Any, TypeVar, overload
 from uuid import UUID
 
-import appdirs
-from requests_cache import CachedSession, SerializerPipeline, Stage, pickle_serializer
+from msgspec import Struct
 
 from aioscryfall.api import bulk_data
 from aioscryfall.models import serde
 from aioscryfall.models.bulk_data import ScryBulkData
+from aioscryfall.models.cards import ScryCard
 from aioscryfall.models.lists import ScryListable
+from aioscryfall.models.rulings import ScryRuling
 
 from .base import BaseHandler
 
-_CACHED_REQUESTS_SESSION: ContextVar[CachedSession | None] = ContextVar(
-    "_CACHED_REQUESTS_SESSION", default=None
-)
-
-
-def _get_requests_session() -> CachedSession:
-    cache = _CACHED_REQUESTS_SESSION.get()
-    if cache is None:
-        cache_dir = appdirs.user_cache_dir("aioscryfall")
-        cache_file = os.path.join(cache_dir, "requests_cache.sqlite")
-        serializer = SerializerPipeline(
-            [
-                pickle_serializer,
-                Stage(dumps=gzip.compress, loads=gzip.decompress),
-            ],
-            is_binary=True,
-        )
-        cache = CachedSession(
-            cache_file,
-            backend="sqlite",
-            serializer=serializer,
-            cache_control=True,
-            expire_after=86400,
-        )
-        _CACHED_REQUESTS_SESSION.set(cache)
-    return cache
+_S = TypeVar("_S", bound=Struct)
+
+
+def _decode_items(data: bytes | bytearray, item_type: type[Any]) -> list[Any]:
+    """Decode a JSON array of bulk data items, with garbage collection paused."""
+    try:
+        gc.disable()
+        return serde.decode_json(data, list[item_type])  # type: ignore[valid-type]
+    finally:
+        gc.enable()
 
 
 class BulkDataHandler(BaseHandler):
@@ -51,8 +33,7 @@ class BulkDataHandler(BaseHandler):
 
     async def all_bulk_data(self) -> AsyncIterable[ScryBulkData]:
         """Get all bulk data."""
-        async with self._client.limiter:
-            first_page = await bulk_data.all_bulk_data(self._client.session)
+        first_page = await bulk_data.all_bulk_data(self._client.transport)
         async for bulk_data_item in self._client.depage_list(first_page):
             yield bulk_data_item
 
@@ -78,25 +59,85 @@ class BulkDataHandler(BaseHandler):
         invalid_args_msg = "Exactly one of bulk_data_id, bulk_data_type must be specified."
         if len([x for x in has_identifier if x]) != 1:
             raise ValueError(invalid_args_msg)
+        if bulk_data_id is not None:
+            return await bulk_data.getby_id(self._client.transport, bulk_data_id)
+        if bulk_data_type is not None:
+            return await bulk_data.getby_type(self._client.transport, bulk_data_type)
+        raise ValueError(invalid_args_msg)
+
+    def _download(self, bulk_data_item: ScryBulkData) -> AsyncIterator[bytes]:
+        """Stream a bulk data file, through the client's bulk data cache if it has one."""
+        if self._client.bulk_data_cache is None:
+            return bulk_data.download(self._client.session, bulk_data_item.download_uri)
+        return self._client.bulk_data_cache.download(
+            self._client.session, bulk_data_item.download_uri
+        )
+
+    @overload
+    def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: None = None,
+    ) -> Awaitable[list[ScryListable]]:
+        ...
+
+    @overload
+    def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: type[_S],
+    ) -> Awaitable[list[_S]]:
+        ...
+
+    @overload
+    def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: Iterable[str],
+    ) -> Awaitable[list[Struct]]:
+        ...
+
+    async def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: type[Struct] | Iterable[str] | None = None,
+    ) -> list[Any]:
+        """Fetch the contents of a bulk data item.
+
+        If projection is set, items are decoded as that Struct type, or as a projection with
+        only the named fields (see serde.projection) of ScryRuling for the rulings file and of
+        ScryCard for any other, skipping all other fields.
+        """
+        contents = bytearray()
         async with self._client.limiter:
-            if bulk_data_id is not None:
-                return await bulk_data.getby_id(self._client.session, bulk_data_id)
-            if bulk_data_type is not None:
-                return await bulk_data.getby_type(self._client.session, bulk_data_type)
-            raise ValueError(invalid_args_msg)
+            async for chunk in self._download(bulk_data_item):
+                contents += chunk
+
+        # ScryListable is a union, which mypy will not accept as a type[Any] argument
+        item_type: type[Any] = ScryListable  # type: ignore[assignment]
+        if isinstance(projection, type):
+            item_type = projection
+        elif projection is not None:
+            model_type = ScryRuling if bulk_data_item.type_ == "rulings" else ScryCard
+            item_type = serde.projection(model_type, projection)
+        return _decode_items(contents, item_type)
+
+    async def iter_contents(self, bulk_data_item: ScryBulkData) -> AsyncIterator[ScryListable]:
+        """Iterate over the contents of a bulk data item as they are downloaded.
 
-    async def fetch_contents(self, bulk_data_item: ScryBulkData) -> list[ScryListable]:
-        """Fetch the contents of a bulk data item."""
-        # TODO: This should be async but aiohttp-client-cache doesn't support the use of
-        #       etag + If-None-Match to handle Cache-Control and I do not want to implement
-        #       that myself.
-        session = _get_requests_session()
+        Items are decoded one at a time, so memory use is bounded by the download chunk
+        size rather than the size of the bulk data file.
+        """
+        # ScryListable is a union, which mypy will not accept as a type[_T] argument
+        item_type: type[ScryListable] = ScryListable  # type: ignore[assignment]
+        splitter = serde.JSONArrayLineSplitter()
         async with self._client.limiter:
-            response = session.get(bulk_data_item.download_uri)
-        response.raise_for_status()
-        try:
-            gc.disable()
-            item_list = serde.decode_json(response.content, list[ScryListable])
-        finally:
-            gc.enable()
-        return item_list
+            async for chunk in self._download(bulk_data_item):
+                for element in splitter.feed(chunk):
+                    yield serde.decode_json(element, item_type)
+        for element in splitter.close():
+            yield serde.decode_json(element, item_type)
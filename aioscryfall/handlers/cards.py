@@ -1,22 +1,286 @@
 """Client handler for the Scryfall cards APIs."""
 
-from collections.abc import AsyncIterable, Awaitable
-from typing import TYPE_CHECKING, overload
+import asyncio
+import itertools
+import math
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 from uuid import UUID
 
+from msgspec import Struct
+
 from aioscryfall.api import cards
+from aioscryfall.errors import APIError
+from aioscryfall.models import serde
 from aioscryfall.models.cards import ScryCard
+from aioscryfall.models.errors import ScryError
+from aioscryfall.models.lists import ScryList
+from aioscryfall.pagination import Cursor, PagedIterator
 
 from .base import BaseHandler
 
 if TYPE_CHECKING:
     from aioscryfall.api.cards import CardIdentifier, SortDirection, SortOrdering, UniqueMode
+    from aioscryfall.client import ScryfallClient
+    from aioscryfall.index import CardIndex
+
+_T = TypeVar("_T")
+_S = TypeVar("_S", bound=Struct)
+
+# Most pages a parallel search fetches ahead; requests are limited to 10 per second anyway
+PARALLEL_PAGES = 10
+
+
+def _chunked(items: Iterable[_T], size: int) -> Iterator[list[_T]]:
+    """Split items into lists of at most size items."""
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+async def _iter_parallel_pages(
+    first_page: ScryList[_S],
+    fetch_page: Callable[[int], Coroutine[Any, Any, ScryList[_S]]],
+    page_numbers: Iterable[int],
+    *,
+    preserve_order: bool,
+) -> AsyncIterator[ScryList[_S]]:
+    """Iterate over a first page and the numbered pages following it, fetched concurrently.
+
+    At most PARALLEL_PAGES pages are fetched ahead of the page being iterated over. Pages are
+    yielded in order if preserve_order is set, or else as they arrive.
+    """
+    remaining_pages = iter(page_numbers)
+    # Pages being fetched, or fetched and waiting to be consumed, in page order
+    page_tasks: list[asyncio.Task[ScryList[_S]]] = []
+
+    def fill_window() -> None:
+        """Start fetching pages until PARALLEL_PAGES are in the window."""
+        for page in itertools.islice(remaining_pages, PARALLEL_PAGES - len(page_tasks)):
+            page_tasks.append(asyncio.create_task(fetch_page(page)))
+
+    try:
+        fill_window()
+        yield first_page
+        while page_tasks:
+            if preserve_order:
+                task = page_tasks[0]
+            else:
+                await asyncio.wait(page_tasks, return_when=asyncio.FIRST_COMPLETED)
+                task = next(task for task in page_tasks if task.done())
+            page_tasks.remove(task)
+            next_page = await task
+            fill_window()
+            yield next_page
+    finally:
+        for task in page_tasks:
+            task.cancel()
+
+
+def _names_match(name: str, card: ScryCard) -> bool:
+    """Check whether a name matches a card's name or the name of one of its faces."""
+    name = name.casefold()
+    return name == card.name.casefold() or any(
+        name == face.name.casefold() for face in card.card_faces or ()
+    )
+
+
+def _collection_identifier(
+    *,
+    set_code: str | None,
+    collector_number: str | None,
+    multiverse_id: int | None,
+    mtgo_id: int | None,
+    scryfall_id: UUID | None,
+) -> "CardIdentifier | None":
+    """Convert get_card arguments to a /cards/collection identifier, if it supports them."""
+    if set_code is not None and collector_number is not None:
+        return {"set": set_code, "collector_number": collector_number}
+    if multiverse_id is not None:
+        return {"multiverse_id": multiverse_id}
+    if mtgo_id is not None:
+        return {"mtgo_id": mtgo_id}
+    if scryfall_id is not None:
+        return {"id": scryfall_id}
+    # Arena, TCGplayer and Cardmarket IDs are not supported by /cards/collection
+    return None
+
+
+def _identifier_matches(identifier: "CardIdentifier", card: ScryCard) -> bool:
+    """Check whether a card is the one described by a /cards/collection identifier."""
+    # mypy cannot narrow a union of TypedDicts by key, so treat it as a plain dict
+    fields = cast(dict[str, Any], identifier)
+    if "id" in fields:
+        return str(fields["id"]) == str(card.id_)
+    if "mtgo_id" in fields:
+        return fields["mtgo_id"] in (card.mtgo_id, card.mtgo_foil_id)
+    if "multiverse_id" in fields:
+        return fields["multiverse_id"] in (card.multiverse_ids or ())
+    if "oracle_id" in fields:
+        return str(fields["oracle_id"]) == str(card.oracle_id)
+    if "illustration_id" in fields:
+        return str(fields["illustration_id"]) == str(card.illustration_id)
+    if "collector_number" in fields:
+        return (
+            fields["set"].casefold() == card.set_.casefold()
+            and fields["collector_number"] == card.collector_number
+        )
+    if "set" in fields:
+        return fields["set"].casefold() == card.set_.casefold() and _names_match(
+            fields["name"], card
+        )
+    return _names_match(fields["name"], card)
+
+
+def _index_lookup(card_index: "CardIndex | None", identifier: "CardIdentifier") -> ScryCard | None:
+    """Look up the card described by a /cards/collection identifier in a card index."""
+    if card_index is None:
+        return None
+    fields = cast(dict[str, Any], identifier)
+    if "id" in fields:
+        return card_index.lookup(scryfall_id=UUID(str(fields["id"])))
+    if "mtgo_id" in fields:
+        return card_index.lookup(mtgo_id=fields["mtgo_id"])
+    if "multiverse_id" in fields:
+        return card_index.lookup(multiverse_id=fields["multiverse_id"])
+    if "collector_number" in fields:
+        return card_index.lookup(
+            set_code=fields["set"], collector_number=fields["collector_number"]
+        )
+    # Other identifiers (oracle and illustration IDs, names) are not indexed
+    return None
+
+
+def _not_found_error(identifier: "CardIdentifier") -> APIError:
+    """Create the error raised when a batched lookup finds no card."""
+    details = f"No card found matching identifier {identifier!r}"
+    return APIError(404, ScryError(status=404, code="not_found", details=details))
+
+
+class _CollectionBatcher:
+    """Coalesces concurrent single card lookups into /cards/collection requests.
+
+    Lookups are gathered for up to `window` seconds, or until a request is full, and
+    the matching cards from the response are handed back to each waiting caller.
+    """
+
+    def __init__(self, client: "ScryfallClient", window: float) -> None:
+        self._client = client
+        self._window = window
+        self._pending: list[tuple[CardIdentifier, asyncio.Future[ScryCard]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._dispatch_tasks: set[asyncio.Task[None]] = set()
+
+    async def get_card(self, identifier: "CardIdentifier") -> ScryCard:
+        """Get a single card as part of the next batched request."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[ScryCard] = loop.create_future()
+        self._pending.append((identifier, future))
+        if len(self._pending) >= cards.MAX_COLLECTION_IDENTIFIERS:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatch all pending lookups as a single request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._dispatch(batch))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _dispatch(
+        self, batch: list[tuple["CardIdentifier", asyncio.Future[ScryCard]]]
+    ) -> None:
+        """Request a batch of cards and resolve each waiting caller's future."""
+        try:
+            result = await cards.collection(
+                self._client.transport, [identifier for identifier, _ in batch]
+            )
+            for identifier, future in batch:
+                if future.done():
+                    continue
+                card = next((c for c in result.data if _identifier_matches(identifier, c)), None)
+                if card is None:
+                    future.set_exception(_not_found_error(identifier))
+                else:
+                    future.set_result(card)
+        except Exception as exc:  # noqa: BLE001 - handed to the waiting callers instead
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            for _, future in batch:
+                future.cancel()
 
 
 class CardsHandler(BaseHandler):
     """ScryfallClient handler for cards APIs."""
 
-    async def search(
+    def __init__(self, client: "ScryfallClient") -> None:
+        super().__init__(client)
+        self._batcher: _CollectionBatcher | None = None
+        if client.card_batch_window is not None:
+            self._batcher = _CollectionBatcher(client, client.card_batch_window)
+
+    @overload
+    def search(
+        self,
+        query: str,
+        *,
+        unique: "UniqueMode | None" = None,
+        order: "SortOrdering | None" = None,
+        direction: "SortDirection | None" = None,
+        include_extras: bool | None = None,
+        include_multilingual: bool | None = None,
+        include_variations: bool | None = None,
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: None = None,
+    ) -> PagedIterator[ScryCard]:
+        ...
+
+    @overload
+    def search(
+        self,
+        query: str,
+        *,
+        unique: "UniqueMode | None" = None,
+        order: "SortOrdering | None" = None,
+        direction: "SortDirection | None" = None,
+        include_extras: bool | None = None,
+        include_multilingual: bool | None = None,
+        include_variations: bool | None = None,
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: type[_S],
+    ) -> PagedIterator[_S]:
+        ...
+
+    @overload
+    def search(
+        self,
+        query: str,
+        *,
+        unique: "UniqueMode | None" = None,
+        order: "SortOrdering | None" = None,
+        direction: "SortDirection | None" = None,
+        include_extras: bool | None = None,
+        include_multilingual: bool | None = None,
+        include_variations: bool | None = None,
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: Iterable[str],
+    ) -> PagedIterator[Struct]:
+        ...
+
+    def search(  # noqa: PLR0913 - mirrors the /cards/search query parameters
         self,
         query: str,
         *,
@@ -26,11 +290,30 @@ class CardsHandler(BaseHandler):
         include_extras: bool | None = None,
         include_multilingual: bool | None = None,
         include_variations: bool | None = None,
-    ) -> AsyncIterable[ScryCard]:
-        """Search for cards."""
-        async with self._client.limiter:
-            first_page = await cards.search(
-                self._client.session,
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: type[Struct] | Iterable[str] | None = None,
+    ) -> PagedIterator[Any]:
+        """Search for cards.
+
+        If parallel is set, up to PARALLEL_PAGES pages after the first are requested
+        concurrently (subject to the client's rate limit) instead of one after another, with
+        another requested as each page is consumed. Cards are yielded in search
+        order unless preserve_order is unset, in which case pages are yielded as they arrive
+        and the iterator's cursor cannot be used to resume the search.
+
+        Pass the cursor of an earlier search with the same arguments to resume it.
+
+        If projection is set, cards are decoded as that Struct type, or as a projection of
+        ScryCard with only the named fields (see serde.projection), skipping all other fields.
+        """
+        item_type = serde.projected_type(ScryCard, projection)
+
+        async def fetch_page(page: int | None) -> ScryList[Any]:
+            """Fetch a single page of search results."""
+            return await cards.search(
+                self._client.transport,
                 query,
                 unique=unique,
                 order=order,
@@ -38,9 +321,34 @@ class CardsHandler(BaseHandler):
                 include_extras=include_extras,
                 include_multilingual=include_multilingual,
                 include_variations=include_variations,
+                page=page,
+                item_type=item_type,
             )
-        async for card in self._client.depage_list(first_page):
-            yield card
+
+        async def iter_pages() -> AsyncIterator[ScryList[Any]]:
+            """Iterate over the pages of search results."""
+            page_number = 0 if cursor is None else cursor.page_number
+            if cursor is not None and cursor.page_url is not None:
+                first_page = await self._client.get_page(cursor.page_url, item_type)
+            else:
+                first_page = await fetch_page(page_number + 1 if page_number else None)
+            if not (
+                parallel and first_page.has_more and first_page.total_cards and first_page.data
+            ):
+                async for page in self._client.iter_pages(first_page, item_type):
+                    yield page
+                return
+
+            page_count = math.ceil(first_page.total_cards / len(first_page.data))
+            async for page in _iter_parallel_pages(
+                first_page,
+                fetch_page,
+                range(page_number + 2, page_count + 1),
+                preserve_order=preserve_order,
+            ):
+                yield page
+
+        return PagedIterator(iter_pages(), cursor)
 
     @overload
     def named(self, *, exact: str, set_code: str | None = None) -> Awaitable[ScryCard]:
@@ -62,32 +370,141 @@ class CardsHandler(BaseHandler):
         invalid_args_msg = "Exactly one of exact, fuzzy must be specified."
         if len([x for x in has_identifier if x]) != 1:
             raise ValueError(invalid_args_msg)
-        async with self._client.limiter:
-            if exact is not None:
-                return await cards.named(self._client.session, exact=exact, set_code=set_code)
-            if fuzzy is not None:
-                return await cards.named(self._client.session, fuzzy=fuzzy, set_code=set_code)
-            raise ValueError(invalid_args_msg)
+        if exact is not None:
+            return await cards.named(self._client.transport, exact=exact, set_code=set_code)
+        if fuzzy is not None:
+            return await cards.named(self._client.transport, fuzzy=fuzzy, set_code=set_code)
+        raise ValueError(invalid_args_msg)
 
     async def autocomplete(self, query: str, *, include_extras: bool | None = None) -> list[str]:
         """Get autocomplete suggestions for a query."""
-        async with self._client.limiter:
-            catalog = await cards.autocomplete(
-                self._client.session, query, include_extras=include_extras
-            )
+        catalog = await cards.autocomplete(
+            self._client.transport, query, include_extras=include_extras
+        )
         return catalog.data
 
     async def random(self, *, query: str | None = None) -> ScryCard:
         """Get a random card."""
-        async with self._client.limiter:
-            return await cards.random(self._client.session, query=query)
+        return await cards.random(self._client.transport, query=query)
+
+    @overload
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: None = None,
+    ) -> PagedIterator[ScryCard]:
+        ...
+
+    @overload
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: type[_S],
+    ) -> PagedIterator[_S]:
+        ...
+
+    @overload
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: Iterable[str],
+    ) -> PagedIterator[Struct]:
+        ...
+
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: type[Struct] | Iterable[str] | None = None,
+    ) -> PagedIterator[Any]:
+        """Get a collection of cards by various identifiers.
+
+        Pass the cursor of an earlier call with the same identifiers to resume it. Cards are
+        decoded as projection, if set, as in search.
+        """
+        if cursor is not None:
+            skipped = cursor.page_number * cards.MAX_COLLECTION_IDENTIFIERS
+            identifiers = itertools.islice(identifiers, skipped, None)
+        item_type = serde.projected_type(ScryCard, projection)
+        return PagedIterator(self._collection_pages(identifiers, item_type), cursor)
+
+    def get_collection_pages(
+        self, identifiers: Iterable["CardIdentifier"]
+    ) -> AsyncIterator[ScryList[ScryCard]]:
+        """Get a collection of cards, as one list per /cards/collection request.
+
+        Identifiers are sent in chunks of up to 75, the most the API accepts per request, with
+        the request for each chunk issued as soon as the previous one completes. Each list's
+        not_found holds the identifiers from its chunk that did not match a card.
+        """
+        return self._collection_pages(identifiers, ScryCard)
+
+    async def _collection_pages(
+        self, identifiers: Iterable["CardIdentifier"], item_type: type[_S]
+    ) -> AsyncIterator[ScryList[_S]]:
+        """Get a collection of cards decoded as item_type; see get_collection_pages."""
+
+        def fetch(chunk: list["CardIdentifier"]) -> "asyncio.Task[ScryList[_S]]":
+            """Start fetching a chunk of the collection."""
+            return asyncio.create_task(
+                cards.collection(self._client.transport, chunk, item_type=item_type)
+            )
 
-    async def get_collection(self, identifiers: list["CardIdentifier"]) -> AsyncIterable[ScryCard]:
-        """Get a collection of cards by various identifiers."""
-        async with self._client.limiter:
-            first_page = await cards.collection(self._client.session, identifiers)
-        async for card in self._client.depage_list(first_page):
-            yield card
+        chunks = _chunked(identifiers, cards.MAX_COLLECTION_IDENTIFIERS)
+        chunk = next(chunks, None)
+        pending = None if chunk is None else fetch(chunk)
+        try:
+            while pending is not None:
+                page = await pending
+                chunk = next(chunks, None)
+                pending = None if chunk is None else fetch(chunk)
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def get_cards_many(
+        self, identifiers: Iterable["CardIdentifier"]
+    ) -> list[ScryCard | Exception]:
+        """Get many cards by various identifiers, in as few requests as possible.
+
+        Cards are looked up in the client's card index first, and the rest are requested
+        concurrently from /cards/collection in chunks of up to 75. Results are in the order of
+        identifiers, with the exception raised for any identifier that could not be resolved
+        in place of its card (an APIError with status 404 if no card matched it).
+        """
+        identifiers = list(identifiers)
+        results: list[ScryCard | Exception | None] = [
+            _index_lookup(self._client.card_index, identifier) for identifier in identifiers
+        ]
+        unresolved = [position for position, result in enumerate(results) if result is None]
+        chunks = list(_chunked(unresolved, cards.MAX_COLLECTION_IDENTIFIERS))
+        responses = await asyncio.gather(
+            *(self._fetch_collection([identifiers[p] for p in chunk]) for chunk in chunks),
+            return_exceptions=True,
+        )
+        for chunk, response in zip(chunks, responses, strict=True):
+            if isinstance(response, BaseException) and not isinstance(response, Exception):
+                raise response
+            for position in chunk:
+                identifier = identifiers[position]
+                if isinstance(response, Exception):
+                    results[position] = response
+                    continue
+                card = next((c for c in response.data if _identifier_matches(identifier, c)), None)
+                results[position] = _not_found_error(identifier) if card is None else card
+        return cast(list[ScryCard | Exception], results)
+
+    async def _fetch_collection(self, identifiers: list["CardIdentifier"]) -> ScryList[ScryCard]:
+        """Request a single chunk of a card collection."""
+        return await cards.collection(self._client.transport, identifiers)
 
     @overload
     def get_card(self, *, set_code: str, collector_number: str) -> Awaitable[ScryCard]:
@@ -117,7 +534,7 @@ class CardsHandler(BaseHandler):
     def get_card(self, *, scryfall_id: UUID) -> Awaitable[ScryCard]:
         ...
 
-    async def get_card(
+    async def get_card(  # noqa: PLR0913 - one keyword per card identifier
         self,
         *,
         set_code: str | None = None,
@@ -142,21 +559,71 @@ class CardsHandler(BaseHandler):
         invalid_args_msg = "Exactly one of (set_code and collector_number), multiverse_id, mtgo_id, arena_id, tcgplayer_id, cardmarket_id, scryfall_id must be specified."
         if len([x for x in has_identifier if x]) != 1:
             raise ValueError(invalid_args_msg)
-        async with self._client.limiter:
-            if set_code is not None and collector_number is not None:
-                return await cards.getby_set_code_and_collector_number(
-                    self._client.session, set_code, collector_number
-                )
-            if multiverse_id is not None:
-                return await cards.getby_multiverse_id(self._client.session, multiverse_id)
-            if mtgo_id is not None:
-                return await cards.getby_mtgo_id(self._client.session, mtgo_id)
-            if arena_id is not None:
-                return await cards.getby_arena_id(self._client.session, arena_id)
-            if tcgplayer_id is not None:
-                return await cards.getby_tcgplayer_id(self._client.session, tcgplayer_id)
-            if cardmarket_id is not None:
-                return await cards.getby_cardmarket_id(self._client.session, cardmarket_id)
-            if scryfall_id is not None:
-                return await cards.getby_id(self._client.session, scryfall_id)
-            raise ValueError(invalid_args_msg)
+        card_index = self._client.card_index
+        indexed_card = (
+            None
+            if card_index is None
+            else card_index.lookup(
+                set_code=set_code,
+                collector_number=collector_number,
+                multiverse_id=multiverse_id,
+                mtgo_id=mtgo_id,
+                arena_id=arena_id,
+                tcgplayer_id=tcgplayer_id,
+                cardmarket_id=cardmarket_id,
+                scryfall_id=scryfall_id,
+            )
+        )
+        if indexed_card is not None:
+            return indexed_card
+        identifier = _collection_identifier(
+            set_code=set_code,
+            collector_number=collector_number,
+            multiverse_id=multiverse_id,
+            mtgo_id=mtgo_id,
+            scryfall_id=scryfall_id,
+        )
+        if self._batcher is not None and identifier is not None:
+            return await self._batcher.get_card(identifier)
+        return await self._fetch_card(
+            set_code=set_code,
+            collector_number=collector_number,
+            multiverse_id=multiverse_id,
+            mtgo_id=mtgo_id,
+            arena_id=arena_id,
+            tcgplayer_id=tcgplayer_id,
+            cardmarket_id=cardmarket_id,
+            scryfall_id=scryfall_id,
+        )
+
+    async def _fetch_card(  # noqa: PLR0913 - one keyword per card identifier
+        self,
+        *,
+        set_code: str | None,
+        collector_number: str | None,
+        multiverse_id: int | None,
+        mtgo_id: int | None,
+        arena_id: int | None,
+        tcgplayer_id: int | None,
+        cardmarket_id: int | None,
+        scryfall_id: UUID | None,
+    ) -> ScryCard:
+        """Request a single card from the API by whichever identifier is specified."""
+        if set_code is not None and collector_number is not None:
+            return await cards.getby_set_code_and_collector_number(
+                self._client.transport, set_code, collector_number
+            )
+        if multiverse_id is not None:
+            return await cards.getby_multiverse_id(self._client.transport, multiverse_id)
+        if mtgo_id is not None:
+            return await cards.getby_mtgo_id(self._client.transport, mtgo_id)
+        if arena_id is not None:
+            return await cards.getby_arena_id(self._client.transport, arena_id)
+        if tcgplayer_id is not None:
+            return await cards.getby_tcgplayer_id(self._client.transport, tcgplayer_id)
+        if cardmarket_id is not None:
+            return await cards.getby_cardmarket_id(self._client.transport, cardmarket_id)
+        if scryfall_id is not None:
+            return await cards.getby_id(self._client.transport, scryfall_id)
+        msg = "No card identifier specified."
+        raise ValueError(msg)
@@ -14,12 +14,10 @@ class MigrationsHandler(BaseHandler):
 
     async def all_migrations(self) -> AsyncIterable[ScryMigration]:
         """Get all migrations."""
-        async with self._client.limiter:
-            first_page = await migrations.all_migrations(self._client.session)
+        first_page = await migrations.all_migrations(self._client.transport)
         async for migration in self._client.depage_list(first_page):
             yield migration
 
     async def get_migration(self, *, migration_id: UUID) -> ScryMigration:
         """Get a migration by its ID."""
-        async with self._client.limiter:
-            return await migrations.getby_id(self._client.session, migration_id)
+        return await migrations.getby_id(self._client.transport, migration_id)
@@ -1,11 +1,13 @@
 """Client handler for the Scryfall rulings APIs."""
 
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
 from typing import overload
 from uuid import UUID
 
 from aioscryfall.api import rulings
+from aioscryfall.models.lists import ScryList
 from aioscryfall.models.rulings import ScryRuling
+from aioscryfall.pagination import Cursor, PagedIterator
 
 from .base import BaseHandler
 
@@ -14,26 +16,36 @@ class RulingsHandler(BaseHandler):
     """ScryfallClient handler for rulings APIs."""
 
     @overload
-    def get_rulings(self, *, card_id: UUID) -> AsyncIterable[ScryRuling]:
+    def get_rulings(
+        self, *, card_id: UUID, cursor: Cursor | None = None
+    ) -> PagedIterator[ScryRuling]:
         ...
 
     @overload
-    def get_rulings(self, *, multiverse_id: int) -> AsyncIterable[ScryRuling]:
+    def get_rulings(
+        self, *, multiverse_id: int, cursor: Cursor | None = None
+    ) -> PagedIterator[ScryRuling]:
         ...
 
     @overload
-    def get_rulings(self, *, mtgo_id: int) -> AsyncIterable[ScryRuling]:
+    def get_rulings(
+        self, *, mtgo_id: int, cursor: Cursor | None = None
+    ) -> PagedIterator[ScryRuling]:
         ...
 
     @overload
-    def get_rulings(self, *, arena_id: int) -> AsyncIterable[ScryRuling]:
+    def get_rulings(
+        self, *, arena_id: int, cursor: Cursor | None = None
+    ) -> PagedIterator[ScryRuling]:
         ...
 
     @overload
-    def get_rulings(self, *, set_code: str, collector_number: str) -> AsyncIterable[ScryRuling]:
+    def get_rulings(
+        self, *, set_code: str, collector_number: str, cursor: Cursor | None = None
+    ) -> PagedIterator[ScryRuling]:
         ...
 
-    async def get_rulings(
+    def get_rulings(
         self,
         *,
         card_id: UUID | None = None,
@@ -42,8 +54,35 @@ class RulingsHandler(BaseHandler):
         arena_id: int | None = None,
         set_code: str | None = None,
         collector_number: str | None = None,
-    ) -> AsyncIterable[ScryRuling]:
-        """Get rulings for a card."""
+        cursor: Cursor | None = None,
+    ) -> PagedIterator[ScryRuling]:
+        """Get rulings for a card.
+
+        Pass the cursor of an earlier call for the same card to resume it.
+        """
+        pages = self._get_rulings_pages(
+            card_id=card_id,
+            multiverse_id=multiverse_id,
+            mtgo_id=mtgo_id,
+            arena_id=arena_id,
+            set_code=set_code,
+            collector_number=collector_number,
+            cursor=cursor,
+        )
+        return PagedIterator(pages, cursor)
+
+    async def _get_rulings_pages(
+        self,
+        *,
+        card_id: UUID | None,
+        multiverse_id: int | None,
+        mtgo_id: int | None,
+        arena_id: int | None,
+        set_code: str | None,
+        collector_number: str | None,
+        cursor: Cursor | None,
+    ) -> AsyncIterator[ScryList[ScryRuling]]:
+        """Iterate over the pages of rulings for a card."""
         has_identifier = (
             card_id is not None,
             multiverse_id is not None,
@@ -54,21 +93,22 @@ class RulingsHandler(BaseHandler):
         invalid_args_msg = "Exactly one of card_id, multiverse_id, mtgo_id, arena_id, (set_code and collector_number) must be specified."
         if len([x for x in has_identifier if x]) != 1:
             raise ValueError(invalid_args_msg)
-        async with self._client.limiter:
-            if card_id is not None:
-                first_page = await rulings.getby_card_id(self._client.session, card_id)
-            elif multiverse_id is not None:
-                first_page = await rulings.getby_multiverse_id(self._client.session, multiverse_id)
-            elif mtgo_id is not None:
-                first_page = await rulings.getby_mtgo_id(self._client.session, mtgo_id)
-            elif arena_id is not None:
-                first_page = await rulings.getby_arena_id(self._client.session, arena_id)
-            elif set_code is not None and collector_number is not None:
-                first_page = await rulings.getby_set_code_and_collector_number(
-                    self._client.session, set_code, collector_number
-                )
-            else:
-                raise ValueError(invalid_args_msg)
+        if cursor is not None and cursor.page_url is not None:
+            first_page = await self._client.get_page(cursor.page_url, ScryRuling)
+        elif card_id is not None:
+            first_page = await rulings.getby_card_id(self._client.transport, card_id)
+        elif multiverse_id is not None:
+            first_page = await rulings.getby_multiverse_id(self._client.transport, multiverse_id)
+        elif mtgo_id is not None:
+            first_page = await rulings.getby_mtgo_id(self._client.transport, mtgo_id)
+        elif arena_id is not None:
+            first_page = await rulings.getby_arena_id(self._client.transport, arena_id)
+        elif set_code is not None and collector_number is not None:
+            first_page = await rulings.getby_set_code_and_collector_number(
+                self._client.transport, set_code, collector_number
+            )
+        else:
+            raise ValueError(invalid_args_msg)
 
-        async for ruling in self._client.depage_list(first_page):
-            yield ruling
+        async for page in self._client.iter_pages(first_page):
+            yield page
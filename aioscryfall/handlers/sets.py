@@ -15,8 +15,7 @@ class SetsHandler(BaseHandler):
 
     async def all_sets(self) -> AsyncIterable[ScrySet]:
         """Get all sets."""
-        async with self._client.limiter:
-            first_page = await sets.all_sets(self._client.session)
+        first_page = await sets.all_sets(self._client.transport)
         async for set_ in self._client.depage_list(first_page):
             yield set_
 
@@ -48,11 +47,10 @@ class SetsHandler(BaseHandler):
         invalid_args_msg = "Exactly one of set_code, tcgplayer_id, scryfall_id must be specified."
         if len([x for x in has_identifier if x]) != 1:
             raise ValueError(invalid_args_msg)
-        async with self._client.limiter:
-            if set_code is not None:
-                return await sets.getby_code(self._client.session, set_code)
-            if tcgplayer_id is not None:
-                return await sets.getby_tcgplayer_id(self._client.session, tcgplayer_id)
-            if scryfall_id is not None:
-                return await sets.getby_id(self._client.session, scryfall_id)
-            raise ValueError(invalid_args_msg)
+        if set_code is not None:
+            return await sets.getby_code(self._client.transport, set_code)
+        if tcgplayer_id is not None:
+            return await sets.getby_tcgplayer_id(self._client.transport, tcgplayer_id)
+        if scryfall_id is not None:
+            return await sets.getby_id(self._client.transport, scryfall_id)
+        raise ValueError(invalid_args_msg)
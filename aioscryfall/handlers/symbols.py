@@ -13,12 +13,10 @@ class SymbolsHandler(BaseHandler):
 
     async def all_card_symbols(self) -> AsyncIterable[ScryCardSymbol]:
         """Get all card symbols."""
-        async with self._client.limiter:
-            first_page = await symbols.all_card_symbols(self._client.session)
+        first_page = await symbols.all_card_symbols(self._client.transport)
         async for symbol in self._client.depage_list(first_page):
             yield symbol
 
     async def parse_mana(self, mana_cost: str) -> ScryManaCost:
         """Parse a mana cost string."""
-        async with self._client.limiter:
-            return await symbols.parse_mana(self._client.session, mana_cost)
+        return await symbols.parse_mana(self._client.transport, mana_cost)
@@ -0,0 +1,128 @@
+"""Local index of cards by their identifiers, for card lookups without API requests."""
+
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Self
+from uuid import UUID
+
+from aioscryfall.models.cards import ScryCard
+from aioscryfall.store import CardStore
+
+if TYPE_CHECKING:
+    from aioscryfall.client import ScryfallClient
+    from aioscryfall.models.bulk_data import ScryBulkData
+
+_INDEXED_FIELDS = (
+    "id_",
+    "multiverse_ids",
+    "mtgo_id",
+    "mtgo_foil_id",
+    "arena_id",
+    "tcgplayer_id",
+    "cardmarket_id",
+    "set_",
+    "collector_number",
+    "lang",
+)
+
+
+def _field_values(cards: Sequence[ScryCard], field_name: str) -> Iterable[Any]:
+    """Iterate over a single field of all cards, without materializing stored cards."""
+    if isinstance(cards, CardStore):
+        return cards.values(field_name)
+    return (getattr(card, field_name) for card in cards)
+
+
+class CardIndex:
+    """CardIndex maps every Scryfall card identifier kind to cards in a sequence.
+
+    The index only holds row numbers into the card sequence, so it can be built over a
+    CardStore to avoid holding every card in memory.
+    """
+
+    def __init__(self, cards: Sequence[ScryCard]) -> None:
+        self._cards = cards
+        self._by_scryfall_id: dict[UUID, int] = {}
+        self._by_multiverse_id: dict[int, int] = {}
+        self._by_mtgo_id: dict[int, int] = {}
+        self._by_arena_id: dict[int, int] = {}
+        self._by_tcgplayer_id: dict[int, int] = {}
+        self._by_cardmarket_id: dict[int, int] = {}
+        self._by_set_code_and_collector_number: dict[tuple[str, str], int] = {}
+
+        columns = zip(*(_field_values(cards, name) for name in _INDEXED_FIELDS), strict=True)
+        for row, (
+            scryfall_id,
+            multiverse_ids,
+            mtgo_id,
+            mtgo_foil_id,
+            arena_id,
+            tcgplayer_id,
+            cardmarket_id,
+            set_code,
+            collector_number,
+            lang,
+        ) in enumerate(columns):
+            self._by_scryfall_id[scryfall_id] = row
+            for multiverse_id in multiverse_ids or ():
+                self._by_multiverse_id[multiverse_id] = row
+            # Like the API, look up foil MTGO ids as MTGO ids
+            if mtgo_id is not None:
+                self._by_mtgo_id[mtgo_id] = row
+            if mtgo_foil_id is not None:
+                self._by_mtgo_id[mtgo_foil_id] = row
+            if arena_id is not None:
+                self._by_arena_id[arena_id] = row
+            if tcgplayer_id is not None:
+                self._by_tcgplayer_id[tcgplayer_id] = row
+            if cardmarket_id is not None:
+                self._by_cardmarket_id[cardmarket_id] = row
+            # Like the API, prefer English printings when looking up by collector number
+            key = (set_code.lower(), collector_number)
+            if lang == "en" or key not in self._by_set_code_and_collector_number:
+                self._by_set_code_and_collector_number[key] = row
+
+    @classmethod
+    async def from_bulk_data(
+        cls, client: "ScryfallClient", bulk_data_item: "ScryBulkData"
+    ) -> Self:
+        """Build an index over the cards in a bulk data item."""
+        cards = [
+            item
+            async for item in client.bulk_data.iter_contents(bulk_data_item)
+            if isinstance(item, ScryCard)
+        ]
+        return cls(cards)
+
+    def __len__(self) -> int:
+        """Get the number of indexed cards."""
+        return len(self._cards)
+
+    def lookup(  # noqa: PLR0913 - one keyword per card identifier
+        self,
+        *,
+        set_code: str | None = None,
+        collector_number: str | None = None,
+        multiverse_id: int | None = None,
+        mtgo_id: int | None = None,
+        arena_id: int | None = None,
+        tcgplayer_id: int | None = None,
+        cardmarket_id: int | None = None,
+        scryfall_id: UUID | None = None,
+    ) -> ScryCard | None:
+        """Look up a card by any one of its identifiers, returning None if it is not indexed."""
+        row = None
+        if set_code is not None and collector_number is not None:
+            row = self._by_set_code_and_collector_number.get((set_code.lower(), collector_number))
+        elif multiverse_id is not None:
+            row = self._by_multiverse_id.get(multiverse_id)
+        elif mtgo_id is not None:
+            row = self._by_mtgo_id.get(mtgo_id)
+        elif arena_id is not None:
+            row = self._by_arena_id.get(arena_id)
+        elif tcgplayer_id is not None:
+            row = self._by_tcgplayer_id.get(tcgplayer_id)
+        elif cardmarket_id is not None:
+            row = self._by_cardmarket_id.get(cardmarket_id)
+        elif scryfall_id is not None:
+            row = self._by_scryfall_id.get(scryfall_id)
+        return None if row is None else self._cards[row]
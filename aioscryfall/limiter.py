@@ -0,0 +1,201 @@
+"""Rate limiters for Scryfall API requests."""
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from collections.abc import Callable
+from email.utils import parsedate_to_datetime
+from types import TracebackType
+from typing import TypeVar
+
+import appdirs
+
+_T = TypeVar("_T")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value into a delay in seconds."""
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class _LimiterState:
+    """Mutable scheduling state of a rate limiter."""
+
+    _FORMAT = struct.Struct("ddd")
+
+    def __init__(self, rate: float, next_arrival: float = 0.0, paused_until: float = 0.0) -> None:
+        self.rate = rate
+        # Theoretical arrival time of the next request, per the generic cell rate algorithm
+        self.next_arrival = next_arrival
+        self.paused_until = paused_until
+
+    def pack(self) -> bytes:
+        """Serialize the state."""
+        return self._FORMAT.pack(self.rate, self.next_arrival, self.paused_until)
+
+    @classmethod
+    def unpack(cls, data: bytes, default_rate: float) -> "_LimiterState":
+        """Deserialize a state, or create a new one if there is no valid state."""
+        if len(data) != cls._FORMAT.size:
+            return cls(default_rate)
+        return cls(*cls._FORMAT.unpack(data))
+
+
+class AdaptiveLimiter:
+    """AdaptiveLimiter is a rate limiter that slows down when the API throttles requests.
+
+    Up to max_rate requests are allowed in any time_period. When a request is throttled, the
+    rate is multiplied by backoff (but kept above min_rate) and no request starts until the
+    server's Retry-After delay has passed. Every successful request then raises the rate by
+    recovery requests per second, until it is back at max_rate.
+
+    Limits apply to the requests of a single process, which may share the limiter between
+    threads and event loops. Use as an async context manager around each request:
+
+        async with limiter:
+            ...
+    """
+
+    def __init__(
+        self,
+        max_rate: float = 10,
+        time_period: float = 1,
+        *,
+        min_rate: float = 1,
+        backoff: float = 0.5,
+        recovery: float = 0.1,
+    ) -> None:
+        self.max_rate = max_rate / time_period
+        self.time_period = time_period
+        self.min_rate = min(min_rate, self.max_rate)
+        self.backoff = backoff
+        self.recovery = recovery
+        self._state = _LimiterState(self.max_rate)
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current rate limit, in requests per second."""
+        return self._state.rate
+
+    def _clock(self) -> float:
+        return time.monotonic()
+
+    async def _update(self, update: Callable[[_LimiterState, float], _T]) -> _T:
+        """Apply an update to the limiter state, as of the current time."""
+        with self._lock:
+            return update(self._state, self._clock())
+
+    def _schedule(self, state: _LimiterState, now: float) -> float:
+        """Schedule a request, returning when it may start."""
+        interval = 1 / state.rate
+        # Allow bursts only at full rate; space requests evenly while backing off
+        burst = self.time_period - interval if state.rate >= self.max_rate else 0.0
+        arrival = max(state.next_arrival, now, state.paused_until)
+        state.next_arrival = arrival + interval
+        return max(now, state.paused_until, arrival - burst)
+
+    def _throttle(self, state: _LimiterState, now: float, retry_after: float | None) -> None:
+        """Back off after a throttled request."""
+        # Requests already in flight when throttling began don't slow us down further
+        if now >= state.paused_until:
+            state.rate = max(self.min_rate, state.rate * self.backoff)
+        delay = 1 / state.rate if retry_after is None else retry_after
+        state.paused_until = max(state.paused_until, now + delay)
+        state.next_arrival = state.paused_until
+
+    def _recover(self, state: _LimiterState, _now: float) -> None:
+        """Ramp back up after a successful request."""
+        state.rate = min(self.max_rate, state.rate + self.recovery)
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed to start."""
+        while True:
+            start = await self._update(self._schedule)
+            delay = start - self._clock()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            # Requests that were already waiting when the API throttled us wait again
+            if await self._update(lambda state, now: state.paused_until <= now):
+                return
+
+    async def throttled(self, retry_after: float | None = None) -> None:
+        """Slow down after the API has throttled a request."""
+        await self._update(lambda state, now: self._throttle(state, now, retry_after))
+
+    async def succeeded(self) -> None:
+        """Speed back up after a request was not throttled."""
+        if self._state.rate < self.max_rate:
+            await self._update(self._recover)
+
+    async def __aenter__(self) -> None:
+        """Wait until a request is allowed to start."""
+        await self.acquire()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Do nothing; limits apply to when requests start."""
+
+
+class FileLockLimiter(AdaptiveLimiter):
+    """FileLockLimiter is an AdaptiveLimiter shared by every process on a host.
+
+    The limiter state lives in a small file, updated under an exclusive lock, so any number
+    of processes (and clients) using the same path share one request budget, including any
+    backoff after throttling. Requires a POSIX platform.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        max_rate: float = 10,
+        time_period: float = 1,
+        *,
+        min_rate: float = 1,
+        backoff: float = 0.5,
+        recovery: float = 0.1,
+    ) -> None:
+        super().__init__(
+            max_rate, time_period, min_rate=min_rate, backoff=backoff, recovery=recovery
+        )
+        if path is None:
+            path = os.path.join(appdirs.user_cache_dir("aioscryfall"), "limiter")
+        self.path = os.fspath(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+    def _clock(self) -> float:
+        # Monotonic clocks are not comparable across processes
+        return time.time()
+
+    def _locked_update(self, update: Callable[[_LimiterState, float], _T]) -> _T:
+        import fcntl  # noqa: PLC0415 - POSIX only, so not imported at module level
+
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            state = _LimiterState.unpack(os.pread(fd, 64, 0), self.max_rate)
+            result = update(state, self._clock())
+            os.pwrite(fd, state.pack(), 0)
+            # Keep a local copy of the shared state for cheap reads
+            self._state = state
+            return result
+        finally:
+            os.close(fd)
+
+    async def _update(self, update: Callable[[_LimiterState, float], _T]) -> _T:
+        return await asyncio.to_thread(self._locked_update, update)
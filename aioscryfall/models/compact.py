@@ -0,0 +1,385 @@
+"""Memory-lean representation of ScryCard objects, for holding many cards in memory.
+
+A CompactCard holds the same data as a ScryCard, packed to use a fraction of the memory:
+
+- CompactCards are array-like msgspec Structs with garbage collection disabled.
+- repeated strings (names, oracle text, type lines, set fields, artists...) are interned,
+  and other repeated values (set IDs, release dates...) are shared between cards.
+- enums are stored as small integer codes and color lists as strings (e.g. "WU").
+- legalities are stored as a bitset, with 2 bits for each of LEGALITY_FORMATS.
+- UUIDs are stored as 16 bytes and dicts as flat tuples of alternating keys and values.
+
+Codes are positions in LEGALITY_FORMATS and the model enums; new formats and enum members
+are only ever appended, so encoded CompactCards stay readable.
+"""
+
+import datetime as dt
+import sys
+from collections.abc import Callable, Mapping, Sequence
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Self, TypeVar
+from uuid import UUID
+
+import msgspec
+from msgspec import Struct
+
+from .cards import (
+    ScryCard,
+    ScryCardBorderColor,
+    ScryCardFace,
+    ScryCardFinish,
+    ScryCardFrame,
+    ScryCardFrameEffect,
+    ScryCardImageStatus,
+    ScryCardLayout,
+    ScryCardLegality,
+    ScryCardPreviewBlock,
+    ScryCardRarity,
+    ScryCardSecurityStamp,
+    ScryRelatedCard,
+)
+from .common import ScryColor, ScryGame
+
+_E = TypeVar("_E", bound=Enum)
+_T = TypeVar("_T")
+
+LEGALITY_FORMATS = (
+    "standard",
+    "future",
+    "historic",
+    "gladiator",
+    "pioneer",
+    "explorer",
+    "modern",
+    "legacy",
+    "pauper",
+    "vintage",
+    "penny",
+    "commander",
+    "oathbreaker",
+    "brawl",
+    "historicbrawl",
+    "alchemy",
+    "paupercommander",
+    "duel",
+    "oldschool",
+    "premodern",
+    "predh",
+    "timeless",
+    "standardbrawl",
+)
+_FORMAT_BITS = {name: 2 * position for position, name in enumerate(LEGALITY_FORMATS)}
+_ALL_FORMATS = (1 << len(LEGALITY_FORMATS)) - 1
+_LEGALITIES = tuple(ScryCardLegality)
+_LEGALITY_CODES = {legality: code for code, legality in enumerate(_LEGALITIES)}
+
+# Repeated non-string values, shared between cards
+_shared: dict[Any, Any] = {}
+
+
+def _share(value: _T) -> _T:
+    """Get a shared copy of a hashable value."""
+    return _shared.setdefault(value, value)
+
+
+class CompactCard(Struct, array_like=True, gc=False):
+    """A CompactCard is a memory-lean, lossless representation of a ScryCard.
+
+    Fields have the same names as ScryCard fields, but hold packed values; use from_card and
+    to_card to convert between the two. Legalities for formats that are not in
+    LEGALITY_FORMATS are kept in other_legalities.
+    """
+
+    # Core Card Fields
+    arena_id: int | None
+    id_: bytes
+    lang: str
+    mtgo_id: int | None
+    mtgo_foil_id: int | None
+    multiverse_ids: tuple[int, ...] | None
+    tcgplayer_id: int | None
+    tcgplayer_etched_id: int | None
+    cardmarket_id: int | None
+    oracle_id: bytes | None
+    prints_search_uri: str
+    rulings_uri: str
+    scryfall_uri: str
+    uri: str
+    # Gameplay Fields
+    all_parts: tuple[ScryRelatedCard, ...] | None
+    card_faces: tuple[ScryCardFace, ...] | None
+    cmc: float | None
+    colors: str | None
+    color_identity: str
+    color_indicator: str | None
+    edhrec_rank: int | None
+    foil: bool
+    hand_modifier: str | None
+    keywords: tuple[str, ...]
+    layout: int
+    legalities: int
+    life_modifier: str | None
+    loyalty: str | None
+    mana_cost: str | None
+    name: str
+    nonfoil: bool
+    oracle_text: str | None
+    oversized: bool
+    penny_rank: int | None
+    power: str | None
+    produced_mana: tuple[str, ...] | None
+    reserved: bool
+    toughness: str | None
+    type_line: str | None
+    # Print Fields
+    artist: str | None
+    artist_ids: tuple[bytes, ...] | None
+    booster: bool
+    border_color: int
+    card_back_id: bytes | None
+    collector_number: str
+    content_warning: bool | None
+    digital: bool
+    finishes: tuple[int, ...]
+    flavor_name: str | None
+    flavor_text: str | None
+    frame_effect: int | None
+    frame_effects: tuple[int, ...] | None
+    frame: int
+    full_art: bool
+    games: tuple[int, ...]
+    highres_image: bool
+    illustration_id: bytes | None
+    image_status: int
+    image_uris: tuple[str, ...] | None
+    prices: tuple[str | None, ...] | None
+    printed_name: str | None
+    printed_text: str | None
+    printed_type_line: str | None
+    promo: bool
+    promo_types: tuple[str, ...] | None
+    purchase_uris: tuple[str, ...] | None
+    rarity: int
+    related_uris: tuple[str, ...] | None
+    released_at: dt.date
+    reprint: bool
+    scryfall_set_uri: str
+    set_name: str
+    set_search_uri: str
+    set_type: str
+    set_uri: str
+    set_: str
+    set_id: bytes
+    story_spotlight: bool
+    textless: bool
+    variation: bool
+    variation_of: bytes | None
+    security_stamp: int | None
+    watermark: str | None
+    preview: ScryCardPreviewBlock | None
+    # Legalities not covered by the legalities bitset
+    legality_formats: int | None = None
+    other_legalities: tuple[str, ...] | None = None
+
+    @classmethod
+    def from_card(cls, card: ScryCard) -> Self:
+        """Create a CompactCard from a ScryCard."""
+        values = [
+            value if pack is None or value is None else pack(value)
+            for pack, value in zip(_PACKERS, msgspec.structs.astuple(card), strict=True)
+        ]
+        legalities, legality_formats, other_legalities = _pack_legalities(card.legalities)
+        values[_LEGALITIES_POSITION] = legalities
+        values += (legality_formats, other_legalities)
+        return cls(*values)
+
+    def to_card(self) -> ScryCard:
+        """Convert back to a ScryCard."""
+        values = msgspec.structs.astuple(self)[: len(_CARD_FIELDS)]
+        fields = {
+            name: value if unpack is None or value is None else unpack(value)
+            for name, unpack, value in zip(_CARD_FIELDS, _UNPACKERS, values, strict=True)
+        }
+        fields["legalities"] = _unpack_legalities(
+            self.legalities, self.legality_formats, self.other_legalities
+        )
+        return ScryCard(**fields)
+
+
+def _pack_legalities(
+    legalities: Mapping[str, ScryCardLegality],
+) -> tuple[int, int | None, tuple[str, ...] | None]:
+    """Pack legalities into a bitset, a bitmask of the formats present, and other legalities."""
+    bits = 0
+    formats = 0
+    other: list[str] = []
+    for name, legality in legalities.items():
+        shift = _FORMAT_BITS.get(name)
+        if shift is None:
+            other += (sys.intern(name), legality.value)
+            continue
+        bits |= _LEGALITY_CODES[legality] << shift
+        formats |= 1 << (shift // 2)
+    return bits, None if formats == _ALL_FORMATS else formats, tuple(other) or None
+
+
+def _unpack_legalities(
+    bits: int, formats: int | None, other: Sequence[str] | None
+) -> dict[str, ScryCardLegality]:
+    """Unpack legalities packed by _pack_legalities."""
+    legalities = {
+        name: _LEGALITIES[(bits >> (2 * position)) & 0b11]
+        for position, name in enumerate(LEGALITY_FORMATS)
+        if formats is None or formats & (1 << position)
+    }
+    for name, legality in zip(other[::2], other[1::2], strict=True) if other else ():
+        legalities[name] = ScryCardLegality(legality)
+    return legalities
+
+
+def _enum_codec(enum: type[_E]) -> tuple[Callable[[_E], int], Callable[[int], _E]]:
+    """Get functions converting an enum's members to and from small integer codes."""
+    members = tuple(enum)
+    codes = {member: code for code, member in enumerate(members)}
+    return codes.__getitem__, members.__getitem__
+
+
+def _enum_list_codec(
+    enum: type[_E],
+) -> tuple[Callable[[list[_E]], tuple[int, ...]], Callable[[tuple[int, ...]], list[_E]]]:
+    """Get functions converting lists of an enum's members to and from small integer codes."""
+    pack, unpack = _enum_codec(enum)
+    return (lambda values: tuple(map(pack, values))), (lambda codes: list(map(unpack, codes)))
+
+
+def _pack_strs(values: list[str]) -> tuple[str, ...]:
+    """Pack a list of repeated strings."""
+    return tuple(map(sys.intern, values))
+
+
+def _pack_str_dict(values: dict[str, str]) -> tuple[str, ...]:
+    """Pack a dict of strings into a tuple of alternating keys and values."""
+    return tuple(sys.intern(item) for pair in values.items() for item in pair)
+
+
+def _unpack_str_dict(items: tuple[str, ...]) -> dict[str, str]:
+    """Unpack a dict of strings packed by _pack_str_dict."""
+    return dict(zip(items[::2], items[1::2], strict=True))
+
+
+def _pack_prices(prices: dict[str, Decimal | None]) -> tuple[str | None, ...]:
+    """Pack prices into a tuple of alternating currencies and exact decimal strings."""
+    return tuple(
+        item
+        for name, price in prices.items()
+        for item in (sys.intern(name), None if price is None else str(price))
+    )
+
+
+def _unpack_prices(items: tuple[str | None, ...]) -> dict[str, Decimal | None]:
+    """Unpack prices packed by _pack_prices."""
+    return {
+        str(name): None if price is None else Decimal(price)
+        for name, price in zip(items[::2], items[1::2], strict=True)
+    }
+
+
+def _pack_uuid(value: UUID) -> bytes:
+    """Pack a UUID into its 16 bytes."""
+    return value.bytes
+
+
+def _unpack_uuid(value: bytes) -> UUID:
+    """Unpack a UUID packed by _pack_uuid."""
+    return UUID(bytes=value)
+
+
+def _pack_colors(colors: list[ScryColor]) -> str:
+    """Pack a list of colors into a string of their symbols."""
+    return sys.intern("".join(color.value for color in colors))
+
+
+def _unpack_colors(colors: str) -> list[ScryColor]:
+    """Unpack a list of colors packed by _pack_colors."""
+    return [ScryColor(color) for color in colors]
+
+
+def _codecs() -> dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any] | None]]:
+    """Get the functions packing and unpacking each field that is not stored as is."""
+    interned: tuple[Callable[[Any], Any], None] = (sys.intern, None)
+    shared: tuple[Callable[[Any], Any], None] = (_share, None)
+    uuid = (_pack_uuid, _unpack_uuid)
+    shared_uuid = (lambda value: _share(value.bytes), _unpack_uuid)
+    str_list = (_pack_strs, list)
+    str_dict = (_pack_str_dict, _unpack_str_dict)
+    colors = (_pack_colors, _unpack_colors)
+    return {
+        "id_": uuid,
+        "lang": interned,
+        "multiverse_ids": (tuple, list),
+        "oracle_id": uuid,
+        "all_parts": (tuple, list),
+        "card_faces": (tuple, list),
+        "cmc": shared,
+        "colors": colors,
+        "color_identity": colors,
+        "color_indicator": colors,
+        "hand_modifier": interned,
+        "keywords": str_list,
+        "layout": _enum_codec(ScryCardLayout),
+        "life_modifier": interned,
+        "loyalty": interned,
+        "mana_cost": interned,
+        "name": interned,
+        "oracle_text": interned,
+        "power": interned,
+        "produced_mana": str_list,
+        "toughness": interned,
+        "type_line": interned,
+        "artist": interned,
+        "artist_ids": (
+            lambda values: tuple(map(_pack_uuid, values)),
+            lambda values: list(map(_unpack_uuid, values)),
+        ),
+        "border_color": _enum_codec(ScryCardBorderColor),
+        "card_back_id": shared_uuid,
+        "finishes": _enum_list_codec(ScryCardFinish),
+        "flavor_name": interned,
+        "flavor_text": interned,
+        "frame_effect": _enum_codec(ScryCardFrameEffect),
+        "frame_effects": _enum_list_codec(ScryCardFrameEffect),
+        "frame": _enum_codec(ScryCardFrame),
+        "games": _enum_list_codec(ScryGame),
+        "illustration_id": uuid,
+        "image_status": _enum_codec(ScryCardImageStatus),
+        "image_uris": str_dict,
+        "prices": (_pack_prices, _unpack_prices),
+        "printed_name": interned,
+        "printed_text": interned,
+        "printed_type_line": interned,
+        "promo_types": str_list,
+        "purchase_uris": str_dict,
+        "rarity": _enum_codec(ScryCardRarity),
+        "related_uris": str_dict,
+        "released_at": shared,
+        "scryfall_set_uri": interned,
+        "set_name": interned,
+        "set_search_uri": interned,
+        "set_type": interned,
+        "set_uri": interned,
+        "set_": interned,
+        "set_id": shared_uuid,
+        "variation_of": uuid,
+        "security_stamp": _enum_codec(ScryCardSecurityStamp),
+        "watermark": interned,
+    }
+
+
+_CARD_FIELDS = ScryCard.__struct_fields__
+_PACKERS: tuple[Callable[[Any], Any] | None, ...]
+_UNPACKERS: tuple[Callable[[Any], Any] | None, ...]
+_PACKERS, _UNPACKERS = zip(
+    *(_codecs().get(name, (None, None)) for name in _CARD_FIELDS), strict=True
+)
+_LEGALITIES_POSITION = _CARD_FIELDS.index("legalities")
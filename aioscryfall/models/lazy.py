@@ -0,0 +1,202 @@
+"""Lazily decoded representation of ScryCard objects, for fast decoding of many cards."""
+
+import datetime as dt
+import functools
+from decimal import Decimal
+from uuid import UUID
+
+import msgspec
+from msgspec import Raw, Struct
+
+from .cards import (
+    ScryCard,
+    ScryCardBorderColor,
+    ScryCardFace,
+    ScryCardFinish,
+    ScryCardFrame,
+    ScryCardFrameEffect,
+    ScryCardImageStatus,
+    ScryCardLayout,
+    ScryCardLegality,
+    ScryCardPreviewBlock,
+    ScryCardRarity,
+    ScryCardSecurityStamp,
+    ScryRelatedCard,
+)
+from .common import ScryColor, ScryGame
+
+_NULL = Raw(b"null")
+
+_card_faces_decoder = msgspec.json.Decoder(list[ScryCardFace] | None)
+_all_parts_decoder = msgspec.json.Decoder(list[ScryRelatedCard] | None)
+_legalities_decoder = msgspec.json.Decoder(dict[str, ScryCardLegality])
+_prices_decoder = msgspec.json.Decoder(dict[str, Decimal | None] | None)
+_uris_decoder = msgspec.json.Decoder(dict[str, str] | None)
+
+
+class LazyScryCard(
+    Struct,
+    tag_field="object",
+    tag="card",
+    kw_only=True,
+    omit_defaults=True,
+    dict=True,
+    rename={
+        "id_": "id",
+        "set_": "set",
+        "raw_all_parts": "all_parts",
+        "raw_card_faces": "card_faces",
+        "raw_legalities": "legalities",
+        "raw_image_uris": "image_uris",
+        "raw_prices": "prices",
+        "raw_purchase_uris": "purchase_uris",
+        "raw_related_uris": "related_uris",
+    },
+):
+    """A LazyScryCard is a ScryCard whose heavy sub-objects are decoded on first access.
+
+    card_faces, all_parts, legalities, prices, image_uris, purchase_uris and related_uris are
+    kept as raw JSON (in the raw_ fields) when decoding, and only decoded, then cached, when
+    their attributes are first read. Encoding a LazyScryCard writes the raw JSON back as is.
+    The raw JSON is copied out of the decoded input, so cards do not keep it alive.
+
+    LazyScryCard can be passed as the projection of search, get_collection and
+    fetch_contents; use to_card to convert to a ScryCard.
+    """
+
+    # Core Card Fields
+    arena_id: int | None = None
+    id_: UUID
+    lang: str
+    mtgo_id: int | None = None
+    mtgo_foil_id: int | None = None
+    multiverse_ids: list[int] | None = None
+    tcgplayer_id: int | None = None
+    tcgplayer_etched_id: int | None = None
+    cardmarket_id: int | None = None
+    oracle_id: UUID | None = None
+    prints_search_uri: str
+    rulings_uri: str
+    scryfall_uri: str
+    uri: str
+    # Gameplay Fields
+    raw_all_parts: Raw = _NULL
+    raw_card_faces: Raw = _NULL
+    cmc: float | None = None
+    colors: list[ScryColor] | None = None
+    color_identity: list[ScryColor]
+    color_indicator: list[ScryColor] | None = None
+    edhrec_rank: int | None = None
+    foil: bool
+    hand_modifier: str | None = None
+    keywords: list[str]
+    layout: ScryCardLayout
+    raw_legalities: Raw
+    life_modifier: str | None = None
+    loyalty: str | None = None
+    mana_cost: str | None = None
+    name: str
+    nonfoil: bool
+    oracle_text: str | None = None
+    oversized: bool
+    penny_rank: int | None = None
+    power: str | None = None
+    produced_mana: list[str] | None = None
+    reserved: bool
+    toughness: str | None = None
+    type_line: str | None = None
+    # Print Fields
+    artist: str | None = None
+    artist_ids: list[UUID] | None = None
+    booster: bool
+    border_color: ScryCardBorderColor
+    card_back_id: UUID | None = None
+    collector_number: str
+    content_warning: bool | None = None
+    digital: bool
+    finishes: list[ScryCardFinish]
+    flavor_name: str | None = None
+    flavor_text: str | None = None
+    frame_effect: ScryCardFrameEffect | None = None
+    frame_effects: list[ScryCardFrameEffect] | None = None
+    frame: ScryCardFrame
+    full_art: bool
+    games: list[ScryGame]
+    highres_image: bool
+    illustration_id: UUID | None = None
+    image_status: ScryCardImageStatus
+    raw_image_uris: Raw = _NULL
+    raw_prices: Raw
+    printed_name: str | None = None
+    printed_text: str | None = None
+    printed_type_line: str | None = None
+    promo: bool
+    promo_types: list[str] | None = None
+    raw_purchase_uris: Raw = _NULL
+    rarity: ScryCardRarity
+    raw_related_uris: Raw = _NULL
+    released_at: dt.date
+    reprint: bool
+    scryfall_set_uri: str
+    set_name: str
+    set_search_uri: str
+    set_type: str
+    set_uri: str
+    set_: str
+    set_id: UUID
+    story_spotlight: bool
+    textless: bool
+    variation: bool
+    variation_of: UUID | None = None
+    security_stamp: ScryCardSecurityStamp | None = None
+    watermark: str | None = None
+    preview: ScryCardPreviewBlock | None = None
+
+    def __post_init__(self) -> None:
+        """Copy the raw fields, which are otherwise views into the whole decoded input."""
+        self.raw_all_parts = self.raw_all_parts.copy()
+        self.raw_card_faces = self.raw_card_faces.copy()
+        self.raw_legalities = self.raw_legalities.copy()
+        self.raw_image_uris = self.raw_image_uris.copy()
+        self.raw_prices = self.raw_prices.copy()
+        self.raw_purchase_uris = self.raw_purchase_uris.copy()
+        self.raw_related_uris = self.raw_related_uris.copy()
+
+    @functools.cached_property
+    def all_parts(self) -> list[ScryRelatedCard] | None:
+        """Closely related cards, decoded on first access."""
+        return _all_parts_decoder.decode(self.raw_all_parts)
+
+    @functools.cached_property
+    def card_faces(self) -> list[ScryCardFace] | None:
+        """Card faces, decoded on first access."""
+        return _card_faces_decoder.decode(self.raw_card_faces)
+
+    @functools.cached_property
+    def legalities(self) -> dict[str, ScryCardLegality]:
+        """Legalities by format, decoded on first access."""
+        return _legalities_decoder.decode(self.raw_legalities)
+
+    @functools.cached_property
+    def image_uris(self) -> dict[str, str] | None:
+        """Image URIs, decoded on first access."""
+        return _uris_decoder.decode(self.raw_image_uris)
+
+    @functools.cached_property
+    def prices(self) -> dict[str, Decimal | None] | None:
+        """Prices, decoded on first access."""
+        return _prices_decoder.decode(self.raw_prices)
+
+    @functools.cached_property
+    def purchase_uris(self) -> dict[str, str] | None:
+        """Purchase URIs, decoded on first access."""
+        return _uris_decoder.decode(self.raw_purchase_uris)
+
+    @functools.cached_property
+    def related_uris(self) -> dict[str, str] | None:
+        """Related URIs, decoded on first access."""
+        return _uris_decoder.decode(self.raw_related_uris)
+
+    def to_card(self) -> ScryCard:
+        """Convert to a ScryCard, decoding every field."""
+        return ScryCard(**{name: getattr(self, name) for name in ScryCard.__struct_fields__})
@@ -1,7 +1,7 @@
 """Models for https://scryfall.com/docs/api/lists objects."""
 
 import dataclasses
-from typing import Generic, Self, TypeAlias, TypeVar, cast
+from typing import Any, Generic, Self, TypeAlias, TypeVar, cast
 
 from msgspec import Struct
 
@@ -28,8 +28,8 @@ ScryListable: TypeAlias = (
 class RawScryList(Struct, tag_field="object", tag="list", kw_only=True, omit_defaults=True):
     """A RawScryList object represents an untyped, requested sequence of other objects.
 
-    Due to a lack of support for generics in msgspec, this class is used for decoding
-    of all possible list types, even if we might know the type of the list elements.
+    This class is used for decoding lists whose element type is not known in advance. Lists
+    of a known element type are decoded directly against that type (see serde.decode_json).
     """
 
     data: list[ScryListable]
@@ -37,17 +37,18 @@ class RawScryList(Struct, tag_field="object", tag="list", kw_only=True, omit_def
     next_page: str | None = None
     total_cards: int | None = None
     warnings: list[str] | None = None
+    not_found: list[dict[str, Any]] | None = None
 
 
-_T = TypeVar("_T", bound=ScryListable)
+# Lists may also hold projections of the listable types (see serde.projection)
+_T = TypeVar("_T", bound=Struct)
 
 
 @dataclasses.dataclass(kw_only=True)
 class ScryList(Generic[_T]):
     """A ScryList object represents a typed, requested sequence of other objects.
 
-    This class is a wrapper around RawScryList that provides the ability to specify
-    static type information at time of writing.
+    This class provides the ability to specify static type information at time of writing.
     """
 
     data: list[_T]
@@ -55,6 +56,7 @@ class ScryList(Generic[_T]):
     next_page: str | None = None
     total_cards: int | None = None
     warnings: list[str] | None = None
+    not_found: list[dict[str, Any]] | None = None
 
     @classmethod
     def from_raw(cls, raw: "RawScryList") -> Self:
@@ -65,4 +67,5 @@ class ScryList(Generic[_T]):
             next_page=raw.next_page,
             total_cards=raw.total_cards,
             warnings=raw.warnings,
+            not_found=raw.not_found,
         )
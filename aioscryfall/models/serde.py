@@ -1,36 +1,218 @@
 """Serialization and deserialization methods for Scryfall models."""
 
+import functools
+import types
 import typing
-from contextvars import ContextVar
-from typing import TYPE_CHECKING, TypeVar
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import msgspec
 
-from .lists import RawScryList, ScryList
+from .bulk_data import ScryBulkData
+from .cards import ScryCard
+from .catalogs import ScryCatalog
+from .errors import ScryError
+from .lists import RawScryList, ScryList, ScryListable
+from .migrations import ScryMigration
+from .rulings import ScryRuling
+from .sets import ScrySet
+from .symbols import ScryCardSymbol, ScryManaCost
 
 if TYPE_CHECKING:
     from msgspec.json import Decoder
 
-DECODER_CACHE: ContextVar[dict[type, "Decoder"]] = ContextVar("DECODER_CACHE", default={})
+# Decoders by the type they decode, shared by every thread and task in the process. Entries
+# are only ever added, and msgspec decoders are thread-safe, so no locking is needed.
+_DECODERS: dict[Any, "Decoder"] = {}
 
+_ENCODER = msgspec.json.Encoder()
 
-def _get_decoder(type_: type) -> "Decoder":
-    """Create or retrieve a cached msgspec JSON decoder for a given type."""
-    cache = DECODER_CACHE.get()
-    if type_ not in cache:
-        cache = cache.copy()
-        cache[type_] = msgspec.json.Decoder(type_)
-        DECODER_CACHE.set(cache)
-    return cache[type_]
+# Every type decoded from Scryfall API responses and bulk data (the bulk data handler decodes
+# ScryListable elements, or lists of them, unless given a projection)
+_MODEL_TYPES: tuple[Any, ...] = (
+    ScryBulkData,
+    ScryCard,
+    ScryCatalog,
+    ScryError,
+    ScryManaCost,
+    ScryMigration,
+    ScryRuling,
+    ScrySet,
+    ScryListable,
+    list[ScryCard],
+    list[ScryListable],
+    list[ScryRuling],
+    ScryList[ScryBulkData],
+    ScryList[ScryCard],
+    ScryList[ScryCardSymbol],
+    ScryList[ScryMigration],
+    ScryList[ScryRuling],
+    ScryList[ScrySet],
+)
+
+
+def _get_decoder(type_: Any) -> "Decoder":
+    """Create or retrieve the shared msgspec JSON decoder for a given type."""
+    decoder = _DECODERS.get(type_)
+    if decoder is None:
+        # If two threads race to create a decoder, both get whichever was stored first
+        decoder = _DECODERS.setdefault(type_, msgspec.json.Decoder(_decoded_type(type_)))
+    return decoder
+
+
+def _decoded_type(type_: Any) -> Any:
+    """Get the type that JSON data is decoded as, to decode a given type."""
+    if typing.get_origin(type_) is ScryList:
+        (item_type,) = typing.get_args(type_)
+        if isinstance(item_type, type):
+            return _list_type(item_type)
+        # Without a concrete item type (e.g. a type variable), decode any listable type
+        return RawScryList
+    return type_
+
+
+def warmup(extra_types: Iterable[Any] = ()) -> None:
+    """Create the decoders for every model type, and any extra types, ahead of first use.
+
+    Decoders are otherwise created on first use, which is slow for large models like
+    ScryCard; call this at startup to keep that cost out of request handling.
+    """
+    for type_ in (*_MODEL_TYPES, *extra_types):
+        _get_decoder(type_)
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode an object as JSON using the shared msgspec encoder."""
+    return _ENCODER.encode(obj)
 
 
 _T = TypeVar("_T")
 
 
-def decode_json(data: bytes, type_: type[_T]) -> _T:
+def projection(type_: type[msgspec.Struct], fields: Iterable[str]) -> type[msgspec.Struct]:
+    """Get a Struct type that decodes only the named fields of a model type.
+
+    Fields are named by their attribute names (e.g. id_, set_) and keep their types. All other
+    fields are skipped at decode time, which is much faster and uses far less memory than
+    decoding the full model. Projection types are cached, so they can be compared by identity,
+    and can be pickled in any process that has created the same projection.
+    """
+    return _projection(type_, _field_names(fields))
+
+
+def _field_names(fields: Iterable[str]) -> tuple[str, ...]:
+    """Get a tuple of field names, from a single name or an iterable of names."""
+    return (fields,) if isinstance(fields, str) else tuple(fields)
+
+
+# Projection types are registered here by model and field names, so that they (and their
+# instances) can be pickled in any process that has created the same projection
+_projections = types.SimpleNamespace()
+
+
+@functools.cache
+def _projection(type_: type[msgspec.Struct], fields: tuple[str, ...]) -> type[msgspec.Struct]:
+    """Create a projection type; see projection."""
+    field_infos = {info.name: info for info in msgspec.structs.fields(type_)}
+    unknown = [name for name in fields if name not in field_infos]
+    if unknown:
+        msg = f"Unknown {type_.__name__} fields: {', '.join(unknown)}."
+        raise ValueError(msg)
+    struct_fields: list[tuple[Any, ...]] = []
+    for name in fields:
+        info = field_infos[name]
+        if info.required:
+            struct_fields.append((name, info.type))
+        else:
+            struct_fields.append((name, info.type, info.default))
+    projection_type = msgspec.defstruct(
+        f"{type_.__name__}Projection",
+        struct_fields,
+        kw_only=True,
+        omit_defaults=True,
+        rename={name: field_infos[name].encode_name for name in fields},
+    )
+    key = f"{type_.__name__}({','.join(fields)})"
+    setattr(_projections, key, projection_type)
+    projection_type.__qualname__ = f"_projections.{key}"
+    return projection_type
+
+
+def projected_type(
+    type_: type[msgspec.Struct], projection: type[msgspec.Struct] | Iterable[str] | None
+) -> type[msgspec.Struct]:
+    """Get the type to decode a model type as: type_ itself, a Struct type, or a field list."""
+    if projection is None:
+        return type_
+    if isinstance(projection, type):
+        return projection
+    return _projection(type_, _field_names(projection))
+
+
+@functools.cache
+def _list_type(item_type: type[msgspec.Struct]) -> type[msgspec.Struct]:
+    """Create a Struct type for decoding Scryfall lists of a given item type.
+
+    Decoding against a concrete item type avoids dispatching each item on its object tag, and
+    validates that every item is of that type.
+    """
+    return msgspec.defstruct(
+        f"{item_type.__name__}List",
+        [
+            ("data", list[item_type]),  # type: ignore[valid-type]
+            ("has_more", bool | None, None),
+            ("next_page", str | None, None),
+            ("total_cards", int | None, None),
+            ("warnings", list[str] | None, None),
+            ("not_found", list[dict[str, Any]] | None, None),
+        ],
+        tag_field="object",
+        tag="list",
+        kw_only=True,
+    )
+
+
+def decode_json(data: bytes | bytearray, type_: type[_T]) -> _T:
     """Decode JSON data using msgspec with some custom code for handling Scryfall lists."""
+    decoded = _get_decoder(type_).decode(data)
     if typing.get_origin(type_) is ScryList:
-        raw_list = _get_decoder(RawScryList).decode(data)
-        # We know that type_ is a ScryList[T] here, so we can ignore the false positive type error
-        return type_.from_raw(raw_list)  # type: ignore
-    return _get_decoder(type_).decode(data)
+        if isinstance(decoded, RawScryList):
+            # We know that type_ is a ScryList[T] here, so we can ignore the false positive
+            return type_.from_raw(decoded)  # type: ignore
+        return type_(**msgspec.structs.asdict(decoded))
+    return decoded
+
+
+class JSONArrayLineSplitter:
+    """Incrementally split a line-delimited JSON array of objects into its encoded elements.
+
+    Scryfall bulk data files are a single top-level JSON array with one object per line,
+    which allows elements to be decoded as they arrive instead of buffering the whole file.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+
+    @staticmethod
+    def _strip_line(line: bytes) -> bytes:
+        """Strip array delimiters and whitespace from a line, leaving only the element."""
+        line = line.strip()
+        if line.startswith(b"["):
+            line = line[1:].lstrip()
+        if line.endswith(b","):
+            line = line[:-1].rstrip()
+        if line.endswith(b"]"):
+            line = line[:-1].rstrip()
+        return line
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk of data, returning the elements from any completed lines."""
+        *lines, remainder = (self._buffer + chunk).split(b"\n")
+        self._buffer = remainder
+        return [element for line in lines if (element := self._strip_line(line))]
+
+    def close(self) -> list[bytes]:
+        """Flush the final, unterminated line, returning its element if it has one."""
+        element = self._strip_line(self._buffer)
+        self._buffer = b""
+        return [element] if element else []
@@ -0,0 +1,77 @@
+"""Resumable iteration over paged Scryfall API results."""
+
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import msgspec
+
+if TYPE_CHECKING:
+    from aioscryfall.models.lists import ScryList
+
+_T = TypeVar("_T", bound=msgspec.Struct)
+
+
+class Cursor(msgspec.Struct, frozen=True, kw_only=True, omit_defaults=True):
+    """A saved position in paged results, from which iteration can be resumed.
+
+    page_url is the URL of the page being iterated over, or None for the first page of the
+    results (and for card collections, whose pages have no URL). page_number is the number of
+    pages before it and position the number of its items that were already yielded.
+
+    Cursors are msgspec Structs, so they can be saved with msgspec.json.encode and restored
+    with serde.decode_json.
+    """
+
+    page_url: str | None = None
+    page_number: int = 0
+    position: int = 0
+
+
+class PagedIterator(AsyncIterator[_T], Generic[_T]):
+    """PagedIterator iterates over the items of a sequence of pages, tracking its position.
+
+    At any time, cursor is the position of the next item to be yielded; passing it back to
+    the method that created the iterator resumes iteration from that item.
+    """
+
+    def __init__(self, pages: "AsyncIterator[ScryList[_T]]", cursor: Cursor | None = None) -> None:
+        cursor = cursor or Cursor()
+        self._pages = pages
+        self._items: list[_T] = []
+        self._started = False
+        self._page_url = cursor.page_url
+        self._next_page_url: str | None = None
+        self._page_number = cursor.page_number
+        self._position = cursor.position
+
+    @property
+    def cursor(self) -> Cursor:
+        """Position of the next item."""
+        return Cursor(
+            page_url=self._page_url, page_number=self._page_number, position=self._position
+        )
+
+    def __aiter__(self) -> "PagedIterator[_T]":
+        """Get the iterator itself."""
+        return self
+
+    async def __anext__(self) -> _T:
+        """Get the next item, fetching the next page if needed."""
+        while self._position >= len(self._items):
+            page = await anext(self._pages)
+            if self._started:
+                self._page_url = self._next_page_url
+                self._page_number += 1
+                self._position = 0
+            self._started = True
+            self._items = page.data
+            self._next_page_url = page.next_page
+        item = self._items[self._position]
+        self._position += 1
+        return item
+
+    async def aclose(self) -> None:
+        """Stop iterating, cancelling any pages still being fetched."""
+        aclose = getattr(self._pages, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,51 @@
+"""Retry policy for transient Scryfall API request failures."""
+
+import asyncio
+import random
+from collections.abc import Collection
+
+import aiohttp
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS: tuple[type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryPolicy:
+    """RetryPolicy describes which failed requests to retry, and how long to wait first.
+
+    A request is attempted at most max_attempts times. Requests are retried when they fail
+    with one of retry_exceptions or receive a response with one of retry_statuses. Before
+    retry n (starting at 1), we wait for a random delay of up to
+    min(max_delay, base_delay * 2 ** (n - 1)) seconds ("full jitter"), or for the response's
+    Retry-After delay if that is longer.
+
+    Throttled (429) responses are waited out by the client's rate limiter instead.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        *,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: tuple[type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS,
+    ) -> None:
+        if max_attempts < 1:
+            msg = "max_attempts must be at least 1."
+            raise ValueError(msg)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = retry_exceptions
+
+    def delay(self, retry: int, retry_after: float | None = None) -> float:
+        """Get the number of seconds to wait before a retry."""
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (retry - 1))
+        backoff = random.uniform(0, ceiling)  # noqa: S311 - not for cryptography
+        return backoff if retry_after is None else max(backoff, retry_after)
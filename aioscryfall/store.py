@@ -0,0 +1,483 @@
+"""Columnar on-disk storage for ScryCard objects.
+
+A card store is a directory containing one memory-mapped column per ScryCard field, so a
+store can be opened without decoding anything and cards are only materialized when read.
+
+Columns come in three kinds:
+
+- dictionary columns, for fields with few distinct values (set, rarity, layout, artist...),
+  store a 32 bit code per row indexing into a dictionary of encoded values.
+- fixed columns, for bool, int, float and UUID fields, store one fixed width binary value
+  per row, with a reserved null value for absent fields.
+- variable columns store each row's encoded value in a data file, located by a 64 bit
+  offset per row.
+
+Column files use native byte order and are not portable across architectures.
+"""
+
+import abc
+import math
+import mmap
+import operator
+import os
+import shutil
+import struct
+import tempfile
+import types
+import typing
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, BinaryIO, Self, overload
+from uuid import UUID
+
+import msgspec
+
+from aioscryfall.models.cards import ScryCard
+
+if TYPE_CHECKING:
+    from aioscryfall.client import ScryfallClient
+    from aioscryfall.models.bulk_data import ScryBulkData
+
+STORE_VERSION = 2
+
+DICTIONARY_FIELDS = frozenset(
+    {
+        "artist",
+        "border_color",
+        "card_back_id",
+        "color_identity",
+        "colors",
+        "finishes",
+        "frame",
+        "frame_effects",
+        "games",
+        "image_status",
+        "keywords",
+        "lang",
+        "layout",
+        "legalities",
+        "produced_mana",
+        "promo_types",
+        "rarity",
+        "released_at",
+        "scryfall_set_uri",
+        "security_stamp",
+        "set_",
+        "set_id",
+        "set_name",
+        "set_search_uri",
+        "set_type",
+        "set_uri",
+        "watermark",
+    }
+)
+
+_MANIFEST_FILE = "manifest.json"
+_FLUSH_ROWS = 10_000
+_CARD_FIELDS = msgspec.structs.fields(ScryCard)
+
+
+class _FixedFormat:
+    """The binary format of the values of a fixed column."""
+
+    def __init__(
+        self,
+        fmt: str,
+        null: Any,
+        pack: Callable[[Any], Any],
+        unpack: Callable[[Any], Any],
+    ) -> None:
+        self.struct = struct.Struct(fmt)
+        # Stored for absent values; never a value that Scryfall uses
+        self.null = null
+        self._pack = pack
+        self._unpack = unpack
+
+    def pack(self, value: Any) -> bytes:
+        """Pack a value, or None as the null value."""
+        return self.struct.pack(self.null if value is None else self._pack(value))
+
+    def unpack(self, packed: Any) -> Any:
+        """Unpack a value, or the null value as None."""
+        # NaN, the float null value, is not equal to itself
+        if packed == self.null or packed != packed:  # noqa: PLR0124 - NaN check
+            return None
+        return self._unpack(packed)
+
+
+_FIXED_FORMATS: dict[Any, _FixedFormat] = {
+    bool: _FixedFormat("b", -1, int, bool),
+    int: _FixedFormat("q", -(2**63), int, int),
+    float: _FixedFormat("d", math.nan, float, float),
+    UUID: _FixedFormat("16s", bytes(16), operator.attrgetter("bytes"), lambda b: UUID(bytes=b)),
+}
+
+
+def _fixed_format(field_type: Any) -> _FixedFormat | None:
+    """Get the fixed column format for a field type, if it has one."""
+    if isinstance(field_type, types.UnionType):
+        field_type, *others = (arg for arg in typing.get_args(field_type) if arg is not type(None))
+        if others:
+            return None
+    return _FIXED_FORMATS.get(field_type)
+
+
+_FIXED_FIELDS = {
+    field.name: fixed_format
+    for field in _CARD_FIELDS
+    if field.name not in DICTIONARY_FIELDS and (fixed_format := _fixed_format(field.type))
+}
+
+
+class _Manifest(msgspec.Struct, kw_only=True):
+    """Description of the contents of a card store directory."""
+
+    version: int
+    rows: int
+    dictionary_columns: list[str]
+    fixed_columns: list[str]
+    variable_columns: list[str]
+
+
+class CardStoreWriter:
+    """Incrementally write ScryCard objects to a new card store directory.
+
+    The store is written to a temporary sibling directory, which replaces any store at path
+    when the writer is closed, so stores that are still open keep their files. Used as a
+    context manager, the writer discards the new store if the block raises.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.path.abspath(path)
+        # Only ever replace a card store or an empty directory, never unrelated files
+        is_empty_dir = os.path.isdir(self.path) and not os.listdir(self.path)
+        is_store = os.path.exists(os.path.join(self.path, _MANIFEST_FILE))
+        if os.path.lexists(self.path) and not (is_empty_dir or is_store):
+            msg = f"Will not replace {self.path}, which is not a card store."
+            raise FileExistsError(msg)
+        parent, name = os.path.split(self.path)
+        os.makedirs(parent, exist_ok=True)
+        self._temp_path = tempfile.mkdtemp(prefix=f".{name}-", dir=parent)
+        self._encoder = msgspec.json.Encoder()
+        self._rows = 0
+        self._files: list[BinaryIO] = []
+        self._codes: dict[str, array[int]] = {}
+        self._dictionaries: dict[str, dict[bytes, int]] = {}
+        self._records: dict[str, bytearray] = {}
+        self._offsets: dict[str, array[int]] = {}
+        self._data_sizes: dict[str, int] = {}
+        self._code_files: dict[str, BinaryIO] = {}
+        self._record_files: dict[str, BinaryIO] = {}
+        self._offset_files: dict[str, BinaryIO] = {}
+        self._data_files: dict[str, BinaryIO] = {}
+        for field in _CARD_FIELDS:
+            if field.name in DICTIONARY_FIELDS:
+                self._codes[field.name] = array("I")
+                self._dictionaries[field.name] = {}
+                self._code_files[field.name] = self._open(f"{field.name}.codes")
+            elif field.name in _FIXED_FIELDS:
+                self._records[field.name] = bytearray()
+                self._record_files[field.name] = self._open(f"{field.name}.fixed")
+            else:
+                self._offsets[field.name] = array("Q", [0])
+                self._data_sizes[field.name] = 0
+                self._offset_files[field.name] = self._open(f"{field.name}.offsets")
+                self._data_files[field.name] = self._open(f"{field.name}.data")
+
+    def _open(self, filename: str) -> BinaryIO:
+        path = os.path.join(self._temp_path, filename)
+        file = open(path, "wb")  # noqa: SIM115 - closed in close()
+        self._files.append(file)
+        return file
+
+    def append(self, card: ScryCard) -> None:
+        """Append a card as the next row of the store."""
+        for field in _CARD_FIELDS:
+            value = getattr(card, field.name)
+            if field.name in _FIXED_FIELDS:
+                self._records[field.name] += _FIXED_FIELDS[field.name].pack(value)
+                continue
+            absent = value is None and not field.required
+            encoded = b"" if absent else self._encoder.encode(value)
+            if field.name in DICTIONARY_FIELDS:
+                code = 0
+                if not absent:
+                    dictionary = self._dictionaries[field.name]
+                    code = dictionary.setdefault(encoded, len(dictionary) + 1)
+                self._codes[field.name].append(code)
+            else:
+                self._data_files[field.name].write(encoded)
+                self._data_sizes[field.name] += len(encoded)
+                self._offsets[field.name].append(self._data_sizes[field.name])
+        self._rows += 1
+        if self._rows % _FLUSH_ROWS == 0:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write buffered codes and offsets out to their column files."""
+        for name, codes in self._codes.items():
+            codes.tofile(self._code_files[name])
+            del codes[:]
+        for name, records in self._records.items():
+            self._record_files[name].write(records)
+            records.clear()
+        for name, offsets in self._offsets.items():
+            offsets.tofile(self._offset_files[name])
+            del offsets[:]
+
+    def close(self) -> None:
+        """Finish writing the store, including its dictionaries and manifest."""
+        self._flush()
+        self._close_files()
+        for name, dictionary in self._dictionaries.items():
+            with open(os.path.join(self._temp_path, f"{name}.dictionary"), "wb") as file:
+                file.write(b"[" + b",".join(dictionary) + b"]")
+        manifest = _Manifest(
+            version=STORE_VERSION,
+            rows=self._rows,
+            dictionary_columns=list(self._codes),
+            fixed_columns=list(self._records),
+            variable_columns=list(self._offsets),
+        )
+        with open(os.path.join(self._temp_path, _MANIFEST_FILE), "wb") as file:
+            file.write(self._encoder.encode(manifest))
+
+        # Move any old store aside rather than overwriting its files, which may still be
+        # mapped by open stores, then rename the new store into place
+        parent, name = os.path.split(self.path)
+        old_path = None
+        if os.path.exists(self.path):
+            old_path = tempfile.mkdtemp(prefix=f".{name}-", dir=parent)
+            os.replace(self.path, old_path)
+        os.replace(self._temp_path, self.path)
+        if old_path is not None:
+            shutil.rmtree(old_path, ignore_errors=True)
+
+    def discard(self) -> None:
+        """Abandon the new store, leaving any store at path untouched."""
+        self._close_files()
+        shutil.rmtree(self._temp_path, ignore_errors=True)
+
+    def _close_files(self) -> None:
+        for file in self._files:
+            file.close()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes on exit, or discards the store if an error is raised."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close on context exit, or discard the store if an error was raised."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class _Column(abc.ABC):
+    """A single memory-mapped column of a card store."""
+
+    def __init__(self, path: str, field: msgspec.structs.FieldInfo) -> None:
+        self.field = field
+        self.key = b'"' + field.encode_name.encode() + b'":'
+        self._path = path
+        self._maps: list[mmap.mmap] = []
+
+    def _map(self, filename: str) -> memoryview:
+        with open(os.path.join(self._path, filename), "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return memoryview(b"")
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return memoryview(mapped)
+
+    @abc.abstractmethod
+    def fragment(self, row: int) -> bytes:
+        """Get the encoded value for a row, or an empty string if the field is absent."""
+
+    @abc.abstractmethod
+    def values(self) -> Iterator[Any]:
+        """Iterate over the decoded values of every row."""
+
+    @abc.abstractmethod
+    def release(self) -> None:
+        """Release the views into the column's files."""
+
+    def close(self) -> None:
+        """Unmap the column's files."""
+        self.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._maps.clear()
+
+
+class _DictionaryColumn(_Column):
+    """A dictionary encoded column."""
+
+    def __init__(self, path: str, field: msgspec.structs.FieldInfo) -> None:
+        super().__init__(path, field)
+        self._codes = self._map(f"{field.name}.codes").cast("I")
+        decoder: msgspec.json.Decoder[list[Any]] = msgspec.json.Decoder(list[field.type])  # type: ignore[name-defined]
+        with open(os.path.join(path, f"{field.name}.dictionary"), "rb") as file:
+            values = decoder.decode(file.read())
+        encoder = msgspec.json.Encoder()
+        self._values: list[Any] = [field.default, *values]
+        self._fragments: list[bytes] = [b"", *(encoder.encode(value) for value in values)]
+
+    def fragment(self, row: int) -> bytes:
+        return self._fragments[self._codes[row]]
+
+    def values(self) -> Iterator[Any]:
+        values = self._values
+        return (values[code] for code in self._codes)
+
+    def release(self) -> None:
+        self._codes.release()
+
+
+class _FixedColumn(_Column):
+    """A column of fixed width values."""
+
+    def __init__(self, path: str, field: msgspec.structs.FieldInfo) -> None:
+        super().__init__(path, field)
+        self._format = _FIXED_FIELDS[field.name]
+        self._encoder = msgspec.json.Encoder()
+        self._records = self._map(f"{field.name}.fixed")
+
+    def fragment(self, row: int) -> bytes:
+        fixed_format = self._format
+        (packed,) = fixed_format.struct.unpack_from(self._records, row * fixed_format.struct.size)
+        value = fixed_format.unpack(packed)
+        return b"" if value is None else self._encoder.encode(value)
+
+    def values(self) -> Iterator[Any]:
+        unpack = self._format.unpack
+        return (unpack(packed) for (packed,) in self._format.struct.iter_unpack(self._records))
+
+    def release(self) -> None:
+        self._records.release()
+
+
+class _VariableColumn(_Column):
+    """A column of variable length values."""
+
+    def __init__(self, path: str, field: msgspec.structs.FieldInfo) -> None:
+        super().__init__(path, field)
+        self._decoder: msgspec.json.Decoder[Any] = msgspec.json.Decoder(field.type)
+        self._offsets = self._map(f"{field.name}.offsets").cast("Q")
+        self._data = self._map(f"{field.name}.data")
+
+    def fragment(self, row: int) -> bytes:
+        return self._data[self._offsets[row] : self._offsets[row + 1]].tobytes()
+
+    def values(self) -> Iterator[Any]:
+        for row in range(len(self._offsets) - 1):
+            fragment = self.fragment(row)
+            yield self._decoder.decode(fragment) if fragment else self.field.default
+
+    def release(self) -> None:
+        self._offsets.release()
+        self._data.release()
+
+
+class CardStore(Sequence[ScryCard]):
+    """A read-only, memory-mapped columnar store of ScryCard objects.
+
+    Cards are decoded from their columns on access; use values() to scan individual fields
+    without materializing whole cards.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, _MANIFEST_FILE), "rb") as file:
+            manifest = msgspec.json.decode(file.read(), type=_Manifest)
+        if manifest.version != STORE_VERSION:
+            msg = f"Unsupported card store version: {manifest.version}"
+            raise ValueError(msg)
+        self._rows = manifest.rows
+        fields = {field.name: field for field in _CARD_FIELDS}
+        self._columns: dict[str, _Column] = {}
+        for name in manifest.dictionary_columns:
+            self._columns[name] = _DictionaryColumn(self.path, fields[name])
+        for name in manifest.fixed_columns:
+            self._columns[name] = _FixedColumn(self.path, fields[name])
+        for name in manifest.variable_columns:
+            self._columns[name] = _VariableColumn(self.path, fields[name])
+        self._decoder = msgspec.json.Decoder(ScryCard)
+
+    @classmethod
+    def build(cls, path: str | os.PathLike[str], cards: Iterable[ScryCard]) -> Self:
+        """Write cards to a new card store and open it."""
+        with CardStoreWriter(path) as writer:
+            for card in cards:
+                writer.append(card)
+        return cls(path)
+
+    @classmethod
+    async def from_bulk_data(
+        cls,
+        client: "ScryfallClient",
+        bulk_data_item: "ScryBulkData",
+        path: str | os.PathLike[str],
+    ) -> Self:
+        """Download the cards in a bulk data item into a new card store and open it."""
+        with CardStoreWriter(path) as writer:
+            async for item in client.bulk_data.iter_contents(bulk_data_item):
+                if isinstance(item, ScryCard):
+                    writer.append(item)
+        return cls(path)
+
+    def __len__(self) -> int:
+        """Get the number of cards in the store."""
+        return self._rows
+
+    @overload
+    def __getitem__(self, index: int) -> ScryCard:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ScryCard]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> ScryCard | list[ScryCard]:
+        """Materialize the card(s) at the given row index or slice."""
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(self._rows))]
+        row = index + self._rows if index < 0 else index
+        if not 0 <= row < self._rows:
+            msg = "CardStore index out of range"
+            raise IndexError(msg)
+        parts = [
+            column.key + fragment
+            for column in self._columns.values()
+            if (fragment := column.fragment(row))
+        ]
+        return self._decoder.decode(b"{" + b",".join(parts) + b"}")
+
+    def values(self, field_name: str) -> Iterator[Any]:
+        """Iterate over the values of a single ScryCard field, in row order."""
+        return self._columns[field_name].values()
+
+    def close(self) -> None:
+        """Unmap the store's column files."""
+        for column in self._columns.values():
+            column.close()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close on context exit."""
+        self.close()
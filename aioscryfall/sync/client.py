@@ -2,24 +2,147 @@
 
 import asyncio
 import contextlib
+import queue
+import threading
+import weakref
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterator
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Literal, Self, TypeVar
 
 import aiohttp
 
 from aioscryfall.client import ScryfallClient
+from aioscryfall.limiter import AdaptiveLimiter
 from aioscryfall.sync.handlers.bulk_data import BulkDataSyncHandler
 from aioscryfall.sync.handlers.cards import CardsSyncHandler
 from aioscryfall.sync.handlers.catalogs import CatalogsSyncHandler
 from aioscryfall.sync.handlers.migrations import MigrationsSyncHandler
 from aioscryfall.sync.handlers.rulings import RulingsSyncHandler
 from aioscryfall.sync.handlers.symbols import SymbolsSyncHandler
+from aioscryfall.transport import create_session
 
+if TYPE_CHECKING:
+    from aioscryfall.cache import BulkDataCache, MemoryCache, ResponseCache
+    from aioscryfall.index import CardIndex
+    from aioscryfall.retry import RetryPolicy
 
-class ScryfallSyncClient:
-    """ScryfallSyncClient is a synchronous client for the Scryfall API."""
+_T = TypeVar("_T")
+
+# Marks the end of the items passed from the background event loop to an iterator
+_DONE = object()
+
+
+class _Raised:
+    """An exception passed from the background event loop to an iterator."""
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+
+
+async def _cancel_tasks() -> None:
+    """Cancel every other task on the running event loop and wait for them to finish."""
+    tasks = asyncio.all_tasks() - {asyncio.current_task()}
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _Resources:
+    """The event loops, sessions and async clients owned by a ScryfallSyncClient.
+
+    These are kept apart from the client so that they can be cleaned up by a finalizer.
+    """
 
     def __init__(self) -> None:
-        self._sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
-        self._async_clients: dict[asyncio.AbstractEventLoop, ScryfallClient] = {}
+        self.lock = threading.Lock()
+        self.sessions: dict[asyncio.AbstractEventLoop, aiohttp.ClientSession] = {}
+        self.async_clients: dict[asyncio.AbstractEventLoop, ScryfallClient] = {}
+        # Per-thread event loops created by the client, rather than by the caller
+        self.thread_loops: list[asyncio.AbstractEventLoop] = []
+        self.background_loop: asyncio.AbstractEventLoop | None = None
+        self.background_thread: threading.Thread | None = None
+
+    def get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting it if needed."""
+        with self.lock:
+            if self.background_loop is None:
+                loop = asyncio.new_event_loop()
+                self.background_thread = threading.Thread(
+                    target=loop.run_forever, name="aioscryfall-sync", daemon=True
+                )
+                self.background_thread.start()
+                self.background_loop = loop
+            return self.background_loop
+
+    def close(self) -> None:
+        """Close every session and event loop, stopping the background event loop if running."""
+        with self.lock:
+            sessions = list(self.sessions.items())
+            self.sessions.clear()
+            self.async_clients.clear()
+            thread_loops, self.thread_loops = self.thread_loops, []
+            background_loop, self.background_loop = self.background_loop, None
+            background_thread, self.background_thread = self.background_thread, None
+
+        if background_loop is not None and background_loop.is_running():
+            # Stop the producers of iterators that were abandoned before they finished
+            asyncio.run_coroutine_threadsafe(_cancel_tasks(), background_loop).result()
+        for loop, session in sessions:
+            if session.closed or loop.is_closed():
+                continue
+            if loop.is_running():
+                closing = asyncio.run_coroutine_threadsafe(session.close(), loop)
+                if loop is background_loop:
+                    closing.result()
+            else:
+                loop.run_until_complete(session.close())
+        for loop in thread_loops:
+            if not loop.is_running():
+                loop.close()
+        if background_loop is not None and background_thread is not None:
+            background_loop.call_soon_threadsafe(background_loop.stop)
+            background_thread.join()
+            background_loop.close()
+
+
+class ScryfallSyncClient:
+    """ScryfallSyncClient is a synchronous client for the Scryfall API.
+
+    By default, every call runs on one persistent event loop in a daemon thread, so the
+    client can be shared by any number of threads, which then share one rate limiter and
+    one connection pool. Iterators are fed through a queue of up to iterator_buffer items,
+    so pages keep being fetched while the caller processes items.
+
+    If background_loop is unset, each calling thread instead gets its own event loop and
+    session, and async work only progresses while a call is being made. Threads still
+    share one rate limiter.
+
+    Call close(), or use the client as a context manager, to release its resources.
+    """
+
+    def __init__(  # noqa: PLR0913 - keyword-only client options
+        self,
+        *,
+        card_index: "CardIndex | None" = None,
+        response_cache: "ResponseCache | None" = None,
+        memory_cache: "MemoryCache | None" = None,
+        bulk_data_cache: "BulkDataCache | Literal[False] | None" = None,
+        limiter: "AdaptiveLimiter | None" = None,
+        retry_policy: "RetryPolicy | None" = None,
+        background_loop: bool = True,
+        iterator_buffer: int = 1024,
+    ) -> None:
+        self.card_index = card_index
+        self.response_cache = response_cache
+        self.memory_cache = memory_cache
+        self.bulk_data_cache = bulk_data_cache
+        self.limiter = limiter or AdaptiveLimiter(10, 1)
+        self.retry_policy = retry_policy
+        self.background_loop = background_loop
+        self.iterator_buffer = iterator_buffer
+        self._resources = _Resources()
+        # Clean up if the client is garbage collected, or at exit, without being closed
+        self._finalizer = weakref.finalize(self, self._resources.close)
 
         # Mount handlers
         self.bulk_data = BulkDataSyncHandler(self)
@@ -30,44 +153,126 @@ class ScryfallSyncClient:
         self.symbols = SymbolsSyncHandler(self)
 
     def get_event_loop(self) -> asyncio.AbstractEventLoop:
-        """Get the event loop for the current thread."""
+        """Get the event loop for the current thread, or the background event loop."""
+        if self.background_loop:
+            return self._resources.get_background_loop()
         loop = None
         with contextlib.suppress(RuntimeError):
             loop = asyncio.get_event_loop_policy().get_event_loop()
         if loop is None or loop.is_closed():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
+            with self._resources.lock:
+                self._resources.thread_loops.append(loop)
         return loop
 
     def get_async_client(self) -> ScryfallClient:
-        """Get an async client for the current thread."""
-        loop = self.get_event_loop()
-        session = self._sessions.get(loop)
-        if session is None or session.closed:
-            session = aiohttp.ClientSession(loop=loop)
-            self._sessions[loop] = session
-        client = self._async_clients.get(loop)
-        if client is None:
-            client = ScryfallClient(session)
-            self._async_clients[loop] = client
+        """Get an async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        resources = self._resources
+        with resources.lock:
+            session = resources.sessions.get(loop)
+            if session is None or session.closed:
+                session = create_session()
+                resources.sessions[loop] = session
+                resources.async_clients.pop(loop, None)
+            client = resources.async_clients.get(loop)
+            if client is None:
+                client = ScryfallClient(
+                    session,
+                    card_index=self.card_index,
+                    response_cache=self.response_cache,
+                    memory_cache=self.memory_cache,
+                    bulk_data_cache=self.bulk_data_cache,
+                    limiter=self.limiter,
+                    retry_policy=self.retry_policy,
+                )
+                resources.async_clients[loop] = client
         return client
 
-    def close(self) -> None:
-        """Close the client, cleaning up the internal aiohttp session."""
+    def run(self, extractor: Callable[[ScryfallClient], Awaitable[_T]]) -> _T:
+        """Make an asynchronous call to ScryfallClient and wait for its result."""
 
-        async def _close_sessions() -> None:
-            for key, session in self._sessions.items():
-                if key in self._async_clients:
-                    del self._async_clients[key]
-                if session is not None and not session.closed:
-                    await session.close()
+        async def inner() -> _T:
+            """Inner function to be called by the event loop."""
+            return await extractor(self.get_async_client())
 
         loop = self.get_event_loop()
-        if loop.is_running():
-            loop.create_task(_close_sessions())
-        else:
-            loop.run_until_complete(_close_sessions())
+        if self.background_loop:
+            return asyncio.run_coroutine_threadsafe(inner(), loop).result()
+        return loop.run_until_complete(inner())
+
+    def iterate(self, extractor: Callable[[ScryfallClient], AsyncIterable[_T]]) -> Iterator[_T]:
+        """Iterate synchronously over an asynchronous call to ScryfallClient."""
+        if self.background_loop:
+            return self._iterate_in_background(extractor)
+        return self._iterate_in_thread(extractor)
+
+    def _iterate_in_thread(
+        self, extractor: Callable[[ScryfallClient], AsyncIterable[_T]]
+    ) -> Iterator[_T]:
+        """Iterate by running the current thread's event loop for each item."""
+
+        async def inner() -> AsyncIterable[_T]:
+            """Inner function to be called by the event loop."""
+            async for item in extractor(self.get_async_client()):
+                yield item
+
+        loop = self.get_event_loop()
+        async_iterator = aiter(inner())
+        while True:
+            try:
+                yield loop.run_until_complete(anext(async_iterator))
+            except StopAsyncIteration:
+                break
+
+    def _iterate_in_background(
+        self, extractor: Callable[[ScryfallClient], AsyncIterable[_T]]
+    ) -> Iterator[_T]:
+        """Iterate over items produced on the background event loop."""
+        loop = self._resources.get_background_loop()
+        items: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        # The producer waits for a free slot on the event loop, rather than blocking a thread
+        # (e.g. of the loop's default executor) until the consumer takes an item
+        slots = asyncio.Semaphore(self.iterator_buffer)
+
+        async def produce() -> None:
+            """Queue every item, followed by the end marker or the exception raised."""
+            try:
+                async for item in extractor(self.get_async_client()):
+                    await slots.acquire()
+                    items.put(item)
+            except Exception as exc:  # noqa: BLE001 - re-raised by the consumer
+                items.put(_Raised(exc))
+            else:
+                items.put(_DONE)
+
+        producer = asyncio.run_coroutine_threadsafe(produce(), loop)
+        try:
+            while (item := items.get()) is not _DONE:
+                if isinstance(item, _Raised):
+                    raise item.exc
+                loop.call_soon_threadsafe(slots.release)
+                yield item
+        finally:
+            producer.cancel()
+
+    def close(self) -> None:
+        """Close the client, cleaning up its aiohttp sessions and event loops.
+
+        The client can still be used after closing, but will then need closing again.
+        """
+        self._resources.close()
+
+    def __enter__(self) -> Self:
+        """Enter a context that closes the client on exit."""
+        return self
 
-    def __del__(self) -> None:
-        """Ensure client is closed when it is garbage collected."""
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the client on context exit."""
         self.close()
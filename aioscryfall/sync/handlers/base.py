@@ -3,12 +3,17 @@
 from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
 from typing import TYPE_CHECKING, TypeVar
 
+from msgspec import Struct
+
 from aioscryfall.client import ScryfallClient
+from aioscryfall.sync.pagination import PagedSyncIterator
 
 if TYPE_CHECKING:
+    from aioscryfall.pagination import Cursor, PagedIterator
     from aioscryfall.sync.client import ScryfallSyncClient
 
 _T = TypeVar("_T")
+_ListableT = TypeVar("_ListableT", bound=Struct)
 
 
 class BaseSyncHandler:
@@ -19,28 +24,18 @@ class BaseSyncHandler:
 
     def _result_extract(self, extractor: Callable[[ScryfallClient], Awaitable[_T]]) -> _T:
         """Convert an asynchronous call to ScryfallClient into a synchronous result."""
-
-        async def inner() -> _T:
-            """Inner function to be called by the event loop."""
-            return await extractor(self._client.get_async_client())
-
-        loop = self._client.get_event_loop()
-        return loop.run_until_complete(inner())
+        return self._client.run(extractor)
 
     def _iterable_extract(
         self, extractor: Callable[[ScryfallClient], AsyncIterable[_T]]
     ) -> Iterable[_T]:
         """Convert an asynchronous call to ScryfallClient into a synchronous iterable."""
-
-        async def inner() -> AsyncIterable[_T]:
-            """Inner function to be called by the event loop."""
-            async for item in extractor(self._client.get_async_client()):
-                yield item
-
-        loop = self._client.get_event_loop()
-        async_iterator = aiter(inner())
-        while True:
-            try:
-                yield loop.run_until_complete(anext(async_iterator))
-            except StopAsyncIteration:
-                break
+        return self._client.iterate(extractor)
+
+    def _paged_extract(
+        self,
+        extractor: "Callable[[ScryfallClient], PagedIterator[_ListableT]]",
+        cursor: "Cursor | None",
+    ) -> PagedSyncIterator[_ListableT]:
+        """Convert an asynchronous paged call to ScryfallClient into a synchronous iterator."""
+        return PagedSyncIterator(self._client, extractor, cursor)
@@ -1,14 +1,18 @@
 """Synchronous client handler for Scryfall bulk data APIs."""
 
 from collections.abc import Iterable
-from typing import cast, overload
+from typing import Any, TypeVar, cast, overload
 from uuid import UUID
 
+from msgspec import Struct
+
 from aioscryfall.models.bulk_data import ScryBulkData
 from aioscryfall.models.lists import ScryListable
 
 from .base import BaseSyncHandler
 
+_S = TypeVar("_S", bound=Struct)
+
 
 class BulkDataSyncHandler(BaseSyncHandler):
     """ScryfallSyncClient handler for bulk_data APIs."""
@@ -47,6 +51,44 @@ class BulkDataSyncHandler(BaseSyncHandler):
             )
         raise ValueError(invalid_args_msg)
 
-    def fetch_contents(self, bulk_data_item: ScryBulkData) -> list[ScryListable]:
+    @overload
+    def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: None = None,
+    ) -> list[ScryListable]:
+        ...
+
+    @overload
+    def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: type[_S],
+    ) -> list[_S]:
+        ...
+
+    @overload
+    def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: Iterable[str],
+    ) -> list[Struct]:
+        ...
+
+    def fetch_contents(
+        self,
+        bulk_data_item: ScryBulkData,
+        *,
+        projection: type[Struct] | Iterable[str] | None = None,
+    ) -> list[Any]:
         """Fetch the contents of a bulk data item."""
-        return self._result_extract(lambda c: c.bulk_data.fetch_contents(bulk_data_item))
+        return self._result_extract(
+            lambda c: c.bulk_data.fetch_contents(bulk_data_item, projection=projection)
+        )
+
+    def iter_contents(self, bulk_data_item: ScryBulkData) -> Iterable[ScryListable]:
+        """Iterate over the contents of a bulk data item as they are downloaded."""
+        return self._iterable_extract(lambda c: c.bulk_data.iter_contents(bulk_data_item))
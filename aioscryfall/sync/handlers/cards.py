@@ -1,20 +1,46 @@
 """Synchronous client handler for Scryfall cards APIs."""
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, cast, overload
+from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 from uuid import UUID
 
+from msgspec import Struct
+
 from aioscryfall.models.cards import ScryCard
+from aioscryfall.models.lists import ScryList
+from aioscryfall.pagination import Cursor
+from aioscryfall.sync.pagination import PagedSyncIterator
 
 from .base import BaseSyncHandler
 
 if TYPE_CHECKING:
     from aioscryfall.api.cards import CardIdentifier, SortDirection, SortOrdering, UniqueMode
 
+_S = TypeVar("_S", bound=Struct)
+
 
 class CardsSyncHandler(BaseSyncHandler):
     """ScryfallSyncClient handler for cards APIs."""
 
+    @overload
+    def search(
+        self,
+        query: str,
+        *,
+        unique: "UniqueMode | None" = None,
+        order: "SortOrdering | None" = None,
+        direction: "SortDirection | None" = None,
+        include_extras: bool | None = None,
+        include_multilingual: bool | None = None,
+        include_variations: bool | None = None,
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: None = None,
+    ) -> PagedSyncIterator[ScryCard]:
+        ...
+
+    @overload
     def search(
         self,
         query: str,
@@ -25,9 +51,48 @@ class CardsSyncHandler(BaseSyncHandler):
         include_extras: bool | None = None,
         include_multilingual: bool | None = None,
         include_variations: bool | None = None,
-    ) -> Iterable[ScryCard]:
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: type[_S],
+    ) -> PagedSyncIterator[_S]:
+        ...
+
+    @overload
+    def search(
+        self,
+        query: str,
+        *,
+        unique: "UniqueMode | None" = None,
+        order: "SortOrdering | None" = None,
+        direction: "SortDirection | None" = None,
+        include_extras: bool | None = None,
+        include_multilingual: bool | None = None,
+        include_variations: bool | None = None,
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: Iterable[str],
+    ) -> PagedSyncIterator[Struct]:
+        ...
+
+    def search(  # noqa: PLR0913 - mirrors the /cards/search query parameters
+        self,
+        query: str,
+        *,
+        unique: "UniqueMode | None" = None,
+        order: "SortOrdering | None" = None,
+        direction: "SortDirection | None" = None,
+        include_extras: bool | None = None,
+        include_multilingual: bool | None = None,
+        include_variations: bool | None = None,
+        parallel: bool = False,
+        preserve_order: bool = True,
+        cursor: Cursor | None = None,
+        projection: type[Struct] | Iterable[str] | None = None,
+    ) -> PagedSyncIterator[Any]:
         """Search for cards."""
-        return self._iterable_extract(
+        return self._paged_extract(
             lambda c: c.cards.search(
                 query,
                 unique=unique,
@@ -36,7 +101,13 @@ class CardsSyncHandler(BaseSyncHandler):
                 include_extras=include_extras,
                 include_multilingual=include_multilingual,
                 include_variations=include_variations,
-            )
+                parallel=parallel,
+                preserve_order=preserve_order,
+                cursor=cursor,
+                # cast is necessary because mypy can't match a union against the overloads
+                projection=cast(Any, projection),
+            ),
+            cursor,
         )
 
     @overload
@@ -80,9 +151,65 @@ class CardsSyncHandler(BaseSyncHandler):
         """Get a random card."""
         return self._result_extract(lambda c: c.cards.random())
 
-    def get_collection(self, identifiers: list["CardIdentifier"]) -> Iterable[ScryCard]:
+    @overload
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: None = None,
+    ) -> PagedSyncIterator[ScryCard]:
+        ...
+
+    @overload
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: type[_S],
+    ) -> PagedSyncIterator[_S]:
+        ...
+
+    @overload
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: Iterable[str],
+    ) -> PagedSyncIterator[Struct]:
+        ...
+
+    def get_collection(
+        self,
+        identifiers: Iterable["CardIdentifier"],
+        *,
+        cursor: Cursor | None = None,
+        projection: type[Struct] | Iterable[str] | None = None,
+    ) -> PagedSyncIterator[Any]:
         """Get a collection of cards by ID."""
-        return self._iterable_extract(lambda c: c.cards.get_collection(identifiers))
+        return self._paged_extract(
+            lambda c: c.cards.get_collection(identifiers, cursor=cursor, projection=projection),
+            cursor,
+        )
+
+    def get_collection_pages(
+        self, identifiers: Iterable["CardIdentifier"]
+    ) -> Iterable[ScryList[ScryCard]]:
+        """Get a collection of cards, as one list per /cards/collection request."""
+        return self._iterable_extract(lambda c: c.cards.get_collection_pages(identifiers))
+
+    def get_cards_many(
+        self, identifiers: Iterable["CardIdentifier"]
+    ) -> list[ScryCard | Exception]:
+        """Get many cards by various identifiers, in as few requests as possible.
+
+        See CardsHandler.get_cards_many; every request is made from a single call to the
+        event loop.
+        """
+        identifiers = list(identifiers)
+        return self._result_extract(lambda c: c.cards.get_cards_many(identifiers))
 
     @overload
     def get_card(self, *, set_code: str, collector_number: str) -> ScryCard:
@@ -112,7 +239,7 @@ class CardsSyncHandler(BaseSyncHandler):
     def get_card(self, *, scryfall_id: UUID) -> ScryCard:
         ...
 
-    def get_card(
+    def get_card(  # noqa: PLR0913 - one keyword per card identifier
         self,
         *,
         set_code: str | None = None,
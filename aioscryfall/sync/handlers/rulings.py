@@ -5,33 +5,44 @@ from typing import TYPE_CHECKING, cast, overload
 from .base import BaseSyncHandler
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
     from uuid import UUID
 
     from aioscryfall.models.rulings import ScryRuling
+    from aioscryfall.pagination import Cursor
+    from aioscryfall.sync.pagination import PagedSyncIterator
 
 
 class RulingsSyncHandler(BaseSyncHandler):
     """ScryfallSyncClient handler for rulings APIs."""
 
     @overload
-    def get_rulings(self, *, card_id: "UUID") -> "Iterable[ScryRuling]":
+    def get_rulings(
+        self, *, card_id: "UUID", cursor: "Cursor | None" = None
+    ) -> "PagedSyncIterator[ScryRuling]":
         ...
 
     @overload
-    def get_rulings(self, *, multiverse_id: int) -> "Iterable[ScryRuling]":
+    def get_rulings(
+        self, *, multiverse_id: int, cursor: "Cursor | None" = None
+    ) -> "PagedSyncIterator[ScryRuling]":
         ...
 
     @overload
-    def get_rulings(self, *, mtgo_id: int) -> "Iterable[ScryRuling]":
+    def get_rulings(
+        self, *, mtgo_id: int, cursor: "Cursor | None" = None
+    ) -> "PagedSyncIterator[ScryRuling]":
         ...
 
     @overload
-    def get_rulings(self, *, arena_id: int) -> "Iterable[ScryRuling]":
+    def get_rulings(
+        self, *, arena_id: int, cursor: "Cursor | None" = None
+    ) -> "PagedSyncIterator[ScryRuling]":
         ...
 
     @overload
-    def get_rulings(self, *, set_code: str, collector_number: str) -> "Iterable[ScryRuling]":
+    def get_rulings(
+        self, *, set_code: str, collector_number: str, cursor: "Cursor | None" = None
+    ) -> "PagedSyncIterator[ScryRuling]":
         ...
 
     def get_rulings(
@@ -43,7 +54,8 @@ class RulingsSyncHandler(BaseSyncHandler):
         arena_id: int | None = None,
         set_code: str | None = None,
         collector_number: str | None = None,
-    ) -> "Iterable[ScryRuling]":
+        cursor: "Cursor | None" = None,
+    ) -> "PagedSyncIterator[ScryRuling]":
         """Get rulings for a card."""
         has_identifier = (
             card_id is not None,
@@ -56,31 +68,39 @@ class RulingsSyncHandler(BaseSyncHandler):
         if len([x for x in has_identifier if x]) != 1:
             raise ValueError(invalid_args_msg)
         if card_id is not None:
-            return self._iterable_extract(
+            return self._paged_extract(
                 # cast is necessary because of https://github.com/python/mypy/issues/2608
-                lambda c: c.rulings.get_rulings(card_id=cast(UUID, card_id))
+                lambda c: c.rulings.get_rulings(card_id=cast(UUID, card_id), cursor=cursor),
+                cursor,
             )
         if multiverse_id is not None:
-            return self._iterable_extract(
+            return self._paged_extract(
                 # cast is necessary because of https://github.com/python/mypy/issues/2608
-                lambda c: c.rulings.get_rulings(multiverse_id=cast(int, multiverse_id))
+                lambda c: c.rulings.get_rulings(
+                    multiverse_id=cast(int, multiverse_id), cursor=cursor
+                ),
+                cursor,
             )
         if mtgo_id is not None:
-            return self._iterable_extract(
+            return self._paged_extract(
                 # cast is necessary because of https://github.com/python/mypy/issues/2608
-                lambda c: c.rulings.get_rulings(mtgo_id=cast(int, mtgo_id))
+                lambda c: c.rulings.get_rulings(mtgo_id=cast(int, mtgo_id), cursor=cursor),
+                cursor,
             )
         if arena_id is not None:
-            return self._iterable_extract(
+            return self._paged_extract(
                 # cast is necessary because of https://github.com/python/mypy/issues/2608
-                lambda c: c.rulings.get_rulings(arena_id=cast(int, arena_id))
+                lambda c: c.rulings.get_rulings(arena_id=cast(int, arena_id), cursor=cursor),
+                cursor,
             )
         if set_code is not None and collector_number is not None:
-            return self._iterable_extract(
+            return self._paged_extract(
                 lambda c: c.rulings.get_rulings(
                     # cast is necessary because of https://github.com/python/mypy/issues/2608
                     set_code=cast(str, set_code),
                     collector_number=cast(str, collector_number),
-                )
+                    cursor=cursor,
+                ),
+                cursor,
             )
         raise ValueError(invalid_args_msg)
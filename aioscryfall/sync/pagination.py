@@ -0,0 +1,49 @@
+"""Resumable synchronous iteration over paged Scryfall API results."""
+
+from collections.abc import AsyncIterator, Callable, Iterator
+from typing import TYPE_CHECKING, TypeVar
+
+import msgspec
+
+from aioscryfall.pagination import Cursor
+
+if TYPE_CHECKING:
+    from aioscryfall.client import ScryfallClient
+    from aioscryfall.pagination import PagedIterator
+    from aioscryfall.sync.client import ScryfallSyncClient
+
+_T = TypeVar("_T", bound=msgspec.Struct)
+
+
+class PagedSyncIterator(Iterator[_T]):
+    """PagedSyncIterator is the synchronous counterpart of aioscryfall.pagination.PagedIterator.
+
+    At any time, cursor is the position of the next item to be yielded; passing it back to
+    the method that created the iterator resumes iteration from that item.
+    """
+
+    def __init__(
+        self,
+        client: "ScryfallSyncClient",
+        extractor: "Callable[[ScryfallClient], PagedIterator[_T]]",
+        cursor: Cursor | None = None,
+    ) -> None:
+        async def with_cursors(async_client: "ScryfallClient") -> AsyncIterator[tuple[_T, Cursor]]:
+            """Pair each item with the cursor following it."""
+            iterator = extractor(async_client)
+            async for item in iterator:
+                yield item, iterator.cursor
+
+        # Items may be fetched ahead of the caller, so keep the cursor of the last item taken
+        self._cursor = cursor or Cursor()
+        self._items = client.iterate(with_cursors)
+
+    @property
+    def cursor(self) -> Cursor:
+        """Position of the next item."""
+        return self._cursor
+
+    def __next__(self) -> _T:
+        """Get the next item, fetching the next page if needed."""
+        item, self._cursor = next(self._items)
+        return item
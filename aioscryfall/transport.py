@@ -0,0 +1,273 @@
+"""HTTP transport for requests made by ScryfallClient."""
+
+import asyncio
+import contextlib
+import importlib.metadata
+import importlib.util
+from collections.abc import AsyncIterator, Mapping
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+import aiohttp
+import msgspec
+
+from aioscryfall.cache import request_key
+from aioscryfall.limiter import parse_retry_after
+
+if TYPE_CHECKING:
+    from aioscryfall.cache import CacheEntry
+    from aioscryfall.client import ScryfallClient
+
+
+# Requests are limited to 10 per second, so there is little point in more connections
+DEFAULT_CONNECTION_LIMIT = 10
+# Endpoints whose responses differ on every request, so concurrent requests are not shared
+UNSHARED_PATHS = ("/cards/random",)
+# Connect quickly or fail (and be retried); no total timeout, since bulk data is large
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=60)
+
+
+def _user_agent() -> str:
+    """Get the User-Agent header identifying this library."""
+    try:
+        return f"aioscryfall/{importlib.metadata.version('aioscryfall')}"
+    except importlib.metadata.PackageNotFoundError:
+        return "aioscryfall"
+
+
+def _accept_encoding() -> str:
+    """Get the Accept-Encoding header for the compression schemes aiohttp can decode."""
+    # aiohttp decodes brotli if either brotli package is installed (aiohttp[speedups])
+    brotli = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+    return "gzip, deflate, br" if brotli else "gzip, deflate"
+
+
+def create_session(
+    *,
+    limit: int = DEFAULT_CONNECTION_LIMIT,
+    keepalive_timeout: float = 60,
+    ttl_dns_cache: int = 600,
+    timeout: aiohttp.ClientTimeout = DEFAULT_TIMEOUT,
+) -> aiohttp.ClientSession:
+    """Create an aiohttp session tuned for making Scryfall API requests.
+
+    Connections are kept alive between bursts of requests and DNS lookups are cached, so
+    most requests reuse an open TLS connection. Must be called with an event loop running.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit,
+        keepalive_timeout=keepalive_timeout,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=timeout,
+        headers={
+            "Accept": "application/json",
+            "Accept-Encoding": _accept_encoding(),
+            "User-Agent": _user_agent(),
+        },
+    )
+
+
+class BufferedResponse(msgspec.Struct, frozen=True):
+    """A fully read HTTP response."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    async def read(self) -> bytes:
+        """Read the response body."""
+        return self.body
+
+
+class Transport:
+    """Transport makes HTTP requests on behalf of a ScryfallClient.
+
+    Every request is subject to the client's rate limiter, unless it can be answered from
+    the client's memory or response caches. Responses are read in full before being returned.
+    Concurrent identical GET requests share a single in-flight request, except for endpoints
+    in UNSHARED_PATHS; a shared request is cancelled once every caller waiting on it is.
+    Failed requests are retried per the client's retry policy, and throttled requests slow
+    the limiter down.
+
+    Transport implements aioscryfall.api.sessions.Session, so it can be passed to any of the
+    aioscryfall.api client implementations.
+    """
+
+    def __init__(self, client: "ScryfallClient") -> None:
+        self._client = client
+        self._in_flight: dict[str, asyncio.Task[BufferedResponse]] = {}
+        self._waiters: dict[str, int] = {}
+
+    @contextlib.asynccontextmanager
+    async def get(
+        self, url: str, *, params: Mapping[str, str] | None = None
+    ) -> AsyncIterator[BufferedResponse]:
+        """Make a GET request."""
+        yield await self.request("GET", url, params=params)
+
+    @contextlib.asynccontextmanager
+    async def post(
+        self, url: str, *, headers: Mapping[str, str] | None = None, data: bytes | None = None
+    ) -> AsyncIterator[BufferedResponse]:
+        """Make a POST request."""
+        yield await self.request("POST", url, headers=headers, data=data)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> BufferedResponse:
+        """Make an HTTP request, answering it from the client's caches if possible."""
+        if method != "GET":
+            return await self._send(method, url, params=params, headers=headers, data=data)
+
+        key = request_key(url, params)
+        memory_cache = self._client.memory_cache
+        if memory_cache is not None and (response := memory_cache.get(key)) is not None:
+            return response
+        if urlsplit(url).path.startswith(UNSHARED_PATHS):
+            return await self._get(key, url, params=params, headers=headers)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._get(key, url, params=params, headers=headers))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        # Shield the shared request, so one cancelled caller does not cancel it for the others,
+        # but cancel it along with the last caller still waiting on it
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[key] == 1 and not task.done():
+                task.cancel()
+                self._finish(key, task)
+            raise
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def _finish(self, key: str, task: "asyncio.Task[BufferedResponse]") -> None:
+        """Stop sharing a completed request."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.done() and not task.cancelled():
+            # Mark the exception as retrieved, in case every caller was cancelled
+            task.exception()
+
+    async def _get(
+        self,
+        key: str,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> BufferedResponse:
+        """Make a GET request, using and updating the client's caches."""
+        response = await self._revalidate(key, url, params=params, headers=headers)
+        memory_cache = self._client.memory_cache
+        if memory_cache is not None and response.status == 200:  # noqa: PLR2004 - OK
+            memory_cache.put(key, url, response)
+        return response
+
+    async def _revalidate(
+        self,
+        key: str,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+    ) -> BufferedResponse:
+        """Make a GET request, using and updating the response cache if there is one."""
+        cache = self._client.response_cache
+        if cache is None:
+            return await self._send("GET", url, params=params, headers=headers)
+
+        entry = await cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return _from_cache(entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None and entry.etag is not None:
+            request_headers["If-None-Match"] = entry.etag
+        response = await self._send("GET", url, params=params, headers=request_headers)
+        if entry is not None and response.status == 304:  # noqa: PLR2004 - Not Modified
+            return _from_cache(await cache.refresh(key, entry, response.headers))
+        if response.status == 200:  # noqa: PLR2004 - OK
+            await cache.store(key, response.status, response.headers, response.body)
+        return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> BufferedResponse:
+        """Send a request over the network, retrying transient failures.
+
+        Retries follow the client's retry policy. Throttled (429) responses also slow down the
+        rate limiter, which then holds back the retry along with every other request.
+        """
+        limiter = self._client.limiter
+        policy = self._client.retry_policy
+        attempt = 0
+        while True:
+            attempt += 1
+            last_attempt = attempt == policy.max_attempts
+            try:
+                response = await self._send_once(
+                    method, url, params=params, headers=headers, data=data
+                )
+            except policy.retry_exceptions:
+                if last_attempt:
+                    raise
+                await asyncio.sleep(policy.delay(attempt))
+                continue
+
+            retry_after = parse_retry_after(response.headers.get("retry-after"))
+            if response.status == 429:  # noqa: PLR2004 - Too Many Requests
+                await limiter.throttled(retry_after)
+            else:
+                await limiter.succeeded()
+            if last_attempt or response.status not in policy.retry_statuses:
+                return response
+            if response.status != 429:  # noqa: PLR2004 - Too Many Requests
+                await asyncio.sleep(policy.delay(attempt, retry_after))
+
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+    ) -> BufferedResponse:
+        """Send a single request over the network, subject to the rate limiter."""
+        async with (
+            self._client.limiter,
+            self._client.session.request(
+                method, url, params=params, headers=headers, data=data
+            ) as resp,
+        ):
+            return BufferedResponse(
+                status=resp.status,
+                headers={name.lower(): value for name, value in resp.headers.items()},
+                body=await resp.read(),
+            )
+
+
+def _from_cache(entry: "CacheEntry") -> BufferedResponse:
+    """Create a response from a cache entry."""
+    return BufferedResponse(status=entry.status, headers=entry.headers, body=entry.body)
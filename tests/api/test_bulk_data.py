@@ -44,3 +44,22 @@ async def test_getby_type(
     )
     result = await bulk_data.getby_type(client_session, "oracle-cards")
     assert result.name == "Oracle Cards"
+
+
+async def test_download(mock_aioresponse: "aioresponses", client_session: "ClientSession") -> None:
+    """Test download."""
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://data.scryfall.io/default-cards/default-cards.json",
+        "bulk_data/contents.json",
+    )
+    chunks = [
+        chunk
+        async for chunk in bulk_data.download(
+            client_session,
+            "https://data.scryfall.io/default-cards/default-cards.json",
+            chunk_size=1024,
+        )
+    ]
+    assert len(chunks) > 1
+    assert b"".join(chunks) == (utils.TEST_DATA_DIR / "bulk_data/contents.json").read_bytes()
@@ -4,13 +4,19 @@ import asyncio
 from typing import TYPE_CHECKING
 
 import aioresponses
+import appdirs
 import pytest
 import pytest_asyncio
 from aiohttp import ClientSession
 
+from aioscryfall.models import serde
+from aioscryfall.models.cards import ScryCard
+from tests import utils
+
 if TYPE_CHECKING:
     from asyncio import AbstractEventLoop
     from collections.abc import AsyncGenerator, Generator
+    from pathlib import Path
 
     from _pytest.fixtures import FixtureRequest
 
@@ -44,3 +50,23 @@ def mock_aioresponse(
     else:
         with aioresponses.aioresponses() as mock:
             yield mock
+
+
+@pytest.fixture(autouse=True)
+def user_cache_dir(tmp_path: "Path", monkeypatch: pytest.MonkeyPatch) -> "Path":
+    """Keep default caches, such as the bulk data cache, out of the real user cache."""
+    cache_dir = tmp_path / "user_cache"
+    monkeypatch.setattr(appdirs, "user_cache_dir", lambda appname: str(cache_dir / appname))
+    return cache_dir
+
+
+@pytest.fixture
+def bulk_contents() -> bytes:
+    """Contents of the bulk data test file."""
+    return (utils.TEST_DATA_DIR / "bulk_data/contents.json").read_bytes()
+
+
+@pytest.fixture
+def cards(bulk_contents: bytes) -> list[ScryCard]:
+    """Cards from the bulk data test file."""
+    return serde.decode_json(bulk_contents, list[ScryCard])
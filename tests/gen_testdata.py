@@ -6,15 +6,15 @@ from typing import Any
 import aiofiles.os
 import msgspec
 from aiohttp import ClientSession
-from aiolimiter import AsyncLimiter
 
 from aioscryfall.api import bulk_data, cards, catalogs, migrations, rulings, sets, symbols
 from aioscryfall.errors import APIError
+from aioscryfall.limiter import AdaptiveLimiter
 from aioscryfall.models.lists import RawScryList, ScryList
 
 TEST_DATA_DIR = Path(__file__).parent / "data"
 ENCODER = msgspec.json.Encoder()
-LIMITER = AsyncLimiter(10, 1)  # 10 requests per second
+LIMITER = AdaptiveLimiter(10, 1)  # 10 requests per second
 
 
 def _pretty_encode(obj: Any) -> bytes:
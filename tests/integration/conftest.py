@@ -4,9 +4,10 @@ from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import pytest
-from aiolimiter import AsyncLimiter
 
-LIMITER = AsyncLimiter(10, 1)  # 10 requests per second
+from aioscryfall.limiter import AdaptiveLimiter
+
+LIMITER = AdaptiveLimiter(10, 1)  # 10 requests per second
 
 
 def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
@@ -0,0 +1,40 @@
+"""Tests for aioscryfall.models.compact."""
+
+import gc
+
+import msgspec
+
+from aioscryfall.models.cards import ScryCard, ScryCardLegality
+from aioscryfall.models.compact import CompactCard
+
+
+def test_round_trip(cards: list[ScryCard]) -> None:
+    for card in cards:
+        compact = CompactCard.from_card(card)
+        assert compact.to_card() == card
+        assert msgspec.json.encode(compact.to_card()) == msgspec.json.encode(card)
+
+
+def test_msgpack_round_trip(cards: list[ScryCard]) -> None:
+    compact = [CompactCard.from_card(card) for card in cards]
+    encoded = msgspec.msgpack.encode(compact)
+    assert msgspec.msgpack.decode(encoded, type=list[CompactCard]) == compact
+
+
+def test_shared_values(cards: list[ScryCard]) -> None:
+    first, second = (CompactCard.from_card(card) for card in cards if card.set_ == "unf")
+    assert not gc.is_tracked(first)
+    assert first.set_id is second.set_id
+    assert first.lang is second.lang
+
+
+def test_legalities__partial_and_unknown_formats(cards: list[ScryCard]) -> None:
+    legalities = {
+        "vintage": ScryCardLegality.RESTRICTED,
+        "commander": ScryCardLegality.BANNED,
+        "someformat": ScryCardLegality.LEGAL,
+    }
+    card = msgspec.structs.replace(cards[0], legalities=legalities)
+    compact = CompactCard.from_card(card)
+    assert compact.other_legalities == ("someformat", "legal")
+    assert compact.to_card().legalities == legalities
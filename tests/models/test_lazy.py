@@ -0,0 +1,57 @@
+"""Tests for aioscryfall.models.lazy."""
+
+import sys
+from decimal import Decimal
+
+import msgspec
+
+from aioscryfall.models import serde
+from aioscryfall.models.cards import ScryCard, ScryCardLegality
+from aioscryfall.models.lazy import LazyScryCard
+from aioscryfall.models.lists import ScryList
+from tests import utils
+
+
+def test_lazy_fields(bulk_contents: bytes) -> None:
+    card = serde.decode_json(bulk_contents, list[LazyScryCard])[0]
+    assert isinstance(card.raw_prices, msgspec.Raw)
+    assert card.prices is not None
+    assert card.prices["usd"] == Decimal("0.45")
+    assert card.prices is card.prices
+    assert card.legalities["vintage"] == ScryCardLegality.LEGAL
+    assert card.card_faces is None
+
+
+def test_to_card(bulk_contents: bytes, cards: list[ScryCard]) -> None:
+    lazy_cards = serde.decode_json(bulk_contents, list[LazyScryCard])
+    assert [card.to_card() for card in lazy_cards] == cards
+    assert msgspec.json.encode(lazy_cards) == msgspec.json.encode(cards)
+
+
+def test_decode_json__list() -> None:
+    data = (utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes()
+    page = serde.decode_json(data, ScryList[LazyScryCard])
+    assert len(page.data) == 10
+    assert page.data[0].image_uris is not None
+    assert page.data[0].to_card() == serde.decode_json(data, ScryList[ScryCard]).data[0]
+
+
+def test_fields_match_scry_card() -> None:
+    lazy_fields = msgspec.structs.fields(LazyScryCard)
+    card_fields = msgspec.structs.fields(ScryCard)
+    assert [field.encode_name for field in lazy_fields] == [
+        field.encode_name for field in card_fields
+    ]
+    for lazy_field, card_field in zip(lazy_fields, card_fields, strict=True):
+        if lazy_field.type is msgspec.Raw:
+            assert lazy_field.name == f"raw_{card_field.name}"
+            assert lazy_field.required == card_field.required
+        else:
+            assert lazy_field == card_field
+
+
+def test_decode__releases_input(bulk_contents: bytes) -> None:
+    refcount = sys.getrefcount(bulk_contents)
+    lazy_cards = serde.decode_json(bulk_contents, list[LazyScryCard])
+    assert sys.getrefcount(bulk_contents) == refcount
+    assert lazy_cards[0].prices is not None
@@ -0,0 +1,79 @@
+"""Tests for aioscryfall.models.serde."""
+
+import contextvars
+import pickle
+
+import msgspec
+import pytest
+
+from aioscryfall.models import serde
+from aioscryfall.models.cards import ScryCard
+from aioscryfall.models.lists import ScryList, ScryListable
+from aioscryfall.models.sets import ScrySet
+from tests import utils
+
+
+def test_json_array_line_splitter() -> None:
+    splitter = serde.JSONArrayLineSplitter()
+    elements = splitter.feed(b'[\n{"a": 1},\n{"b"')
+    assert elements == [b'{"a": 1}']
+    elements = splitter.feed(b': [2, 3]},\n{"c": 3}\n')
+    assert elements == [b'{"b": [2, 3]}', b'{"c": 3}']
+    assert splitter.feed(b"]") == []
+    assert splitter.close() == []
+
+
+def test_json_array_line_splitter__unterminated_last_line() -> None:
+    splitter = serde.JSONArrayLineSplitter()
+    assert splitter.feed(b'[{"a": 1},\n{"b": 2}]') == [b'{"a": 1}']
+    assert splitter.close() == [b'{"b": 2}']
+
+
+def test_projection() -> None:
+    projection = serde.projection(ScryCard, ["id_", "set_", "prices"])
+    assert serde.projection(ScryCard, ("id_", "set_", "prices")) is projection
+    card = serde.decode_json((utils.TEST_DATA_DIR / "cards/single.json").read_bytes(), projection)
+    assert projection.__struct_fields__ == ("id_", "set_", "prices")
+    assert card.set_ == "mh2"  # type: ignore[attr-defined]
+
+
+def test_projection__pickle() -> None:
+    card = serde.projection(ScryCard, ["name", "set_"])(name="Forest", set_="lea")
+    assert pickle.loads(pickle.dumps(card)) == card  # noqa: S301 - pickled just above
+
+
+def test_projection__unknown_field() -> None:
+    with pytest.raises(ValueError, match="Unknown ScryCard fields: set"):
+        serde.projection(ScryCard, ["name", "set"])
+
+
+def test_decode_json__projection_list() -> None:
+    projection = serde.projection(ScryCard, "name")
+    data = (utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes()
+    page = serde.decode_json(data, ScryList[projection])  # type: ignore[valid-type]
+    assert isinstance(page, ScryList)
+    assert page.total_cards == 20
+    assert page.next_page == "https://api.scryfall.com/cards/search?some_args=stuff"
+    assert page.data[0] == projection(name="Arctic Treeline")
+
+
+def test_decode_json__list_item_type() -> None:
+    data = (utils.TEST_DATA_DIR / "sets/page1.json").read_bytes()
+    page = serde.decode_json(data, ScryList[ScrySet])
+    assert all(isinstance(item, ScrySet) for item in page.data)
+    with pytest.raises(msgspec.ValidationError):
+        serde.decode_json(data, ScryList[ScryCard])
+
+
+def test_warmup(monkeypatch: pytest.MonkeyPatch) -> None:
+    projection = serde.projection(ScryCard, ["name", "lang"])
+    serde.warmup([ScryList[projection]])  # type: ignore[valid-type]
+    # Decoding in a new context must reuse the decoders rather than create new ones
+    monkeypatch.setattr(msgspec.json, "Decoder", None)
+    data = (utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes()
+    context = contextvars.copy_context()
+    page = context.run(serde.decode_json, data, ScryList[projection])  # type: ignore[valid-type]
+    assert page.data[0] == projection(name="Arctic Treeline", lang="en")
+    assert len(context.run(serde.decode_json, data, ScryList[ScryCard]).data) == 10
+    contents = (utils.TEST_DATA_DIR / "bulk_data/contents.json").read_bytes()
+    assert len(context.run(serde.decode_json, contents, list[ScryListable])) == 20
@@ -1,7 +1,18 @@
 """Tests for aioscryfall.sync.client."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+import pytest
+
+from aioscryfall.api.cards import CardIdentifier
+from aioscryfall.errors import APIError
+from aioscryfall.limiter import AdaptiveLimiter
+from aioscryfall.models import serde
+from aioscryfall.models.cards import ScryCard
+from aioscryfall.pagination import Cursor
 from aioscryfall.sync import client
 from tests import utils
 
@@ -20,9 +31,162 @@ def test_cards_search(mock_aioresponse: "aioresponses") -> None:
         "cards/forests-page2.json",
     )
 
-    scryfall_client = client.ScryfallSyncClient()
-    result = list(scryfall_client.cards.search("foo"))
+    with client.ScryfallSyncClient() as scryfall_client:
+        result = list(scryfall_client.cards.search("foo"))
     assert len(result) == 20
 
     mock_aioresponse.assert_any_call("https://api.scryfall.com/cards/search?q=foo")
     mock_aioresponse.assert_any_call("https://api.scryfall.com/cards/search?some_args=stuff")
+
+
+def test_cards_search__resume(mock_aioresponse: "aioresponses") -> None:
+    """Test resuming a search from a saved cursor."""
+    for _ in range(2):
+        utils.sync_load_get_payload(
+            mock_aioresponse,
+            "https://api.scryfall.com/cards/search?q=foo",
+            "cards/forests-page1.json",
+        )
+        utils.sync_load_get_payload(
+            mock_aioresponse,
+            "https://api.scryfall.com/cards/search?some_args=stuff",
+            "cards/forests-page2.json",
+        )
+
+    with client.ScryfallSyncClient() as scryfall_client:
+        search = scryfall_client.cards.search("foo")
+        seen = [next(search) for _ in range(5)]
+        resumed = list(scryfall_client.cards.search("foo", cursor=search.cursor))
+        assert resumed == list(search)
+    assert len(seen) + len(resumed) == 20
+
+
+def test_cards_search__projection(mock_aioresponse: "aioresponses") -> None:
+    """Test search decoding cards as a projection of ScryCard."""
+    utils.sync_load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/search?q=foo", "cards/forests-page1.json"
+    )
+    utils.sync_load_get_payload(
+        mock_aioresponse,
+        "https://api.scryfall.com/cards/search?some_args=stuff",
+        "cards/forests-page2.json",
+    )
+
+    projection = serde.projection(ScryCard, ["name", "set_"])
+    with client.ScryfallSyncClient() as scryfall_client:
+        result = list(scryfall_client.cards.search("foo", projection=projection))
+    assert len(result) == 20
+    assert result[0] == projection(name="Arctic Treeline", set_="khm")
+
+
+def test_cards_search__background_loop(mock_aioresponse: "aioresponses") -> None:
+    """Test search with requests made on a background event loop."""
+    utils.sync_load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/search?q=foo", "cards/forests-page1.json"
+    )
+    utils.sync_load_get_payload(
+        mock_aioresponse,
+        "https://api.scryfall.com/cards/search?some_args=stuff",
+        "cards/forests-page2.json",
+    )
+    utils.sync_load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/arena/1", "cards/single.json"
+    )
+
+    with client.ScryfallSyncClient(iterator_buffer=4) as scryfall_client:
+        search = scryfall_client.cards.search("foo")
+        seen = [next(search) for _ in range(12)]
+        assert search.cursor == Cursor(
+            page_url="https://api.scryfall.com/cards/search?some_args=stuff",
+            page_number=1,
+            position=2,
+        )
+        assert len(seen) + len(list(search)) == 20
+
+        card = scryfall_client.cards.get_card(arena_id=1)
+        assert card.name == "Urza's Saga"
+
+
+def test_cards_search__full_iterators(mock_aioresponse: "aioresponses") -> None:
+    """Test iterators with full buffers not tying up the event loop's executor threads."""
+    mock_aioresponse.get(
+        "https://api.scryfall.com/cards/search?q=foo",
+        body=(utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes(),
+        repeat=True,
+    )
+
+    limiter = AdaptiveLimiter(1000, 1)
+    with client.ScryfallSyncClient(iterator_buffer=1, limiter=limiter) as scryfall_client:
+        # More iterators than the default executor has threads
+        searches = [scryfall_client.cards.search("foo") for _ in range(40)]
+        assert all(next(search).name == "Arctic Treeline" for search in searches)
+        loop = scryfall_client.get_event_loop()
+        assert asyncio.run_coroutine_threadsafe(asyncio.to_thread(int), loop).result(5) == 0
+
+
+def test_cards_search__background_loop_error(mock_aioresponse: "aioresponses") -> None:
+    """Test errors raised on a background event loop reaching the caller."""
+    mock_aioresponse.get(
+        "https://api.scryfall.com/cards/search?q=foo",
+        status=404,
+        body=b'{"object": "error", "status": 404, "code": "not_found", "details": "No cards"}',
+    )
+
+    with client.ScryfallSyncClient() as scryfall_client, pytest.raises(APIError):
+        list(scryfall_client.cards.search("foo"))
+
+
+def test_cards_get_cards_many(mock_aioresponse: "aioresponses") -> None:
+    """Test get_cards_many returning cards and errors in input order."""
+    utils.sync_load_post_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/collection", "cards/forests-page1.json"
+    )
+
+    identifiers: list[CardIdentifier] = [{"mtgo_id": 38480}, {"name": "Not A Card"}]
+    with client.ScryfallSyncClient() as scryfall_client:
+        card, missing = scryfall_client.cards.get_cards_many(iter(identifiers))
+    assert isinstance(card, ScryCard)
+    assert card.set_ == "me4"
+    assert isinstance(missing, APIError)
+    assert missing.status == 404
+    mock_aioresponse.assert_called_once()
+
+
+def test_thread_pool__background_loop(mock_aioresponse: "aioresponses") -> None:
+    """Test threads sharing one client, event loop and session."""
+    mock_aioresponse.get(
+        "https://api.scryfall.com/cards/arena/1",
+        body=(utils.TEST_DATA_DIR / "cards/single.json").read_bytes(),
+        repeat=True,
+    )
+
+    def loop_threads() -> int:
+        return sum(thread.name == "aioscryfall-sync" for thread in threading.enumerate())
+
+    threads_before = loop_threads()
+    with client.ScryfallSyncClient() as scryfall_client:
+        with ThreadPoolExecutor(8) as executor:
+            cards = list(
+                executor.map(lambda _: scryfall_client.cards.get_card(arena_id=1), range(16))
+            )
+            sessions = set(
+                executor.map(
+                    lambda _: scryfall_client.run(lambda c: asyncio.sleep(0, c.session)), range(16)
+                )
+            )
+        assert all(card.name == "Urza's Saga" for card in cards)
+        assert len(sessions) == 1
+    assert all(session.closed for session in sessions)
+    assert loop_threads() == threads_before
+
+
+def test_thread_pool__per_thread_loops() -> None:
+    """Test threads with their own event loops sharing one rate limiter."""
+    with client.ScryfallSyncClient(background_loop=False) as scryfall_client:
+        with ThreadPoolExecutor(4) as executor:
+            limiters = set(
+                executor.map(
+                    lambda _: scryfall_client.run(lambda c: asyncio.sleep(0, c.limiter)), range(8)
+                )
+            )
+        assert limiters == {scryfall_client.limiter}
@@ -0,0 +1,199 @@
+"""Tests for aioscryfall.cache."""
+
+import concurrent.futures
+from typing import TYPE_CHECKING
+
+import pytest
+from yarl import URL
+
+from aioscryfall import cache, client, transport
+from aioscryfall.models import serde
+from aioscryfall.models.bulk_data import ScryBulkData
+from tests import utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aiohttp import ClientSession
+    from aioresponses import aioresponses
+
+SET_URL = "https://api.scryfall.com/sets/isd"
+
+
+@pytest.fixture
+def set_payload() -> bytes:
+    """Load a single set payload."""
+    return (utils.TEST_DATA_DIR / "sets/single.json").read_bytes()
+
+
+async def test_store__no_store(tmp_path: "Path") -> None:
+    response_cache = cache.ResponseCache(tmp_path, default_ttl=60)
+    key = cache.request_key(SET_URL)
+    assert await response_cache.store(key, 200, {"cache-control": "no-store"}, b"{}") is None
+    assert await response_cache.get(key) is None
+
+
+async def test_store__max_age(tmp_path: "Path") -> None:
+    response_cache = cache.ResponseCache(tmp_path)
+    key = cache.request_key(SET_URL, {"b": "2", "a": "1"})
+    assert key == cache.request_key(SET_URL, {"a": "1", "b": "2"})
+    entry = await response_cache.store(key, 200, {"cache-control": "public, max-age=60"}, b"{}")
+    assert entry is not None
+    assert entry.is_fresh()
+    assert await response_cache.get(key) == entry
+    response_cache.clear()
+    assert await response_cache.get(key) is None
+
+
+async def test_store__unrevalidatable(tmp_path: "Path") -> None:
+    response_cache = cache.ResponseCache(tmp_path)
+    key = cache.request_key(SET_URL)
+    assert await response_cache.store(key, 200, {}, b"{}") is None
+
+
+async def test_client__fresh_hit(
+    mock_aioresponse: "aioresponses",
+    client_session: "ClientSession",
+    tmp_path: "Path",
+    set_payload: bytes,
+) -> None:
+    mock_aioresponse.get(SET_URL, body=set_payload, headers={"Cache-Control": "max-age=60"})
+
+    response_cache = cache.ResponseCache(tmp_path)
+    scryfall_client = client.ScryfallClient(client_session, response_cache=response_cache)
+    first = await scryfall_client.sets.get_set(set_code="isd")
+    # A new client, as after a restart, still uses the cached response
+    scryfall_client = client.ScryfallClient(client_session, response_cache=response_cache)
+    second = await scryfall_client.sets.get_set(set_code="isd")
+    assert first == second
+    mock_aioresponse.assert_called_once()
+
+
+async def test_client__revalidation(
+    mock_aioresponse: "aioresponses",
+    client_session: "ClientSession",
+    tmp_path: "Path",
+    set_payload: bytes,
+) -> None:
+    mock_aioresponse.get(SET_URL, body=set_payload, headers={"ETag": '"v1"'})
+    mock_aioresponse.get(SET_URL, status=304, headers={"ETag": '"v1"'})
+
+    scryfall_client = client.ScryfallClient(
+        client_session, response_cache=cache.ResponseCache(tmp_path)
+    )
+    first = await scryfall_client.sets.get_set(set_code="isd")
+    second = await scryfall_client.sets.get_set(set_code="isd")
+    assert first == second
+
+    calls = mock_aioresponse.requests[("GET", URL(SET_URL))]
+    assert len(calls) == 2
+    assert calls[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_memory_cache__lru_eviction() -> None:
+    memory_cache = cache.MemoryCache(maxsize=2)
+    response = transport.BufferedResponse(status=200, headers={}, body=b"{}")
+    memory_cache.put("a", SET_URL, response)
+    memory_cache.put("b", SET_URL, response)
+    assert memory_cache.get("a") is response
+    memory_cache.put("c", SET_URL, response)
+    assert memory_cache.get("b") is None
+    assert memory_cache.get("a") is response
+    assert (memory_cache.hits, memory_cache.misses) == (2, 1)
+
+
+def test_memory_cache__threads() -> None:
+    memory_cache = cache.MemoryCache(maxsize=8)
+    response = transport.BufferedResponse(status=200, headers={}, body=b"{}")
+
+    def use_cache(thread: int) -> None:
+        for i in range(2000):
+            key = str((thread + i) % 16)
+            if memory_cache.get(key) is None:
+                memory_cache.put(key, SET_URL, response)
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        list(executor.map(use_cache, range(8)))
+    assert len(memory_cache) == 8
+    assert memory_cache.hits + memory_cache.misses == 8 * 2000
+
+
+def test_memory_cache__endpoint_ttls() -> None:
+    memory_cache = cache.MemoryCache(ttls={"/sets": 3600, "/sets/isd": 0})
+    assert memory_cache.ttl(SET_URL) == 0
+    assert memory_cache.ttl("https://api.scryfall.com/sets/khm") == 3600
+    assert memory_cache.ttl("https://api.scryfall.com/cards/named") == memory_cache.default_ttl
+    random_url = "https://api.scryfall.com/cards/random"
+    assert memory_cache.ttl(random_url) == 0
+    assert cache.MemoryCache(ttls={"/cards/random": 1}).ttl(random_url) == 1
+
+    memory_cache.put("isd", SET_URL, transport.BufferedResponse(status=200, headers={}, body=b""))
+    assert len(memory_cache) == 0
+
+
+async def test_client__memory_hit(
+    mock_aioresponse: "aioresponses",
+    client_session: "ClientSession",
+    set_payload: bytes,
+) -> None:
+    mock_aioresponse.get(SET_URL, body=set_payload)
+
+    memory_cache = cache.MemoryCache()
+    scryfall_client = client.ScryfallClient(client_session, memory_cache=memory_cache)
+    first = await scryfall_client.sets.get_set(set_code="isd")
+    second = await scryfall_client.sets.get_set(set_code="isd")
+    assert first == second
+    mock_aioresponse.assert_called_once()
+    assert (memory_cache.hits, memory_cache.misses) == (1, 1)
+
+
+async def test_bulk_data_cache__revalidation(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession", tmp_path: "Path"
+) -> None:
+    bulk_data_item = serde.decode_json(
+        (utils.TEST_DATA_DIR / "bulk_data/single.json").read_bytes(), ScryBulkData
+    )
+    contents = (utils.TEST_DATA_DIR / "bulk_data/contents.json").read_bytes()
+    headers = {"ETag": '"v1"', "Last-Modified": "Tue, 04 Apr 2023 21:03:21 GMT"}
+    mock_aioresponse.get(bulk_data_item.download_uri, body=contents, headers=headers)
+    mock_aioresponse.get(bulk_data_item.download_uri, status=304, headers=headers)
+
+    scryfall_client = client.ScryfallClient(
+        client_session, bulk_data_cache=cache.BulkDataCache(tmp_path, chunk_size=4096)
+    )
+    first = await scryfall_client.bulk_data.fetch_contents(bulk_data_item)
+    second = [item async for item in scryfall_client.bulk_data.iter_contents(bulk_data_item)]
+    assert first == second
+    assert len(second) == 20
+
+    calls = mock_aioresponse.requests[("GET", URL(bulk_data_item.download_uri))]
+    assert len(calls) == 2
+    assert not calls[0].kwargs["headers"]
+    assert calls[1].kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 04 Apr 2023 21:03:21 GMT",
+    }
+
+
+async def test_bulk_data_cache__partial_download(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession", tmp_path: "Path"
+) -> None:
+    download_uri = "https://data.scryfall.io/oracle-cards/oracle-cards-20230404210321.json"
+    mock_aioresponse.get(download_uri, body=b"x" * 10000, headers={"ETag": '"v1"'})
+
+    bulk_data_cache = cache.BulkDataCache(tmp_path, chunk_size=1000)
+    downloader = bulk_data_cache.download(client_session, download_uri)
+    assert await anext(downloader) == b"x" * 1000
+    await downloader.aclose()
+    assert list(tmp_path.iterdir()) == []
+
+
+async def test_bulk_data_cache__default(
+    client_session: "ClientSession", user_cache_dir: "Path"
+) -> None:
+    default_client = client.ScryfallClient(client_session)
+    assert default_client.bulk_data_cache is not None
+    assert default_client.bulk_data_cache.directory == str(
+        user_cache_dir / "aioscryfall/bulk_data"
+    )
+    assert client.ScryfallClient(client_session, bulk_data_cache=False).bulk_data_cache is None
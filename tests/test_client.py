@@ -1,8 +1,25 @@
 """Tests for aioscryfall.client."""
 
+import asyncio
+import json
 from typing import TYPE_CHECKING
+from uuid import UUID
 
-from aioscryfall import client
+import aiofiles
+import msgspec
+import pytest
+from yarl import URL
+
+from aioscryfall import client, transport
+from aioscryfall.api.cards import CardIdentifier
+from aioscryfall.errors import APIError
+from aioscryfall.handlers import cards as cards_handler
+from aioscryfall.index import CardIndex
+from aioscryfall.models import serde
+from aioscryfall.models.bulk_data import ScryBulkData
+from aioscryfall.models.cards import ScryCard
+from aioscryfall.models.lists import ScryList
+from aioscryfall.pagination import Cursor
 from tests import utils
 
 if TYPE_CHECKING:
@@ -29,3 +46,471 @@ async def test_cards_search(
 
     mock_aioresponse.assert_any_call("https://api.scryfall.com/cards/search?q=foo")
     mock_aioresponse.assert_any_call("https://api.scryfall.com/cards/search?some_args=stuff")
+
+
+async def test_client__owned_session(mock_aioresponse: "aioresponses") -> None:
+    """Test the client creating its own tuned session and closing it on exit."""
+    await utils.load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/sets/cmm", "sets/single.json"
+    )
+
+    async with client.ScryfallClient() as scryfall_client:
+        result = await scryfall_client.sets.get_set(set_code="cmm")
+        session = scryfall_client.session
+        assert session.connector is not None
+        assert session.connector.limit == transport.DEFAULT_CONNECTION_LIMIT
+        assert "gzip" in session.headers["Accept-Encoding"]
+        assert session.headers["User-Agent"].startswith("aioscryfall")
+    assert result.code == "cmm"
+    assert session.closed
+
+
+async def test_client__shared_session(client_session: "ClientSession") -> None:
+    """Test the client leaving a session it was given open."""
+    async with client.ScryfallClient(client_session) as scryfall_client:
+        assert scryfall_client.session is client_session
+    assert not client_session.closed
+
+
+async def test_cards_search__resume(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test resuming a search from a saved cursor."""
+    await utils.load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/search?q=foo", "cards/forests-page1.json"
+    )
+    for _ in range(2):
+        await utils.load_get_payload(
+            mock_aioresponse,
+            "https://api.scryfall.com/cards/search?some_args=stuff",
+            "cards/forests-page2.json",
+        )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    search = scryfall_client.cards.search("foo")
+    seen = [await anext(search) for _ in range(12)]
+    cursor = serde.decode_json(msgspec.json.encode(search.cursor), Cursor)
+    assert cursor == Cursor(
+        page_url="https://api.scryfall.com/cards/search?some_args=stuff", page_number=1, position=2
+    )
+
+    resumed = [card async for card in scryfall_client.cards.search("foo", cursor=cursor)]
+    assert resumed == [card async for card in search]
+    assert len(seen) + len(resumed) == 20
+
+
+async def test_cards_search__projection(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test search decoding every page as a projection of ScryCard."""
+    mock_aioresponse.get(
+        "https://api.scryfall.com/cards/search?q=foo",
+        body=(utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes(),
+        repeat=True,
+    )
+    mock_aioresponse.get(
+        "https://api.scryfall.com/cards/search?some_args=stuff",
+        body=(utils.TEST_DATA_DIR / "cards/forests-page2.json").read_bytes(),
+        repeat=True,
+    )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    projection = serde.projection(ScryCard, ["id_", "name", "set_", "collector_number"])
+    result = [card async for card in scryfall_client.cards.search("foo", projection="name")]
+    assert len(result) == 20
+    assert all(type(card) is serde.projection(ScryCard, "name") for card in result)
+
+    cards = scryfall_client.cards.search("foo", projection=projection)
+    seen = [await anext(cards) for _ in range(12)]
+    resumed = scryfall_client.cards.search("foo", cursor=cards.cursor, projection=projection)
+    assert [card async for card in resumed] == [card async for card in cards]
+    assert isinstance(seen[-1], projection)
+
+
+class CardName(msgspec.Struct):
+    """A user-defined projection of ScryCard."""
+
+    name: str
+
+
+async def test_cards_get_collection__projection(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test get_collection decoding cards as a user-defined Struct."""
+    await utils.load_post_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/collection", "cards/forests-page1.json"
+    )
+
+    identifiers: list[CardIdentifier] = [{"name": f"Card {i}"} for i in range(10)]
+    scryfall_client = client.ScryfallClient(client_session)
+    result = [
+        card
+        async for card in scryfall_client.cards.get_collection(identifiers, projection=CardName)
+    ]
+    assert result[0] == CardName(name="Arctic Treeline")
+    assert len(result) == 10
+
+
+async def test_cards_get_collection__resume(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test resuming get_collection from a saved cursor, skipping completed chunks."""
+    await utils.load_post_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/collection", "cards/forests-page2.json"
+    )
+
+    identifiers: list[CardIdentifier] = [{"name": f"Card {i}"} for i in range(100)]
+    scryfall_client = client.ScryfallClient(client_session)
+    cursor = Cursor(page_number=1, position=3)
+    result = [
+        card async for card in scryfall_client.cards.get_collection(identifiers, cursor=cursor)
+    ]
+    assert len(result) == 7
+
+    calls = mock_aioresponse.requests[("POST", URL("https://api.scryfall.com/cards/collection"))]
+    assert [len(json.loads(call.kwargs["data"])["identifiers"]) for call in calls] == [25]
+
+
+async def test_bulk_data_fetch_contents(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test fetch_contents."""
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://api.scryfall.com/bulk-data/default-cards",
+        "bulk_data/single.json",
+    )
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://data.scryfall.io/oracle-cards/oracle-cards-20230404210321.json",
+        "bulk_data/contents.json",
+    )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    bulk_data_item = await scryfall_client.bulk_data.get_bulk_data(bulk_data_type="default-cards")
+    result = await scryfall_client.bulk_data.fetch_contents(bulk_data_item)
+    assert len(result) == 20
+    assert result[0].name == "Arctic Treeline"
+
+
+async def test_bulk_data_fetch_contents__projection(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test fetch_contents decoding only the projected fields."""
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://data.scryfall.io/oracle-cards/oracle-cards-20230404210321.json",
+        "bulk_data/contents.json",
+    )
+    async with aiofiles.open(utils.TEST_DATA_DIR / "bulk_data/single.json", "rb") as file:
+        bulk_data_item = serde.decode_json(await file.read(), ScryBulkData)
+
+    scryfall_client = client.ScryfallClient(client_session)
+    result = await scryfall_client.bulk_data.fetch_contents(
+        bulk_data_item, projection=["name", "set_"]
+    )
+    assert len(result) == 20
+    assert result[0] == serde.projection(ScryCard, ["name", "set_"])(
+        name="Arctic Treeline", set_="khm"
+    )
+
+
+async def test_bulk_data_iter_contents(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test iter_contents."""
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://data.scryfall.io/oracle-cards/oracle-cards-20230404210321.json",
+        "bulk_data/contents.json",
+    )
+    async with aiofiles.open(utils.TEST_DATA_DIR / "bulk_data/single.json", "rb") as file:
+        bulk_data_item = serde.decode_json(await file.read(), ScryBulkData)
+
+    scryfall_client = client.ScryfallClient(client_session)
+    result = [item async for item in scryfall_client.bulk_data.iter_contents(bulk_data_item)]
+    assert len(result) == 20
+    assert all(isinstance(item, ScryCard) for item in result)
+    assert result[-1].name == "Breeding Pool"
+
+
+async def test_cards_get_card__card_index(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession", cards: list[ScryCard]
+) -> None:
+    """Test get_card resolving from a local card index before the API."""
+    await utils.load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/arena/1", "cards/single.json"
+    )
+
+    scryfall_client = client.ScryfallClient(client_session, card_index=CardIndex(cards))
+    result = await scryfall_client.cards.get_card(scryfall_id=cards[3].id_)
+    assert result == cards[3]
+    result = await scryfall_client.cards.get_card(arena_id=1)
+    assert result.name == "Urza's Saga"
+    mock_aioresponse.assert_called_once()
+
+
+async def test_cards_get_card__batched(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test concurrent get_card calls being batched into a single collection request."""
+    await utils.load_post_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/collection", "cards/forests-page1.json"
+    )
+
+    scryfall_client = client.ScryfallClient(client_session, card_batch_window=0.01)
+    by_id, by_collector_number, by_mtgo_id, missing = await asyncio.gather(
+        scryfall_client.cards.get_card(scryfall_id=UUID("b20e3117-f1e4-4449-ae9d-0b66abfc717d")),
+        scryfall_client.cards.get_card(set_code="VMA", collector_number="293"),
+        scryfall_client.cards.get_card(mtgo_id=38480),
+        scryfall_client.cards.get_card(scryfall_id=UUID(int=0)),
+        return_exceptions=True,
+    )
+    assert isinstance(by_id, ScryCard)
+    assert by_id.name == "Arctic Treeline"
+    assert isinstance(by_collector_number, ScryCard)
+    assert by_collector_number.set_ == "vma"
+    assert isinstance(by_mtgo_id, ScryCard)
+    assert by_mtgo_id.set_ == "me4"
+    assert isinstance(missing, APIError)
+    assert missing.status == 404
+    mock_aioresponse.assert_called_once()
+
+
+async def test_cards_get_cards_many(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession", cards: list[ScryCard]
+) -> None:
+    """Test get_cards_many resolving mixed identifiers in input order."""
+    indexed = cards[3]
+    await utils.load_post_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/collection", "cards/forests-page1.json"
+    )
+
+    identifiers: list[CardIdentifier] = [
+        {"name": "Arctic Treeline"},
+        {"id": UUID(int=0)},
+        {"id": indexed.id_},
+        {"set": "VMA", "collector_number": "293"},
+        {"mtgo_id": 38480},
+    ]
+    scryfall_client = client.ScryfallClient(client_session, card_index=CardIndex([indexed]))
+    by_name, missing, by_index, by_collector_number, by_mtgo_id = (
+        await scryfall_client.cards.get_cards_many(identifiers)
+    )
+    assert isinstance(by_name, ScryCard)
+    assert by_name.id_ == UUID("b20e3117-f1e4-4449-ae9d-0b66abfc717d")
+    assert isinstance(missing, APIError)
+    assert missing.status == 404
+    assert by_index == indexed
+    assert isinstance(by_collector_number, ScryCard)
+    assert by_collector_number.set_ == "vma"
+    assert isinstance(by_mtgo_id, ScryCard)
+    assert by_mtgo_id.set_ == "me4"
+
+    calls = mock_aioresponse.requests[("POST", URL("https://api.scryfall.com/cards/collection"))]
+    assert len(calls) == 1
+    assert len(json.loads(calls[0].kwargs["data"])["identifiers"]) == 4
+
+
+async def test_cards_get_cards_many__request_error(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test get_cards_many returning a failed request's error for each of its cards."""
+    mock_aioresponse.post(
+        "https://api.scryfall.com/cards/collection",
+        status=400,
+        body=(utils.TEST_DATA_DIR / "errors/parse-mana.json").read_bytes(),
+    )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    results = await scryfall_client.cards.get_cards_many([{"name": "A"}, {"name": "B"}])
+    assert len(results) == 2
+    assert all(isinstance(result, APIError) for result in results)
+    assert results[0] is results[1]
+
+
+async def test_sets_get_set__single_flight(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test concurrent identical requests sharing a single API request."""
+    await utils.load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/sets/isd", "sets/single.json"
+    )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    results = await asyncio.gather(
+        *(scryfall_client.sets.get_set(set_code="isd") for _ in range(5))
+    )
+    assert all(result == results[0] for result in results)
+    mock_aioresponse.assert_called_once()
+
+
+async def test_sets_get_set__single_flight_cancelled(
+    client_session: "ClientSession", monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a shared request being cancelled only once all of its callers are."""
+    send_started = asyncio.Event()
+    send_cancelled = asyncio.Event()
+
+    async def send_once(*_: object, **__: object) -> None:
+        send_started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            send_cancelled.set()
+            raise
+
+    scryfall_client = client.ScryfallClient(client_session)
+    monkeypatch.setattr(scryfall_client.transport, "_send_once", send_once)
+    first = asyncio.create_task(scryfall_client.sets.get_set(set_code="isd"))
+    second = asyncio.create_task(scryfall_client.sets.get_set(set_code="isd"))
+    await send_started.wait()
+
+    first.cancel()
+    await asyncio.sleep(0.01)
+    assert not send_cancelled.is_set()
+    second.cancel()
+    await asyncio.wait_for(send_cancelled.wait(), 1)
+    assert first.cancelled()
+    assert second.cancelled()
+
+
+async def test_cards_random__not_shared(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test concurrent random card requests each making their own API request."""
+    await utils.load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/random", "cards/single.json"
+    )
+    await utils.load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/random", "cards/single.json"
+    )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    await asyncio.gather(scryfall_client.cards.random(), scryfall_client.cards.random())
+    calls = mock_aioresponse.requests[("GET", URL("https://api.scryfall.com/cards/random"))]
+    assert len(calls) == 2
+
+
+async def test_cards_get_collection_pages(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test get_collection_pages splitting identifiers into chunks of 75."""
+    page = json.loads((utils.TEST_DATA_DIR / "cards/forests-page2.json").read_bytes())
+    page["not_found"] = [{"name": "Not A Card"}]
+    mock_aioresponse.post("https://api.scryfall.com/cards/collection", body=json.dumps(page))
+    await utils.load_post_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/collection", "cards/forests-page2.json"
+    )
+
+    identifiers: list[CardIdentifier] = [{"name": f"Card {i}"} for i in range(100)]
+    scryfall_client = client.ScryfallClient(client_session)
+    pages = [p async for p in scryfall_client.cards.get_collection_pages(iter(identifiers))]
+    assert len(pages) == 2
+    assert pages[0].not_found == [{"name": "Not A Card"}]
+    assert pages[1].not_found is None
+
+    calls = mock_aioresponse.requests[("POST", URL("https://api.scryfall.com/cards/collection"))]
+    assert [len(json.loads(call.kwargs["data"])["identifiers"]) for call in calls] == [75, 25]
+
+
+async def test_depage_list__no_prefetch(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test depage_list only fetching the next page once the current one is consumed."""
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://api.scryfall.com/cards/search?some_args=stuff",
+        "cards/forests-page2.json",
+    )
+    first_page = serde.decode_json(
+        (utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes(), ScryList[ScryCard]
+    )
+
+    scryfall_client = client.ScryfallClient(client_session, page_prefetch=0)
+    cards = aiter(scryfall_client.depage_list(first_page))
+    await anext(cards)
+    await asyncio.sleep(0.01)
+    assert not mock_aioresponse.requests
+    assert len([card async for card in cards]) == 19
+    mock_aioresponse.assert_called_once()
+
+
+async def test_depage_list__early_exit(
+    mock_aioresponse: "aioresponses",
+    client_session: "ClientSession",
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test depage_list cancelling its page prefetching when iteration stops."""
+    first_page = serde.decode_json(
+        (utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes(), ScryList[ScryCard]
+    )
+    fetch_started = asyncio.Event()
+    fetch_cancelled = asyncio.Event()
+
+    async def send_once(*_: object, **__: object) -> None:
+        fetch_started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            fetch_cancelled.set()
+            raise
+
+    scryfall_client = client.ScryfallClient(client_session, page_prefetch=3)
+    monkeypatch.setattr(scryfall_client.transport, "_send_once", send_once)
+    cards = scryfall_client.depage_list(first_page)
+    await anext(aiter(cards))
+    await fetch_started.wait()
+    await cards.aclose()  # type: ignore[attr-defined]
+    await asyncio.wait_for(fetch_cancelled.wait(), 1)
+    assert not mock_aioresponse.requests
+
+
+async def test_cards_search__parallel(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    """Test search fetching pages by number instead of following next_page."""
+    await utils.load_get_payload(
+        mock_aioresponse, "https://api.scryfall.com/cards/search?q=foo", "cards/forests-page1.json"
+    )
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://api.scryfall.com/cards/search?page=2&q=foo",
+        "cards/forests-page2.json",
+    )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    result = [card async for card in scryfall_client.cards.search("foo", parallel=True)]
+    assert len(result) == 20
+    assert result[0].name == "Arctic Treeline"
+
+    mock_aioresponse.assert_any_call("https://api.scryfall.com/cards/search?q=foo")
+    mock_aioresponse.assert_any_call("https://api.scryfall.com/cards/search?q=foo&page=2")
+
+
+async def test_cards_search__parallel_window(
+    mock_aioresponse: "aioresponses",
+    client_session: "ClientSession",
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test parallel search only fetching a window of pages ahead of the consumer."""
+    monkeypatch.setattr(cards_handler, "PARALLEL_PAGES", 2)
+    first_page = json.loads((utils.TEST_DATA_DIR / "cards/forests-page1.json").read_bytes())
+    first_page["total_cards"] = 50
+    mock_aioresponse.get(
+        "https://api.scryfall.com/cards/search?q=foo", body=json.dumps(first_page)
+    )
+    for page in range(2, 6):
+        await utils.load_get_payload(
+            mock_aioresponse,
+            f"https://api.scryfall.com/cards/search?page={page}&q=foo",
+            "cards/forests-page2.json",
+        )
+
+    scryfall_client = client.ScryfallClient(client_session)
+    result = scryfall_client.cards.search("foo", parallel=True, preserve_order=False)
+    assert (await anext(result)).name == "Arctic Treeline"
+    await asyncio.sleep(0.1)
+    assert len(mock_aioresponse.requests) == 3
+    assert len([card async for card in result]) == 49
+    assert len(mock_aioresponse.requests) == 5
@@ -0,0 +1,45 @@
+"""Tests for aioscryfall.index."""
+
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from aioscryfall import index, store
+from aioscryfall.models.cards import ScryCard
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_lookup(cards: list[ScryCard]) -> None:
+    card_index = index.CardIndex(cards)
+    card = cards[0]
+    assert card.arena_id is not None
+    assert card.mtgo_id is not None
+    assert card.multiverse_ids
+    assert card.tcgplayer_id is not None
+    assert card.cardmarket_id is not None
+    assert card_index.lookup(scryfall_id=card.id_) == card
+    assert card_index.lookup(arena_id=card.arena_id) == card
+    assert card_index.lookup(mtgo_id=card.mtgo_id) == card
+    assert card_index.lookup(multiverse_id=card.multiverse_ids[0]) == card
+    assert card_index.lookup(tcgplayer_id=card.tcgplayer_id) == card
+    assert card_index.lookup(cardmarket_id=card.cardmarket_id) == card
+    foil_card = next(card for card in cards if card.mtgo_foil_id is not None)
+    assert card_index.lookup(mtgo_id=foil_card.mtgo_foil_id) == foil_card
+    assert (
+        card_index.lookup(set_code=card.set_.upper(), collector_number=card.collector_number)
+        == card
+    )
+
+
+def test_lookup__missing(cards: list[ScryCard]) -> None:
+    card_index = index.CardIndex(cards)
+    assert card_index.lookup(scryfall_id=UUID(int=0)) is None
+    assert card_index.lookup(set_code="xxx", collector_number="1") is None
+
+
+def test_lookup__card_store(cards: list[ScryCard], tmp_path: "Path") -> None:
+    with store.CardStore.build(tmp_path / "store", cards) as card_store:
+        card_index = index.CardIndex(card_store)
+        assert len(card_index) == 20
+        assert card_index.lookup(scryfall_id=cards[5].id_) == cards[5]
@@ -0,0 +1,86 @@
+"""Tests for aioscryfall.limiter."""
+
+import time
+from email.utils import formatdate
+from typing import TYPE_CHECKING
+
+from aioscryfall import client, limiter
+from tests import utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aiohttp import ClientSession
+    from aioresponses import aioresponses
+
+SET_URL = "https://api.scryfall.com/sets/cmm"
+
+
+def test_parse_retry_after() -> None:
+    assert limiter.parse_retry_after(None) is None
+    assert limiter.parse_retry_after("2") == 2.0
+    assert limiter.parse_retry_after("soon") is None
+    retry_after = limiter.parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+    assert retry_after is not None
+    assert 28 <= retry_after <= 30
+
+
+async def test_adaptive_limiter__backoff_and_recovery() -> None:
+    adaptive_limiter = limiter.AdaptiveLimiter(10, 1, min_rate=2, recovery=1)
+    await adaptive_limiter.throttled(0)
+    assert adaptive_limiter.rate == 5
+    await adaptive_limiter.throttled(0)
+    await adaptive_limiter.throttled(0)
+    assert adaptive_limiter.rate == 2
+    for _ in range(20):
+        await adaptive_limiter.succeeded()
+    assert adaptive_limiter.rate == 10
+
+
+async def test_adaptive_limiter__pause() -> None:
+    adaptive_limiter = limiter.AdaptiveLimiter(10, 1)
+    await adaptive_limiter.throttled(0.05)
+    start = time.monotonic()
+    async with adaptive_limiter:
+        pass
+    assert time.monotonic() - start >= 0.05
+
+
+async def test_file_lock_limiter__shared_state(tmp_path: "Path") -> None:
+    path = tmp_path / "limiter"
+    first = limiter.FileLockLimiter(path, 10, 1)
+    second = limiter.FileLockLimiter(path, 10, 1)
+    await first.throttled(0.05)
+    start = time.monotonic()
+    async with second:
+        pass
+    assert time.monotonic() - start >= 0.04
+    assert second.rate == 5
+
+
+async def test_file_lock_limiter__budget(tmp_path: "Path") -> None:
+    limiters = [limiter.FileLockLimiter(tmp_path / "limiter", 10, 0.1) for _ in range(2)]
+    start = time.monotonic()
+    for _ in range(3):
+        for file_lock_limiter in limiters:
+            async with file_lock_limiter:
+                pass
+    # 6 requests at 100 req/s with a burst of 10 are not delayed, but 20 would be
+    assert time.monotonic() - start < 0.05
+    for _ in range(7):
+        for file_lock_limiter in limiters:
+            async with file_lock_limiter:
+                pass
+    assert time.monotonic() - start >= 0.09
+
+
+async def test_client__throttled_retry(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    mock_aioresponse.get(SET_URL, status=429, headers={"Retry-After": "0"})
+    await utils.load_get_payload(mock_aioresponse, SET_URL, "sets/single.json")
+
+    scryfall_client = client.ScryfallClient(client_session)
+    result = await scryfall_client.sets.get_set(set_code="cmm")
+    assert result.code == "cmm"
+    assert scryfall_client.limiter.rate < scryfall_client.limiter.max_rate
@@ -0,0 +1,56 @@
+"""Tests for aioscryfall.retry."""
+
+from typing import TYPE_CHECKING
+
+import aiohttp
+import pytest
+from yarl import URL
+
+from aioscryfall import client, retry
+from aioscryfall.errors import UnparsedAPIError
+from tests import utils
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from aioresponses import aioresponses
+
+SET_URL = "https://api.scryfall.com/sets/cmm"
+
+
+def test_retry_policy__delay() -> None:
+    policy = retry.RetryPolicy(base_delay=1, max_delay=3)
+    assert all(0 <= policy.delay(1) <= 1 for _ in range(100))
+    assert all(0 <= policy.delay(5) <= 3 for _ in range(100))
+    assert policy.delay(1, retry_after=10) == 10
+
+
+def test_retry_policy__invalid() -> None:
+    with pytest.raises(ValueError, match="max_attempts"):
+        retry.RetryPolicy(0)
+
+
+async def test_client__retry_status(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    mock_aioresponse.get(SET_URL, status=503)
+    mock_aioresponse.get(SET_URL, exception=aiohttp.ServerDisconnectedError())
+    await utils.load_get_payload(mock_aioresponse, SET_URL, "sets/single.json")
+
+    scryfall_client = client.ScryfallClient(
+        client_session, retry_policy=retry.RetryPolicy(3, base_delay=0)
+    )
+    result = await scryfall_client.sets.get_set(set_code="cmm")
+    assert result.code == "cmm"
+
+
+async def test_client__retry_exhausted(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession"
+) -> None:
+    mock_aioresponse.get(SET_URL, status=502, repeat=True)
+
+    scryfall_client = client.ScryfallClient(
+        client_session, retry_policy=retry.RetryPolicy(2, base_delay=0)
+    )
+    with pytest.raises(UnparsedAPIError):
+        await scryfall_client.sets.get_set(set_code="cmm")
+    assert len(mock_aioresponse.requests[("GET", URL(SET_URL))]) == 2
@@ -0,0 +1,110 @@
+"""Tests for aioscryfall.store."""
+
+from typing import TYPE_CHECKING
+
+import aiofiles
+import pytest
+
+from aioscryfall import client, store
+from aioscryfall.models import serde
+from aioscryfall.models.bulk_data import ScryBulkData
+from aioscryfall.models.cards import ScryCard, ScryCardRarity
+from tests import utils
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aiohttp import ClientSession
+    from aioresponses import aioresponses
+
+
+def test_build_and_read(cards: list[ScryCard], tmp_path: "Path") -> None:
+    with store.CardStore.build(tmp_path / "store", cards) as card_store:
+        assert len(card_store) == 20
+        assert list(card_store) == cards
+        assert card_store[-1] == cards[-1]
+        assert card_store[2:4] == cards[2:4]
+        with pytest.raises(IndexError):
+            card_store[20]
+
+
+def test_values(cards: list[ScryCard], tmp_path: "Path") -> None:
+    with store.CardStore.build(tmp_path / "store", cards) as card_store:
+        assert list(card_store.values("name")) == [card.name for card in cards]
+        assert list(card_store.values("set_")) == [card.set_ for card in cards]
+        assert list(card_store.values("arena_id")) == [card.arena_id for card in cards]
+        assert ScryCardRarity.RARE in set(card_store.values("rarity"))
+
+
+def test_values__fixed_columns(cards: list[ScryCard], tmp_path: "Path") -> None:
+    with store.CardStore.build(tmp_path / "store", cards) as card_store:
+        for name in ["id_", "mtgo_foil_id", "cmc", "oracle_id", "content_warning", "foil"]:
+            assert list(card_store.values(name)) == [getattr(card, name) for card in cards]
+    assert (tmp_path / "store/mtgo_foil_id.fixed").stat().st_size == 8 * len(cards)
+    assert (tmp_path / "store/id_.fixed").stat().st_size == 16 * len(cards)
+
+
+def test_reopen(cards: list[ScryCard], tmp_path: "Path") -> None:
+    store.CardStore.build(tmp_path / "store", cards).close()
+    with store.CardStore(tmp_path / "store") as card_store:
+        assert list(card_store) == cards
+
+
+def test_writer__error(cards: list[ScryCard], tmp_path: "Path") -> None:
+    store.CardStore.build(tmp_path / "store", cards).close()
+
+    def interrupted_write() -> None:
+        with store.CardStoreWriter(tmp_path / "store") as writer:
+            for card in cards[:5]:
+                writer.append(card)
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        interrupted_write()
+    assert [path.name for path in tmp_path.iterdir()] == ["store"]
+    with store.CardStore(tmp_path / "store") as card_store:
+        assert list(card_store) == cards
+
+
+def test_writer__rebuild_open_store(cards: list[ScryCard], tmp_path: "Path") -> None:
+    with (
+        store.CardStore.build(tmp_path / "store", cards) as old_store,
+        store.CardStore.build(tmp_path / "store", cards[:5]) as new_store,
+    ):
+        assert old_store[3] == cards[3]
+        assert list(old_store) == cards
+        assert list(new_store) == cards[:5]
+    assert [path.name for path in tmp_path.iterdir()] == ["store"]
+
+
+def test_writer__not_a_store(tmp_path: "Path") -> None:
+    (tmp_path / "precious.txt").write_text("precious")
+    with pytest.raises(FileExistsError):
+        store.CardStoreWriter(tmp_path)
+    assert (tmp_path / "precious.txt").read_text() == "precious"
+
+
+def test_flush(cards: list[ScryCard], tmp_path: "Path", monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(store, "_FLUSH_ROWS", 3)
+    with store.CardStore.build(tmp_path / "store", cards) as card_store:
+        assert list(card_store) == cards
+
+
+async def test_from_bulk_data(
+    mock_aioresponse: "aioresponses", client_session: "ClientSession", tmp_path: "Path"
+) -> None:
+    await utils.load_get_payload(
+        mock_aioresponse,
+        "https://data.scryfall.io/oracle-cards/oracle-cards-20230404210321.json",
+        "bulk_data/contents.json",
+    )
+    async with aiofiles.open(utils.TEST_DATA_DIR / "bulk_data/single.json", "rb") as file:
+        bulk_data_item = serde.decode_json(await file.read(), ScryBulkData)
+
+    scryfall_client = client.ScryfallClient(client_session)
+    card_store = await store.CardStore.from_bulk_data(
+        scryfall_client, bulk_data_item, tmp_path / "store"
+    )
+    with card_store:
+        assert len(card_store) == 20
+        assert card_store[0].name == "Arctic Treeline"